@@ -9,8 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
 from litex_wrapper.ahb2axi_bridge_litex_wrapper import AHB2AXI4
 
 from migen import *
@@ -92,12 +90,13 @@ class AHB2AXI4Wrapper(Module):
         self.comb += platform.request("ahb_hresp").eq(ahb2axi4.ahb_hresp)
 
 # Build --------------------------------------------------------------------------------------------
-def main():
+def main(argv=None, params=None):
     parser = argparse.ArgumentParser(description="AHB_2_AXI4 CORE")
 
     # Import Common Modules.
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
-    sys.path.append(common_path)
+    if common_path not in sys.path:
+        sys.path.append(common_path)
 
     from common import IP_Builder
 
@@ -132,7 +131,7 @@ def main():
     json_group.add_argument("--json",                                    help="Generate Core from JSON File")
     json_group.add_argument("--json-template",  action="store_true",     help="Generate JSON Template")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
    #IP Details generation
     details =  {   "IP details": {
@@ -142,8 +141,8 @@ def main():
     'Description' : 'This bridge acts as a translator and mediator, facilitating seamless data transfer and control signal synchronization between devices or subsystems designed with AHB-based interfaces and those using AXI4-based interfaces.'}}
 
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version  = "v1_0")
 
     #IP Summary generation
@@ -158,11 +157,15 @@ def main():
 
     # Export JSON Template (Optional) --------------------------------------------------------------
     if args.json_template:
-        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
+        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary, args=args)
+        # Template only: no elaboration.
+        if not args.build:
+            return rs_builder.result(version="v1_0", summary=summary)
 
 
 
     # Create Wrapper -------------------------------------------------------------------------------
+    rs_builder.start_phase("elaboration")
     platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
     module   = AHB2AXI4Wrapper(platform,
         data_width = args.data_width,
@@ -182,41 +185,12 @@ def main():
         rs_builder.generate_wrapper(
             platform   = platform,
             module     = module,
-            version    = "v1_0"
+            params     = vars(args),
+            version    = "v1_0",
+            ip_type    = "A2HB"
         )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "ahb2axi_bridge", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"A2HB\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+    return rs_builder.result(version="v1_0", summary=summary)
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,6 @@
 # LiteX wrapper around Alex Forencich Verilog-AXI's axi_fifo.v
 
 import os
-import datetime
 import logging
 import math
 
@@ -16,12 +15,6 @@ from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 
 # AXI_FIFO ---------------------------------------------------------------------------------------
 class AXIASYNCFIFO(Module):
@@ -8,18 +8,12 @@
 # LiteX wrapper around Smartfox Data Solutions Inc. AXI_LITE_TEMP_SENSOR's AXI_LITE_TEMP_SENSOR.sv
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
 class AXILITETEMPSENSOR(Module):
     def __init__(self, platform, s_axil):
 
@@ -51,7 +45,6 @@ class AXILITETEMPSENSOR(Module):
         self.bready    = Signal(1)
 
 
-
         
         # Module instance.
         # ----------------
@@ -45,12 +45,13 @@ class BOOTCLOCKWrapper(Module):
         self.comb += platform.request("O").eq(boot_clock.O)
 
 # Build --------------------------------------------------------------------------------------------
-def main():
+def main(argv=None, params=None):
     parser = argparse.ArgumentParser(description="Boot CLock")
 
     # Import Common Modules.
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
-    sys.path.append(common_path)
+    if common_path not in sys.path:
+        sys.path.append(common_path)
 
     from common import IP_Builder
 
@@ -82,7 +83,7 @@ def main():
     json_group.add_argument("--json",                                           help="Generate Core from JSON File")
     json_group.add_argument("--json-template",  action="store_true",            help="Generate JSON Template")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     #IP Details generation
     details =  {"IP details": {
@@ -93,8 +94,8 @@ def main():
 
 
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version = "v1_0")
 
     #IP Summary generation
@@ -106,9 +107,13 @@ def main():
   }
     # Export JSON Template (Optional) --------------------------------------------------------------
     if args.json_template:
-        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict , summary=summary)
+        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict , summary=summary, args=args)
+        # Template only: no elaboration.
+        if not args.build:
+            return rs_builder.result(version="v1_0", summary=summary)
 
     # Create Wrapper -------------------------------------------------------------------------------
+    rs_builder.start_phase("elaboration")
     platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
     module   = BOOTCLOCKWrapper(platform,
         period = args.period,
@@ -126,8 +131,11 @@ def main():
         rs_builder.generate_wrapper(
             platform   = platform,
             module     = module,
+            params     = vars(args),
             version = "v1_0"
         )
 
+    return rs_builder.result(version="v1_0", summary=summary)
+
 if __name__ == "__main__":
     main()
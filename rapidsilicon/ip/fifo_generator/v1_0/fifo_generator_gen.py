@@ -9,10 +9,10 @@ import sys
 import logging
 import argparse
 from pathlib import Path
-from datetime import datetime
 import math
 
 from litex_wrapper.fifo_litex_generator import *
+from litex_wrapper.fifo_plan import WIDTH_CONVERTERS, max_depth, fifo_plan, lutram_plan
 
 from migen import *
 
@@ -20,27 +20,10 @@ from litex.build.generic_platform import *
 
 from litex.build.osfpga import OSFPGAPlatform
 
-# Making the read and write data widths into their own buses
-def divide_n_bit_numbers(number):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
 # IOs/Interfaces -----------------------------------------------------------------------------------
 
-def get_clkin_ios(data_width_write, data_width_read):
-    return [
+def get_clkin_ios(data_width_write, data_width_read, almost_flags=False):
+    ios = [
         ("clk",        0,  Pins(1)),
         ("rst",        0,  Pins(1)),
 		("wrt_clock",  0,  Pins(1)),
@@ -56,6 +39,13 @@ def get_clkin_ios(data_width_write, data_width_read):
         ("prog_full",  0,  Pins(1)),
         ("prog_empty", 0,  Pins(1))
     ]
+    # Look-ahead Almost Full/Empty (LUT-RAM FIFO).
+    if almost_flags:
+        ios += [
+            ("almost_full",  0, Pins(1)),
+            ("almost_empty", 0, Pins(1))
+        ]
+    return ios
 
 # Data Width Read Limitations ---------------------------------------------------------------------
 
@@ -85,61 +75,11 @@ def calculate_multiples(number, limit):
     return multiples
 
 
-# Checking the number of clocks for the output to appear -------------------------------------------
-def clock_cycles_to_obtain_desired_output(desired_output_size, max_output_per_block):
-    if(max_output_per_block < 36):
-        max_output_per_block = 36
-    if desired_output_size <= max_output_per_block:
-        # If the desired size can be obtained from a single block, return 1 clock cycle
-        return 1
-    else:
-        # Calculate the number of clock cycles required to obtain the desired size
-        return (desired_output_size + max_output_per_block - 1) // max_output_per_block
-    
-# Counting the total number of FIFOs used ---------------------------------------------------------
-def total_BRAM(data_width, depth):
-    remaining_memory = 0
-    num_18K = 0
-    num_36K = 0
-    num_9K = 0
-    while remaining_memory < data_width * depth:
-        for i, bus in enumerate(divide_n_bit_number(data_width, depth)):
-            if (len(bus) <= 9):
-                memory = 1024
-                remaining_memory = remaining_memory + (len(bus) * memory)
-                num_9K = num_9K + 1
-            elif (len(bus) <= 18):
-                memory = 1024
-                num_18K = num_18K + 1
-                remaining_memory = remaining_memory + (len(bus) * memory)
-            elif (len(bus) <= 36):
-                memory = 1024
-                num_36K = num_36K + 1
-                remaining_memory = remaining_memory + (len(bus) * memory)
-    return(num_36K + num_18K/2 + num_9K/4)
-
-# Making the read and write data widths into their own buses
-def divide_n_bit_number(number, depth):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18 and depth > 1024):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
 # FIFO Generator ----------------------------------------------------------------------------------
 class FIFOGenerator(Module):
-    def __init__(self, platform, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo):
+    def __init__(self, platform, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo, output_register, width_converter):
         # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios(data_width_write, data_width_read))
+        platform.add_extension(get_clkin_ios(data_width_write, data_width_read, almost_flags=not builtin_fifo))
         self.clock_domains.cd_sys  = ClockDomain()
         self.clock_domains.cd_wrt	= ClockDomain()
         self.clock_domains.cd_rd	= ClockDomain()
@@ -149,7 +89,7 @@ class FIFOGenerator(Module):
             False   :   "ASYNCHRONOUS"
         }
 	
-        self.submodules.fifo = fifo = FIFO(data_width_write, data_width_read, SYNCHRONOUS[synchronous], full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo)
+        self.submodules.fifo = fifo = FIFO(data_width_write, data_width_read, SYNCHRONOUS[synchronous], full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo, output_register, width_converter)
     
         self.comb += fifo.din.eq(platform.request("din"))
         self.comb += platform.request("dout").eq(fifo.dout)
@@ -169,14 +109,18 @@ class FIFOGenerator(Module):
         self.comb += platform.request("empty").eq(fifo.empty)
         self.comb += platform.request("underflow").eq(fifo.underflow)
         self.comb += platform.request("overflow").eq(fifo.overflow)        
+        if (not builtin_fifo):
+            self.comb += platform.request("almost_full").eq(fifo.almost_full)
+            self.comb += platform.request("almost_empty").eq(fifo.almost_empty)
             
 # Build --------------------------------------------------------------------------------------------
-def main():
+def main(argv=None, params=None):
     parser = argparse.ArgumentParser(description="FIFO")
 
     # Import Common Modules.
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
-    sys.path.append(common_path)
+    if common_path not in sys.path:
+        sys.path.append(common_path)
 
     from common import IP_Builder
 
@@ -203,7 +147,7 @@ def main():
 
     # Core fix value parameters.
     core_fix_param_group.add_argument("--data_width_read",  type=int,   default=36,  	choices=[i for i in range(1, 1025)],   help="FIFO Read Width")
-    core_fix_param_group.add_argument("--DEPTH",            type=int,   default=1024,   choices=[2**i for i in range(2, 20) if 2**i <= 523264],   help="FIFO Depth")
+    core_range_param_group.add_argument("--DEPTH",          type=int,   default=1024,   choices=range(4, 262145),   help="FIFO Depth")
 
     # Core bool value parameters.
     core_bool_param_group = parser.add_argument_group(title="Core bool parameters")
@@ -213,6 +157,11 @@ def main():
     core_bool_param_group.add_argument("--empty_threshold",         type=bool,   default=False,   help="Empty Threshold")
     core_bool_param_group.add_argument("--builtin_fifo",            type=bool,   default=True,    help="Built-in FIFO or Distributed RAM")
     core_bool_param_group.add_argument("--asymmetric",              type=bool,   default=False,   help="Asymmetric Data Widths for Read and Write ports.")
+    core_bool_param_group.add_argument("--output_register",         type=bool,   default=False,   help="Distributed RAM Output Register (First Word Fall Through/Asynchronous)")
+
+    # Core string value parameters.
+    core_string_param_group = parser.add_argument_group(title="Core string parameters")
+    core_string_param_group.add_argument("--width_converter",       type=str,    default="serial", choices=WIDTH_CONVERTERS, help="Read Width Conversion (serial: read word over several cycles, pipelined: one read word per cycle)")
 
     # Build Parameters.
     build_group = parser.add_argument_group(title="Build parameters")
@@ -225,7 +174,7 @@ def main():
     json_group.add_argument("--json",                                   help="Generate Core from JSON File")
     json_group.add_argument("--json-template",  action="store_true",    help="Generate JSON Template")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if (args.builtin_fifo == False and args.synchronous == False):
         depth = args.DEPTH
@@ -233,44 +182,16 @@ def main():
         depth = args.depth
         
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         if (args.asymmetric):
             data_width_read  = args.data_width_read
             data_width_write = args.data_width_write
         else:
             data_width_read  = args.data_width
             data_width_write = args.data_width
-        buses_write = divide_n_bit_numbers(data_width_write)
-        remaining_memory = 0
-        prev_rem = 0
-        num_9K = 0
-        num_18K = 0
-        total_mem = 0
-        while total_BRAM(data_width_write, remaining_memory/data_width_write) < 128:
-            for i, bus in enumerate(buses_write):
-                if (len(bus) <= 9):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    num_9K = num_9K + 1
-                    if (num_9K == 4):
-                        total_mem = total_mem + 1
-                        num_9K = 0
-                elif (len(bus) <= 18):
-                    memory = 1024
-                    num_18K = num_18K + 1
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    if (num_18K == 2):
-                        total_mem = total_mem + 1
-                        num_18K = 0
-                elif (len(bus) <= 36):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    total_mem = total_mem + 1
-                if (total_BRAM(data_width_write, remaining_memory/data_width_write) < 128):
-                    prev_rem = remaining_memory
-                else:
-                    prev_rem = prev_rem
+        # Largest depth fitting in the device BRAMs.
+        fifo_max_depth = max_depth(data_width_write)
             
     details =  {   "IP details": {
     'Name' : 'FIFO Generator',
@@ -280,8 +201,8 @@ def main():
     }
 
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version = "v1_0")
         file_path = os.path.dirname(os.path.realpath(__file__))
         rs_builder.copy_images(file_path)
@@ -302,6 +223,14 @@ def main():
             dep_dict.update({
                 'builtin_fifo'    :   'True'
             })
+        if (args.asymmetric == False or args.data_width_read <= args.data_width_write):
+            dep_dict.update({
+                'width_converter' : 'True'
+            })
+        if (args.builtin_fifo == True or (args.synchronous == True and args.first_word_fall_through == False)):
+            dep_dict.update({
+                'output_register' : 'True'
+            })
         if (args.builtin_fifo == False):
             args.asymmetric = False
         if (args.builtin_fifo == False and args.synchronous == False):
@@ -313,7 +242,7 @@ def main():
                 option_strings_to_remove = ['--data_width']
                 parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
                 if (math.ceil(math.log2(args.depth)) != math.floor(math.log2(args.depth))):
-                    parser._actions[5].default = 2 ** round(math.log2(args.depth))
+                    parser._actions[5].default = args.depth
                 parser._actions[2].choices = range(2, args.DEPTH)
                 parser._actions[3].choices = range(1, args.DEPTH)
                 if (args.full_value >= args.DEPTH):
@@ -328,14 +257,14 @@ def main():
                 option_strings_to_remove = ['--data_width_write']
                 parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
                 if (math.ceil(math.log2(args.depth)) != math.floor(math.log2(args.depth))):
-                    parser._actions[4].default = 2 ** round(math.log2(args.depth))
+                    parser._actions[4].default = args.depth
                 parser._actions[2].choices = range(2, args.DEPTH)
                 parser._actions[3].choices = range(1, args.DEPTH)
                 if (args.full_value >= args.DEPTH):
                     parser._actions[2].default = args.DEPTH - 1
                 if (args.empty_value >= args.DEPTH):    
                     parser._actions[3].default = 1
-                parser._actions[4].choices = [4 * (2 ** i) for i in range(int(math.log2(remaining_memory/args.data_width) - 1))]
+                parser._actions[4].choices = range(4, fifo_max_depth + 1)
         else:
             if (args.asymmetric):
                 option_strings_to_remove = ['--data_width']
@@ -360,7 +289,7 @@ def main():
                     parser._actions[3].default = 1
                 parser._actions[5].choices = factors_multiples(args.data_width_write)
                 parser._actions[5].default = args.data_width_write
-                parser._actions[4].choices = [16 * 2**i for i in range(0, 120) if 16 * 2**i <= int(prev_rem/args.data_width_write)]
+                parser._actions[4].choices = [16 * 2**i for i in range(0, 120) if 16 * 2**i <= fifo_max_depth]
             else:
                 option_strings_to_remove = ['--data_width_read']
                 parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
@@ -372,9 +301,9 @@ def main():
                     parser._actions[2].default = args.depth - 1
                 if (args.empty_value >= args.depth):    
                     parser._actions[3].default = 1
-                parser._actions[4].choices = range(2, int(prev_rem/args.data_width) + 1)
+                parser._actions[4].choices = range(2, fifo_max_depth + 1)
         
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
 
     if (args.builtin_fifo == False and args.synchronous == False):
         depth = args.DEPTH
@@ -392,9 +321,11 @@ def main():
         summary["Data Width Write"] = args.data_width_write
         summary["Data Width Read"] = args.data_width_read
         if (args.data_width_read > args.data_width_write):
-            summary["Read Latency (clock cycles)"] = clock_cycles_to_obtain_desired_output(args.data_width_read, args.data_width_write)
             depth = args.write_depth
-            summary["Read Depth"] = int(depth/clock_cycles_to_obtain_desired_output(args.data_width_read, args.data_width_write) if (clock_cycles_to_obtain_desired_output(args.data_width_read, args.data_width_write)) > 1 else depth/(args.data_width_read/args.data_width_write))
+            plan  = fifo_plan(args.data_width_write, args.data_width_read, depth, width_converter=args.width_converter)
+            summary["Read Latency (clock cycles)"] = plan.read_cycles
+            summary["Read Depth"] = int(depth/plan.clocks_for_output if plan.read_cycles > 1 else depth/(args.data_width_read/args.data_width_write))
+            summary["Read Throughput"] = "1 word per clock cycle" if plan.read_cycles == 1 else "1 word every %s clock cycles" % plan.read_cycles
         else:
             depth = args.write_depth
             summary["Read Latency (clock cycles)"] = "1"
@@ -409,10 +340,15 @@ def main():
         summary["FIFO Mode"] = "Standard"
     if (args.builtin_fifo):
         if (args.asymmetric):
-            data_width_write = args.data_width_write
+            plan = fifo_plan(args.data_width_write, args.data_width_read, depth, width_converter=args.width_converter)
         else:
-            data_width_write = args.data_width
-        summary["Count of FIFOs"] = math.ceil(total_BRAM(data_width_write, depth) * 2) / 2
+            plan = fifo_plan(args.data_width, args.data_width, depth)
+        summary["Count of FIFOs"] = plan.brams
+    else:
+        plan = lutram_plan(args.data_width, depth, args.synchronous, args.first_word_fall_through, args.output_register)
+        summary["LUT-RAM Resources"] = plan.description
+        if (plan.output_register):
+            summary["Output Register"] = "Enabled"
     if (args.empty_threshold):
         summary["Programmable Empty"] = "Programmble Empty will be asserted at data count %s" % args.empty_value
     if (args.full_threshold):
@@ -420,7 +356,10 @@ def main():
     
     # Export JSON Template (Optional) --------------------------------------------------------------
     if args.json_template:
-        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
+        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary, args=args)
+        # Template only: no elaboration.
+        if not args.build:
+            return rs_builder.result(version="v1_0", summary=summary)
 
 
     if (args.asymmetric):
@@ -431,19 +370,26 @@ def main():
         data_width_write = args.data_width
 
     # Create Generator -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = FIFOGenerator(platform,
-        data_width_read   				= data_width_read,
-        data_width_write                = data_width_write,
-        synchronous     				= args.synchronous,
-        full_threshold  				= args.full_threshold,
-        empty_threshold 				= args.empty_threshold,
-        depth           				= depth,
-        full_value                      = args.full_value,
-        empty_value                     = args.empty_value,
-        first_word_fall_through         = args.first_word_fall_through,
-        builtin_fifo                    = args.builtin_fifo
-    )
+    rs_builder.start_phase("elaboration")
+    # Pre-generated wrapper (common configurations) or output cache hit: no elaboration.
+    platform = module = None
+    if not (args.build and (rs_builder.library_lookup(gen_path=os.path.dirname(__file__), version="v1_0", params=vars(args)) or
+                            rs_builder.cache_lookup(gen_path=os.path.dirname(__file__), version="v1_0", params=vars(args)))):
+        platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+        module   = FIFOGenerator(platform,
+            data_width_read   				= data_width_read,
+            data_width_write                = data_width_write,
+            synchronous     				= args.synchronous,
+            full_threshold  				= args.full_threshold,
+            empty_threshold 				= args.empty_threshold,
+            depth           				= depth,
+            full_value                      = args.full_value,
+            empty_value                     = args.empty_value,
+            first_word_fall_through         = args.first_word_fall_through,
+            builtin_fifo                    = args.builtin_fifo,
+            output_register                 = args.output_register,
+            width_converter                 = args.width_converter
+        )
 
     # Build Project --------------------------------------------------------------------------------
     if args.build:
@@ -457,52 +403,13 @@ def main():
         rs_builder.generate_wrapper(
             platform   = platform,
             module     = module,
-            version     = "v1_0"
+            params     = vars(args),
+            version     = "v1_0",
+            ip_type     = "FIFO",
+            # DEPTH localparam after the ports declaration.
+            replace     = [(");", ");\n\nlocalparam DEPTH = {};\n".format(depth))]
         )
 
-        # IP_ID Parameter
-        now = datetime.datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "fifo_generator", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"FIFO\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
-
-        with open(wrapper, "r") as file:
-            file_content = file.read()
-        pos = file_content.find(");")
-        if pos != -1:
-            updated_content = file_content[:pos + 2] + "\n\nlocalparam DEPTH = {};".format(depth) + file_content[pos + 2:]
-
-            # Write the updated content back to the file
-            with open(os.path.join(wrapper), "w") as file:
-                file.write(updated_content)
-        
         build_name = args.build_name.rsplit( ".", 1 )[ 0 ]
         file = os.path.join(args.build_dir, "rapidsilicon/ip/fifo_generator/v1_0", build_name, "sim/testbench.v")
         file = Path(file)
@@ -538,6 +445,8 @@ def main():
             text = text.replace("== 0", "<= 1")
             file.write_text(text)
 
+    return rs_builder.result(version="v1_0", summary=summary)
+
 if __name__ == "__main__":
     main()
     
@@ -6,52 +6,15 @@
 # SPDX-License-Identifier: MIT
 #
 
-import datetime
 import logging
 import math
-from migen.genlib.fifo import SyncFIFO, AsyncFIFOBuffered
 from migen import *
 
+from litex_wrapper.fifo_plan import fifo_plan
+from litex_wrapper.gray_code import BinaryToGray, GrayToBinary
+from litex_wrapper.lutram_fifo import LUTRAMSyncFIFO, LUTRAMAsyncFIFO
+from litex_wrapper.width_converter import UpConverter
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
-# Making the read and write data widths into their own buses
-def divide_n_bit_number(number, depth):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18 and depth > 1024):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
-# Making the read and write data widths into their own buses no depth
-def divide_n_bit_number_no_depth(number):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
 
 # Checking the bit length for a certain decimal number
 def decimal_to_binary(decimal_number):
@@ -59,19 +22,9 @@ def decimal_to_binary(decimal_number):
     binary_length = len(binary_string)
     return binary_length
 
-# Checking the number of clocks for the output to appear
-def clock_cycles_to_obtain_desired_output(desired_output_size):
-    max_output_per_block = 36
-    if desired_output_size <= max_output_per_block:
-        # If the desired size can be obtained from a single block, return 1 clock cycle
-        return 1
-    else:
-        # Calculate the number of clock cycles required to obtain the desired size
-        return (desired_output_size + max_output_per_block - 1) // max_output_per_block
-
 # FIFO Generator ---------------------------------------------------------------------------------------
 class FIFO(Module):
-    def __init__(self, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo):
+    def __init__(self, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo, output_register=False, width_converter="serial"):
         SYNCHRONOUS = {
             "SYNCHRONOUS"  :   True,
             "ASYNCHRONOUS" :   False
@@ -92,97 +45,58 @@ class FIFO(Module):
         self.logger.info(f"DEPTH    : {depth}")
         self.logger.info(f"===================================================")
 
-        buses_write = divide_n_bit_number(data_width_write, depth)
-        buses_write_og = buses_write
-        buses_read = divide_n_bit_number_no_depth(data_width_read)
-        buses_read_og = buses_read
-        data_36_write = sum(1 for item in buses_write if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
-        data_36_read = sum(1 for item in buses_read if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
-        # Check which list is shorter
-        if len(buses_write) < len(buses_read):
-            repeat_count = len(buses_read) // len(buses_write)
-            buses_write = buses_write * repeat_count + buses_write[:len(buses_read) % len(buses_write)]
-        else:
-            repeat_count = len(buses_write) // len(buses_read)
-            buses_read = buses_read * repeat_count + buses_read[:len(buses_write) % len(buses_read)]
-        write_div_read = int(data_width_write/data_width_read)/len(buses_write)
-        write_div_read = decimal_to_binary(int(write_div_read))
-        size_bram = 36864
-        # print(buses_write_og)
-        # print(buses_read_og)
-        data_36 = sum(1 for item in buses_write if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
-        total_mem = math.ceil((data_width_write * depth) / size_bram)
-        remaining_memory = 0
-        depth_mem = 18432
-        num_9K = 0
-        num_18K = 0
-        num_36K = 0
+        # FIFO plan (lanes, primitives, pointers), shared with the generator summary.
+        plan = fifo_plan(data_width_write, data_width_read, depth, width_converter)
+        if (plan.width_converter == "pipelined"):
+            self.add_width_converter(plan, synchronous, full_threshold, empty_threshold, first_word_fall_through, empty_value, full_value, builtin_fifo)
+            return
+        buses_write_og    = plan.lanes_write
+        buses_read_og     = plan.lanes_read
+        buses_write       = plan.buses_write
+        buses_read        = plan.buses_read
+        repeat_count      = plan.repeat_count
+        write_div_read    = plan.write_div_read
+        data_36_write     = plan.data_36_write
+        data_36           = plan.data_36
+        num_9K            = plan.num_9K
+        num_18K           = plan.num_18K
+        num_36K           = plan.num_36K
+        total_mem         = plan.total_mem
+        primitives        = plan.primitives
+        clocks_for_output = plan.clocks_for_output
         old_count18K_read = 0
         one_time = 1
         self.prev_empty = Signal()
         old_count9K_read = 0
         if (data_width_write < data_width_read):
-            clocks_for_output = int(clock_cycles_to_obtain_desired_output(data_width_read)/len(buses_write_og))
             clocks_for_output_bin = decimal_to_binary(clocks_for_output)
             self.rden_int_count = Signal(int(clocks_for_output))
             self.din_count = Signal(int(clocks_for_output))
-        else:
-            clocks_for_output = 1
-        while remaining_memory < data_width_write * depth:
-            for i, bus_write in enumerate(buses_write_og):
-                # if (remaining_memory < data_width * depth):
-                if (len(bus_write) <= 9):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-                    num_9K = num_9K + 1
-                elif (len(bus_write) <= 18):
-                    memory = 1024
-                    num_18K = num_18K + 1
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-                elif (len(bus_write) <= 36):
-                    memory = 1024
-                    num_36K = num_36K + 1
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-        total_mem = num_36K + math.ceil(num_18K/2) + math.ceil(num_9K/4)
-        # print(num_36K, math.ceil(num_18K/2), math.ceil(num_9K/4), total_mem)
         memory = 1024
-        instances = math.ceil(depth / memory)
         if(SYNCHRONOUS[synchronous]):
-            if (data_width_write >= data_width_read):
-                self.counter = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 1, reset=0)
-                self.rd_ptr = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 1, reset=0)
-            else:
-                self.counter = Signal(math.ceil(math.log2(depth)) + 1, reset=0)
-                self.rd_ptr = Signal(math.ceil(math.log2(depth)) + 1, reset=0)
-            self.wrt_ptr = Signal(math.ceil(math.log2(depth)) + 1, reset=0)
+            self.counter = Signal(plan.addr_width_read + 1, reset=0)
+            self.rd_ptr = Signal(plan.addr_width_read + 1, reset=0)
+            self.wrt_ptr = Signal(plan.addr_width_write + 1, reset=0)
             
         else:
-            starting = ((2**(math.ceil(math.log2(depth)))/2) - depth/2) 
+            starting = ((2**(plan.addr_width_write)/2) - depth/2) 
             if (data_width_write >= data_width_read):
-                self.rd_ptr = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=int(starting))
-                ending = ((2**(math.ceil(math.log2((data_width_write/data_width_read)*depth)))/2) + ((data_width_write/data_width_read)*depth)/2 - 1) 
+                ending = ((2**(plan.addr_width_read)/2) + ((data_width_write/data_width_read)*depth)/2 - 1) 
             else:
-                ending = ((2**(math.ceil(math.log2(depth)))/2) + (depth)/2 - 1) 
-                self.rd_ptr = Signal(math.ceil(math.log2(depth)) + 2, reset=int(starting))
-            self.wrt_ptr = Signal(math.ceil(math.log2(depth)) + 2, reset=int(starting))
+                ending = ((2**(plan.addr_width_write)/2) + (depth)/2 - 1) 
+            self.rd_ptr = Signal(plan.addr_width_read + 2, reset=int(starting))
+            self.wrt_ptr = Signal(plan.addr_width_write + 2, reset=int(starting))
 
         if (not SYNCHRONOUS[synchronous]):
-            self.wrt_ptr_rd_clk1 = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-            self.wrt_ptr_rd_clk2 = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-            if (data_width_write >= data_width_read):
-                self.rd_ptr_wrt_clk1 = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=0)
-                self.rd_ptr_wrt_clk2 = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=0)
-                self.gray_encoded_rdptr = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=0)
-                self.sync_wrtclk_rdptr_binary = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=0)
-                self.rd_ptr_reg = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 2, reset=0)
-            else:
-                self.rd_ptr_wrt_clk1 = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-                self.rd_ptr_wrt_clk2 = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-                self.gray_encoded_rdptr = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-                self.sync_wrtclk_rdptr_binary = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-                self.rd_ptr_reg = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-            self.gray_encoded_wrtptr = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
-            self.sync_rdclk_wrtptr_binary = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
+            self.wrt_ptr_rd_clk1 = Signal(plan.addr_width_write + 2, reset=0)
+            self.wrt_ptr_rd_clk2 = Signal(plan.addr_width_write + 2, reset=0)
+            self.rd_ptr_wrt_clk1 = Signal(plan.addr_width_read + 2, reset=0)
+            self.rd_ptr_wrt_clk2 = Signal(plan.addr_width_read + 2, reset=0)
+            self.gray_encoded_rdptr = Signal(plan.addr_width_read + 2, reset=0)
+            self.sync_wrtclk_rdptr_binary = Signal(plan.addr_width_read + 2, reset=0)
+            self.rd_ptr_reg = Signal(plan.addr_width_read + 2, reset=0)
+            self.gray_encoded_wrtptr = Signal(plan.addr_width_write + 2, reset=0)
+            self.sync_rdclk_wrtptr_binary = Signal(plan.addr_width_write + 2, reset=0)
             self.rd_en_flop = Signal()
             self.rd_en_flop1 = Signal()
             self.comb += ResetSignal("wrt").eq(ResetSignal("sys"))
@@ -191,7 +105,7 @@ class FIFO(Module):
                 self.empty_count = Signal(2)
             else:
                 self.empty_count = Signal(math.ceil(math.log2(clocks_for_output)) + 1, reset=0)
-            self.wrt_ptr_reg = Signal(math.ceil(math.log2(depth)) + 2, reset=0)
+            self.wrt_ptr_reg = Signal(plan.addr_width_write + 2, reset=0)
 
         self.din    = Signal(data_width_write)
         self.dout   = Signal(data_width_read)
@@ -249,10 +163,7 @@ class FIFO(Module):
             k9_flag_read = 0
             k18_flag = 0
             k18_flag_read = 0
-            if (data_width_write >= data_width_read):
-                depth_read = (data_width_write/data_width_read)*depth
-            else:
-                depth_read = depth/clocks_for_output
+            depth_read = plan.depth_read
             for k in range(total_mem * 2):
                 self.rden_int[k]           = Signal(name=f"rden_int_{k}")
                 self.wren_int[k]           = Signal(name=f"wren_int_{k}")
@@ -271,27 +182,27 @@ class FIFO(Module):
                 j_read = 0
                 for i, (bus_write, bus_read) in enumerate(zip(buses_write, buses_read)):
                     # if (mem < total_mem):
-                        if (len(bus_write) <= 9):
+                        if (bus_write <= 9):
                             data_write = 9
                             memory = 2048
                             k9_flag = 1
-                        elif (len(bus_write) <= 18):
+                        elif (bus_write <= 18):
                             data_write = 18
                             memory = 1024
                             k18_flag = 1
-                        elif (len(bus_write) <= 36):
+                        elif (bus_write <= 36):
                             data_write = 36
                             memory = 1024
                             k36_flag = 1
-                        if (len(bus_read) <= 9):
+                        if (bus_read <= 9):
                             data_read = 9
                             # memory = 2048
                             k9_flag_read = 1
-                        elif (len(bus_read) <= 18):
+                        elif (bus_read <= 18):
                             data_read = 18
                             # memory = 1024
                             k18_flag_read = 1
-                        elif (len(bus_read) <= 36):
+                        elif (bus_read <= 36):
                             data_read = 36
                             # memory = 1024
                             k36_flag = 1
@@ -304,7 +215,7 @@ class FIFO(Module):
                         # ----------------
                         if(SYNCHRONOUS[synchronous]):
                             if (total_mem == 1):
-                                if (instance == "FIFO36K" and count < total_mem):
+                                if (instance == "FIFO36K" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -340,7 +251,7 @@ class FIFO(Module):
                                     )
                                     count = count + 1
                                     mem = mem + 1
-                                elif(instance == "FIFO18KX2" and count < total_mem):
+                                elif(instance == "FIFO18KX2" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -441,7 +352,7 @@ class FIFO(Module):
                                     count = count + 2
                                     mem = mem + 1
                             else:
-                                if (instance == "FIFO36K" and (data_read == 36 or data_write == 36) and (count_36K < num_36K or mem < total_mem)):
+                                if (instance == "FIFO36K" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -478,7 +389,7 @@ class FIFO(Module):
                                     count_36K = count_36K + 1
                                     count = count + 1
                                     mem = mem + 1
-                                elif(instance == "FIFO18KX2" and mem < total_mem and ((((k % (instances/(instances/2)) == 1 and (data_write == 18 or data_read == 18) and count18K < (num_18K/2)) or (k + 2 == total_mem) or (k % (instances/(instances/4)) == 1 and (data_write == 9 or data_read == 9) and count9K < (num_9K/4)) or (not k36_flag and (data_write == 9 or data_read == 9) and count9K < num_9K/4) or (not k36_flag and (data_write == 18 or data_read == 18) and count18K < num_18K/2))))):
+                                elif(instance == "FIFO18KX2" and (k, i) in primitives):
                                     index_array.append(count)
                                     index_array.append(count + 1)
                                     self.specials += Instance(instance,
@@ -774,7 +685,7 @@ class FIFO(Module):
                                 old_count9K_read = count9K_read
                         else:
                             if (total_mem == 1):
-                                if (instance == "FIFO36K" and count < total_mem):
+                                if (instance == "FIFO36K" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -810,7 +721,7 @@ class FIFO(Module):
                                     )
                                     count = count + 1
                                     mem = mem + 1
-                                elif(instance == "FIFO18KX2" and count < total_mem):
+                                elif(instance == "FIFO18KX2" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -947,7 +858,7 @@ class FIFO(Module):
                                     count = count + 2
                                     mem = mem + 1
                             else:
-                                if (instance == "FIFO36K" and (data_read == 36 or data_write == 36) and (count_36K < num_36K or mem < total_mem)):
+                                if (instance == "FIFO36K" and (k, i) in primitives):
                                     self.specials += Instance(instance,
                                         # Parameters.
                                         # -----------
@@ -984,7 +895,7 @@ class FIFO(Module):
                                     count = count + 1
                                     mem = mem + 1
                                     count_36K = count_36K + 1
-                                elif(instance == "FIFO18KX2" and mem < total_mem and ((((k % (instances/(instances/2)) == 1 and (data_write == 18 or data_read == 18) and count18K < (num_18K/2)) or (k + 2 == total_mem) or (k % (instances/(instances/4)) == 1 and (data_write == 9 or data_read == 9) and count9K < (num_9K/4)) or (not k36_flag and (data_write == 9 or data_read == 9) and count9K < num_9K/4) or (not k36_flag and (data_write == 18 or data_read == 18) and count18K < num_18K/2))))):
+                                elif(instance == "FIFO18KX2" and (k, i) in primitives):
                                     index_array.append(count)
                                     index_array.append(count + 1)
                                     self.specials += Instance(instance,
@@ -1727,8 +1638,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(self.rden,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                  If(self.rd_ptr_minus[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                     If(self.rd_ptr_minus[int(write_div_read) - 1] == toggle,
                                                                        self.rden_int[i].eq(1),
@@ -1749,8 +1660,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(self.rden,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                  If(self.rd_ptr_minus[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                     If(self.rd_ptr_minus[int(write_div_read) - 1] == toggle,
                                                                        self.rden_int[i].eq(1),
@@ -1774,8 +1685,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(self.rden,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                     self.rden_int[i].eq(1),
                                                                     self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                               )
@@ -1787,8 +1698,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(self.rden,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                            If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                              If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                     self.rden_int[i].eq(1),
                                                                     self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                 )
@@ -1800,8 +1711,8 @@ class FIFO(Module):
                                         self.comb += [
                                             If(self.rden,
                                                If(~self.underflow,
-                                                    If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                      If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                    If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                      If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                             self.rden_int[i].eq(1),
                                                             self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                         )
@@ -1816,8 +1727,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(~self.rden,
                                                        If(~self.empty_int[i],
-                                                          If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                            If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                          If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                            If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                 self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                             )
                                                           )
@@ -1830,8 +1741,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                        If(self.rd_ptr_minus[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == (toggle_2x - 1 if (i - 1) % 2 == 0 else toggle_2x),
                                                                         If(self.rd_ptr_minus[int(write_div_read) - 1] == 1 - toggle,
                                                                          self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -1846,8 +1757,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                        If(self.rd_ptr_minus[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == ((1 - toggle) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1) == 0 and (36 + (36*l)) == data_width_read) else (toggle_2x - 1) if (count_loop % ((data_width_read/36) * 2) == 0) else toggle_2x),
                                                                         If(self.rd_ptr_minus[int(write_div_read) - 1] == (1 - toggle if data_width_read == (36 + (36*l)) else toggle),
                                                                          self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -1863,8 +1774,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                   )
@@ -1875,8 +1786,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                                    If(self.rd_ptr >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                         self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                   )
@@ -1923,8 +1834,8 @@ class FIFO(Module):
                                                 self.comb += [
                                                     If(~self.rden,
                                                        If(~self.empty_int[i],
-                                                          If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                            If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                          If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                            If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                  self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                             )
                                                        )
@@ -1937,8 +1848,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                        If(self.rd_ptr_minus[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == (toggle_2x - 1 if (i - 1) % 2 == 0 else toggle_2x),
                                                                             If(self.rd_ptr_minus[int(write_div_read) - 1] == 1 - toggle,
                                                                               self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -1953,8 +1864,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
-                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
+                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])),
                                                                        If(self.rd_ptr_minus[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == ((1 - toggle) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1) == 0 and (36 + (36*l)) == data_width_read) else (toggle_2x - 1) if (count_loop % ((data_width_read/36) * 2) == 0) else toggle_2x),
                                                                             If(self.rd_ptr_minus[int(write_div_read) - 1] == (1 - toggle if data_width_read == (36 + (36*l)) else toggle),
                                                                               self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -1970,8 +1881,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                          self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                )
@@ -1982,8 +1893,8 @@ class FIFO(Module):
                                                         self.comb += [
                                                             If(~self.rden,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
-                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output),
+                                                                  If(self.rd_ptr <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
+                                                                    If(self.rd_ptr > int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output),
                                                                          self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                )
@@ -1997,8 +1908,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                     If(self.rden,
                                                        If(~self.empty,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                     self.rden_int[i].eq(1)
                                                             )
                                                             .Else(
@@ -2022,8 +1933,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                          If(self.rd_ptr_add[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                             If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                                self.rden_int[i].eq(1)
@@ -2053,8 +1964,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                          If(self.rd_ptr_add[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                             If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                                self.rden_int[i].eq(1)
@@ -2085,8 +1996,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                     If(self.rden,
                                                        If(~self.empty,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting) - 1,
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting) - 1,
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                     self.rden_int[i].eq(1)
                                                             )
                                                             .Else(
@@ -2109,8 +2020,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                 If(self.rden,
                                                    If(~self.empty,
-                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                 self.rden_int[i].eq(1)
                                                         )
                                                         .Else(
@@ -2134,8 +2045,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                          If(self.rd_ptr_add[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                          If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                             self.rden_int[i].eq(1)
@@ -2165,8 +2076,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                          If(self.rd_ptr_add[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                          If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                             self.rden_int[i].eq(1)
@@ -2196,8 +2107,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                     If(self.rden,
                                                        If(~self.empty,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting) - 1,
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting) - 1,
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting) - 1,
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting) - 1,
                                                                     self.rden_int[i].eq(1)
                                                             )
                                                             .Else(
@@ -2221,8 +2132,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                      If(self.rd_ptr[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                         If(self.rd_ptr[int(write_div_read) - 1] == toggle,
                                                                            self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -2242,8 +2153,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                      If(self.rd_ptr[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                         If(self.rd_ptr[int(write_div_read) - 1] == toggle,
                                                                            self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -2266,8 +2177,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                 )
                                                               )
@@ -2278,8 +2189,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                 )
                                                               )
@@ -2290,8 +2201,8 @@ class FIFO(Module):
                                             self.sync.rd += [
                                                 If(self.rd_en_flop1,
                                                    If(~self.underflow,
-                                                        If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                        If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                 self.dout[(36*l):36 + (36*l)].eq(self.dout_int[i])
                                                         )
                                                       )
@@ -2304,8 +2215,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                     If(self.rden,
                                                        If(~self.empty,
-                                                            If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                            If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                     self.rden_int[i].eq(1)
                                                             )
                                                             .Else(
@@ -2332,8 +2243,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                         If(self.rden,
                                                            If(~self.empty,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                      If(self.rd_ptr_add[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                      If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                         self.rden_int[i].eq(1)
@@ -2373,8 +2284,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                         If(self.rden,
                                                            If(~self.empty,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                      If(self.rd_ptr_add[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                      If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                         self.rden_int[i].eq(1)
@@ -2414,8 +2325,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rden,
                                                            If(~self.empty,
-                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.rden_int[i].eq(1)
                                                                 )
                                                                 .Else(
@@ -2441,8 +2352,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                 If(self.rden,
                                                    If(~self.empty,
-                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                 self.rden_int[i].eq(1)
                                                         )
                                                         .Else(
@@ -2467,8 +2378,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                          If(self.rd_ptr_add[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                             If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                                self.rden_int[i].eq(1)
@@ -2499,8 +2410,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(self.rden,
                                                                If(~self.empty,
-                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
-                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting) - 1,
+                                                                    If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
+                                                                      If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting) - 1,
                                                                          If(self.rd_ptr_add[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                             If(self.rd_ptr_add[int(write_div_read) - 1] == toggle,
                                                                                self.rden_int[i].eq(1)
@@ -2531,8 +2442,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                     If(self.rden,
                                                        If(~self.empty,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting) - 1,
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting) - 1,
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting) - 1,
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting) - 1,
                                                                     self.rden_int[i].eq(1)
                                                             )
                                                             .Else(
@@ -2555,8 +2466,8 @@ class FIFO(Module):
                                             self.sync.rd += [
                                                 If(self.rd_en_flop1,
                                                    If(~self.underflow,
-                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                        If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                          If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                 self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                         )
                                                       )
@@ -2569,8 +2480,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                     If(self.rd_en_flop1,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                  If(self.rd_ptr[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == toggle_2x,
                                                                     If(self.rd_ptr[int(write_div_read) - 1] == toggle,
                                                                        self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -2590,8 +2501,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                     If(self.rd_en_flop1,
                                                        If(~self.underflow,
-                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                            If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                              If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                  If(self.rd_ptr[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == toggle_2x,
                                                                     If(self.rd_ptr[int(write_div_read) - 1] == toggle,
                                                                        self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -2614,8 +2525,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                      )
                                                                 )
@@ -2626,8 +2537,8 @@ class FIFO(Module):
                                                     self.sync.rd += [
                                                         If(self.rd_en_flop1,
                                                            If(~self.underflow,
-                                                                If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                      )
                                                                 )
@@ -2641,8 +2552,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                     If(~self.rd_en_flop1,
                                                        If(~self.empty_int[i],
-                                                          If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                            If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                          If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                            If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                 self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                             )
                                                           )
@@ -2655,8 +2566,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                         If(~self.rd_en_flop1,
                                                            If(~self.empty_int[i],
-                                                              If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                              If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                     If(self.rd_ptr[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == (toggle_2x - 1 if (i - 1) % 2 == 0 else toggle_2x),
                                                                        If(self.rd_ptr[int(write_div_read) - 1] == 1 - toggle,
                                                                         self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -2671,8 +2582,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                         If(~self.rd_en_flop1,
                                                            If(~self.empty_int[i],
-                                                              If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                              If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                     If(self.rd_ptr[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == ((1 - toggle) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1) == 0 and (36 + (36*l)) == data_width_read) else (toggle_2x - 1) if (count_loop % ((data_width_read/36) * 2) == 0) else toggle_2x),
                                                                        If(self.rd_ptr[int(write_div_read) - 1] == (1 - toggle if data_width_read == (36 + (36*l)) else toggle),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -2688,8 +2599,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                   )
@@ -2700,8 +2611,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] <= int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                     )
                                                                   )
@@ -2759,8 +2670,8 @@ class FIFO(Module):
                                                 self.sync.rd += [
                                                     If(~self.rd_en_flop1,
                                                         If(~self.empty_int[i],
-                                                          If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                            If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                          If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                            If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                 self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                 )
                                                             )
@@ -2773,8 +2684,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                 If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                         If(self.rd_ptr[int(write_div_read) - 1 if (decimal_to_binary(int(len(buses_write_og)/2)) - 1) == 0 else int(write_div_read): int(write_div_read) + decimal_to_binary(int(len(buses_write_og)/2)) - 1] == (toggle_2x - 1 if (i - 1) % 2 == 0 else toggle_2x),
                                                                            If(self.rd_ptr[int(write_div_read) - 1] == 1 - toggle,
                                                                             self.dout[(36*l) % data_width_read:((36 + (36*l)) % data_width_read+ 36)].eq(self.dout_int[i])
@@ -2789,8 +2700,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                 If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])) + int(starting),
                                                                         If(self.rd_ptr[((int(write_div_read) - 1) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)) == 0 else int(write_div_read)): int(write_div_read) + int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1)] == ((1 - toggle) if (int(decimal_to_binary(int((data_width_write/data_width_read)/2)) - 1) == 0 and (36 + (36*l)) == data_width_read) else (toggle_2x - 1) if (count_loop % ((data_width_read/36) * 2) == 0) else toggle_2x),
                                                                            If(self.rd_ptr[int(write_div_read) - 1] == (1 - toggle if data_width_read == (36 + (36*l)) else toggle),
                                                                             self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
@@ -2806,8 +2717,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                 If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                         )
                                                                     )
@@ -2818,8 +2729,8 @@ class FIFO(Module):
                                                         self.sync.rd += [
                                                             If(~self.rd_en_flop1,
                                                                 If(~self.empty_int[i],
-                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
-                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/len(buses_read[l % len(buses_read_og)]))/clocks_for_output) + int(starting),
+                                                                  If(self.rd_ptr[0: -1] < int((j_loop + 1)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
+                                                                    If(self.rd_ptr[0: -1] >= int((j_loop)*memory*repeat_count*(36/buses_read[l % len(buses_read_og)])/clocks_for_output) + int(starting),
                                                                         self.inter_dout[(36*l) :((36 + (36*l)))].eq(self.dout_int[i])
                                                                         )
                                                                     )
@@ -3257,45 +3168,8 @@ class FIFO(Module):
                     ]
 
 
-                # Binary to Gray Code----------------------------------------------------------
-                if (data_width_write >= data_width_read):
-                    for i in range(0, math.ceil(math.log2((data_width_write/data_width_read)*depth))):
-                        self.comb += self.gray_encoded_rdptr[i].eq(self.rd_ptr[i + 1] ^ self.rd_ptr[i])
-                    self.comb += self.gray_encoded_rdptr[-2].eq(self.rd_ptr[-2])
-                    self.comb += self.gray_encoded_rdptr[-1].eq(self.rd_ptr[-1])
-                else:
-                    for i in range(0, math.ceil(math.log2(depth))):
-                        self.comb += self.gray_encoded_rdptr[i].eq(self.rd_ptr[i + 1] ^ self.rd_ptr[i])
-                    self.comb += self.gray_encoded_rdptr[-2].eq(self.rd_ptr[-2])
-                    self.comb += self.gray_encoded_rdptr[-1].eq(self.rd_ptr[-1])
-                for i in range(0, math.ceil(math.log2(depth))):
-                    self.comb += self.gray_encoded_wrtptr[i].eq(self.wrt_ptr[i + 1] ^ self.wrt_ptr[i])
-                self.comb += self.gray_encoded_wrtptr[-2].eq(self.wrt_ptr[-2])
-                self.comb += self.gray_encoded_wrtptr[-1].eq(self.wrt_ptr[-1])
-                # -----------------------------------------------------------------------------
-
-
-                # Gray to Binary --------------------------------------------------------------
-                if (data_width_write >= data_width_read):
-                    for i in range(0, math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 1):
-                        expr = self.rd_ptr_wrt_clk2[i]
-                        for j in range(i + 1, math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 1):
-                            expr ^= self.rd_ptr_wrt_clk2[j]
-                        self.comb += self.sync_wrtclk_rdptr_binary[i].eq(expr)
-                    self.comb += self.sync_wrtclk_rdptr_binary[-1].eq(self.rd_ptr_wrt_clk2[-1])
-                else:
-                    for i in range(0, math.ceil(math.log2(depth)) + 1):
-                        expr = self.rd_ptr_wrt_clk2[i]
-                        for j in range(i + 1, math.ceil(math.log2(depth)) + 1):
-                            expr ^= self.rd_ptr_wrt_clk2[j]
-                        self.comb += self.sync_wrtclk_rdptr_binary[i].eq(expr)
-                    self.comb += self.sync_wrtclk_rdptr_binary[-1].eq(self.rd_ptr_wrt_clk2[-1])
-                for i in range(0, math.ceil(math.log2(depth)) + 1):
-                    expr = self.wrt_ptr_rd_clk2[i]
-                    for j in range(i + 1, math.ceil(math.log2(depth)) + 1):
-                        expr ^= self.wrt_ptr_rd_clk2[j]
-                    self.comb += self.sync_rdclk_wrtptr_binary[i].eq(expr)
-                self.comb += self.sync_rdclk_wrtptr_binary[-1].eq(self.wrt_ptr_rd_clk2[-1])
+                # Binary to Gray Code / Gray to Binary -----------------------------------------
+                self.add_gray_code_converters()
                 # -----------------------------------------------------------------------------
 
             # Adding a counter to enable pessimistic full and empty signals to syncrhonous FIFO
@@ -3684,12 +3558,16 @@ class FIFO(Module):
         # Using Distributed RAM
         else:
             if (SYNCHRONOUS[synchronous]):
-                self.submodules.fifo = SyncFIFO(data_width_write, depth, first_word_fall_through)
+                self.submodules.fifo = LUTRAMSyncFIFO(data_width_write, depth, first_word_fall_through, output_register)
             else:
-                self.submodules.fifo = AsyncFIFOBuffered(data_width_write, depth)
+                self.submodules.fifo = LUTRAMAsyncFIFO(data_width_write, depth, output_register)
                 self.fifo = ClockDomainsRenamer({"write": "wrt"})(self.fifo)
                 self.fifo = ClockDomainsRenamer({"read": "rd"})(self.fifo)
                 # depth = depth + 1
+            self.comb += [
+                self.almost_full.eq(self.fifo.almost_full),
+                self.almost_empty.eq(self.fifo.almost_empty),
+            ]
             self.wr_en = Signal()
             if(SYNCHRONOUS[synchronous]):
                 self.comb += [
@@ -3727,6 +3605,13 @@ class FIFO(Module):
                         ]
                     self.sync += self.fifo.re.eq(self.rden)
                 else:
+                    # Last word read (dout on underflow).
+                    self.last_data = Signal(data_width_read)
+                    self.sync += [
+                        If(self.fifo.re & self.fifo.readable,
+                            self.last_data.eq(self.fifo.dout)
+                        )
+                    ]
                     self.comb += [
                         If(self.wren,
                             self.fifo.din.eq(self.din)
@@ -3802,16 +3687,6 @@ class FIFO(Module):
                         )
                     )
                 ]
-                # Binary to Gray Code----------------------------------------------------------
-                for i in range(0, math.ceil(math.log2(depth))):
-                    self.comb += self.gray_encoded_rdptr[i].eq(self.rd_ptr[i + 1] ^ self.rd_ptr[i])
-                self.comb += self.gray_encoded_rdptr[-2].eq(self.rd_ptr[-2])
-                self.comb += self.gray_encoded_rdptr[-1].eq(self.rd_ptr[-1])
-                for i in range(0, math.ceil(math.log2(depth))):
-                    self.comb += self.gray_encoded_wrtptr[i].eq(self.wrt_ptr[i + 1] ^ self.wrt_ptr[i])
-                self.comb += self.gray_encoded_wrtptr[-2].eq(self.wrt_ptr[-2])
-                self.comb += self.gray_encoded_wrtptr[-1].eq(self.wrt_ptr[-1])
-                # -----------------------------------------------------------------------------
                 # Synchronizers----------------------------------------------------------------
                 self.sync.wrt += [
                     self.rd_ptr_wrt_clk1.eq(self.gray_encoded_rdptr),
@@ -3822,19 +3697,9 @@ class FIFO(Module):
                     self.wrt_ptr_rd_clk2.eq(self.wrt_ptr_rd_clk1)
                 ]
                 # -----------------------------------------------------------------------------
-                # Gray to Binary --------------------------------------------------------------
-                for i in range(0, math.ceil(math.log2(depth)) + 1):
-                    expr = self.rd_ptr_wrt_clk2[i]
-                    for j in range(i + 1, math.ceil(math.log2(depth)) + 1):
-                        expr ^= self.rd_ptr_wrt_clk2[j]
-                    self.comb += self.sync_wrtclk_rdptr_binary[i].eq(expr)
-                self.comb += self.sync_wrtclk_rdptr_binary[-1].eq(self.rd_ptr_wrt_clk2[-1])
-                for i in range(0, math.ceil(math.log2(depth)) + 1):
-                    expr = self.wrt_ptr_rd_clk2[i]
-                    for j in range(i + 1, math.ceil(math.log2(depth)) + 1):
-                        expr ^= self.wrt_ptr_rd_clk2[j]
-                    self.comb += self.sync_rdclk_wrtptr_binary[i].eq(expr)
-                self.comb += self.sync_rdclk_wrtptr_binary[-1].eq(self.wrt_ptr_rd_clk2[-1])
+                # Binary to Gray Code / Gray to Binary -----------------------------------------
+                self.add_gray_code_converters()
+                # -----------------------------------------------------------------------------
                 # Checking if the FIFO is full
                 self.comb += [
                     If((self.wrt_ptr[-1] != self.sync_wrtclk_rdptr_binary[-1]),
@@ -3962,3 +3827,75 @@ class FIFO(Module):
                         )
                 ]
 
+    # Gray coded pointers crossing the write/read clock domains: read/write pointers to Gray code
+    # (before the synchronizers), synchronized pointers back to binary.
+    def add_gray_code_converters(self):
+        conversions = [
+            (BinaryToGray, self.rd_ptr,          self.gray_encoded_rdptr),
+            (BinaryToGray, self.wrt_ptr,         self.gray_encoded_wrtptr),
+            (GrayToBinary, self.rd_ptr_wrt_clk2, self.sync_wrtclk_rdptr_binary),
+            (GrayToBinary, self.wrt_ptr_rd_clk2, self.sync_rdclk_wrtptr_binary),
+        ]
+        for converter_cls, i, o in conversions:
+            converter = converter_cls(len(i))
+            self.submodules += converter
+            self.comb += [
+                converter.i.eq(i),
+                o.eq(converter.o),
+            ]
+
+    # Pipelined Width Conversion -------------------------------------------------------------------
+    # Read wider than write: UpConverter (write clock domain) writing a FIFO of the read width, read at
+    # one word per clock cycle. Depth and thresholds of the read FIFO in read words.
+    def add_width_converter(self, plan, synchronous, full_threshold, empty_threshold, first_word_fall_through, empty_value, full_value, builtin_fifo):
+        ratio = plan.ratio
+        core  = plan.core
+
+        self.din          = Signal(plan.data_width_write)
+        self.dout         = Signal(plan.data_width_read)
+        self.rden         = Signal()
+        self.wren         = Signal()
+        self.empty        = Signal()
+        self.full         = Signal()
+        self.underflow    = Signal()
+        self.overflow     = Signal()
+        self.prog_full    = Signal()
+        self.prog_empty   = Signal()
+
+        self.submodules.core = fifo = FIFO(core.data_width_write, core.data_width_read, synchronous, full_threshold, empty_threshold, core.depth,
+            first_word_fall_through,
+            empty_value = min(max(empty_value // ratio, 1), core.depth - 1),
+            full_value  = min(max(full_value // ratio, 2), core.depth - 1),
+            builtin_fifo = builtin_fifo)
+        converter = UpConverter(plan.data_width_write, ratio)
+        if (synchronous == "ASYNCHRONOUS"):
+            converter = ClockDomainsRenamer("wrt")(converter)
+        self.submodules.converter = converter
+
+        # Write: write words packed in read words, written when the read FIFO isn't full.
+        self.comb += [
+            converter.din.eq(self.din),
+            converter.we.eq(self.wren),
+            self.full.eq(~converter.writable),
+            fifo.din.eq(converter.dout),
+            fifo.wren.eq(converter.readable & ~fifo.full),
+            converter.re.eq(~fifo.full),
+        ]
+        sync_wrt = self.sync if (synchronous == "SYNCHRONOUS") else self.sync.wrt
+        sync_wrt += [
+            If(self.wren & self.full,
+                self.overflow.eq(1)
+            ).Else(
+                self.overflow.eq(0)
+            )
+        ]
+
+        # Read.
+        self.comb += [
+            fifo.rden.eq(self.rden),
+            self.dout.eq(fifo.dout),
+            self.empty.eq(fifo.empty),
+            self.underflow.eq(fifo.underflow),
+            self.prog_full.eq(fifo.prog_full),
+            self.prog_empty.eq(fifo.prog_empty),
+        ]
@@ -0,0 +1,267 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+
+import math
+import functools
+
+# Lane Planning ------------------------------------------------------------------------------------
+
+BRAM_DEPTH = 1024 # Depth of a FIFO36K/FIFO18K/FIFO9K primitive (36/18/9-bit data).
+
+# Data width split in 36-bit lanes (tuple of lane widths), a last 19 to 35-bit lane being split in
+# 18 + remaining bits when no depth is given or for depths above BRAM_DEPTH.
+def fifo_lanes(width, depth=None):
+    return _fifo_lanes(width, depth is None or depth > BRAM_DEPTH)
+
+@functools.lru_cache(maxsize=None)
+def _fifo_lanes(width, split):
+    lanes = (36,) * (width // 36)
+    rem   = width % 36
+    if rem > 18 and split:
+        lanes += (18, rem - 18)
+    elif rem:
+        lanes += (rem,)
+    return lanes
+
+# BRAM Capacity ------------------------------------------------------------------------------------
+
+BRAM_COUNT = 128  # 36K BRAMs of the device.
+
+# Quarter BRAMs (FIFO36K = 4, FIFO18K = 2, FIFO9K = 1) used by one BRAM_DEPTH row of lanes.
+def bram_units(width, depth=None):
+    units = 4 * (width // 36)
+    for lane in fifo_lanes(width % 36, depth):
+        units += 1 if lane <= 9 else 2 if lane <= 18 else 4
+    return units
+
+# Largest BRAM_DEPTH multiple whose width x depth FIFO uses less than bram_limit BRAMs.
+def max_depth(width, bram_limit=BRAM_COUNT):
+    limit = 4 * bram_limit - 1
+    rows  = limit // bram_units(width)
+    if rows < 2:
+        rows = 1 if bram_units(width, BRAM_DEPTH) <= limit else 0
+    return rows * BRAM_DEPTH
+
+# Width Conversion ---------------------------------------------------------------------------------
+
+# Read wider than write: read words assembled from the write lanes over several read cycles (serial)
+# or write words packed in read words (UpConverter) written to a FIFO of the read width, read at one
+# word per clock cycle (pipelined, read depth of 2 words at least).
+WIDTH_CONVERTERS = ["serial", "pipelined"]
+
+# FIFO Plan ----------------------------------------------------------------------------------------
+
+# Lanes, primitives, pointer widths, latency and resources of a FIFO. Computed once per parameter set
+# (fifo_plan) and shared by the generator summary and the LiteX elaboration.
+class FIFOPlan:
+    __slots__ = ("data_width_write", "data_width_read", "depth", "width_converter", "lanes_write",
+        "lanes_read", "buses_write", "buses_read", "repeat_count", "write_div_read", "data_36_write",
+        "data_36", "rows", "num_36K", "num_18K", "num_9K", "total_mem", "primitives", "clocks_for_output",
+        "depth_read", "addr_width_write", "addr_width_read")
+
+    def __init__(self, data_width_write, data_width_read, depth, width_converter="serial"):
+        self.data_width_write = data_width_write
+        self.data_width_read  = data_width_read
+        self.depth            = depth
+
+        # Pipelined width conversion (read wider than write, read depth of 2 words at least).
+        if width_converter == "pipelined" and data_width_read > data_width_write and depth // self.ratio >= 2:
+            self.width_converter = "pipelined"
+        else:
+            self.width_converter = "serial"
+
+        # Lanes (write lanes split for depths above BRAM_DEPTH).
+        self.lanes_write = fifo_lanes(data_width_write, depth)
+        self.lanes_read  = fifo_lanes(data_width_read)
+
+        # Write/Read lanes paired, the shorter list being repeated.
+        buses_write, buses_read = self.lanes_write, self.lanes_read
+        if len(buses_write) < len(buses_read):
+            self.repeat_count = len(buses_read) // len(buses_write)
+            buses_write = buses_write * self.repeat_count + buses_write[:len(buses_read) % len(buses_write)]
+        else:
+            self.repeat_count = len(buses_write) // len(buses_read)
+            buses_read = buses_read * self.repeat_count + buses_read[:len(buses_write) % len(buses_read)]
+        self.buses_write    = buses_write
+        self.buses_read     = buses_read
+        self.write_div_read = max(int(int(data_width_write/data_width_read)/len(buses_write)).bit_length(), 1)
+
+        # 36-bit lanes (18-bit and more below BRAM_DEPTH).
+        def is_36(lane):
+            return (lane >= 18 and depth < BRAM_DEPTH) or (lane == 36 and depth >= BRAM_DEPTH)
+        self.data_36_write = sum(1 for lane in self.lanes_write if is_36(lane))
+        self.data_36       = sum(1 for lane in self.buses_write if is_36(lane))
+
+        # Lane primitives: one FIFO36K/FIFO18K/FIFO9K per write lane and per BRAM_DEPTH row.
+        self.rows      = math.ceil(depth / BRAM_DEPTH)
+        self.num_36K   = self.rows * sum(1 for lane in self.lanes_write if lane > 18)
+        self.num_18K   = self.rows * sum(1 for lane in self.lanes_write if 9 < lane <= 18)
+        self.num_9K    = self.rows * sum(1 for lane in self.lanes_write if lane <= 9)
+        self.total_mem = self.num_36K + math.ceil(self.num_18K/2) + math.ceil(self.num_9K/4)
+
+        # Instantiated primitives (one BRAM each), by (loop, lane) of the elaboration.
+        self.primitives = self.schedule()
+
+        # Read latency (clock cycles) and depth.
+        if data_width_write < data_width_read:
+            self.clocks_for_output = int(math.ceil(data_width_read / 36) / len(self.lanes_write))
+            self.depth_read        = depth / self.clocks_for_output if self.clocks_for_output else None
+        else:
+            self.clocks_for_output = 1
+            self.depth_read        = (data_width_write / data_width_read) * depth
+
+        # Pointers address widths.
+        self.addr_width_write = math.ceil(math.log2(depth))
+        if data_width_write >= data_width_read:
+            self.addr_width_read = math.ceil(math.log2((data_width_write/data_width_read)*depth))
+        else:
+            self.addr_width_read = self.addr_width_write
+
+    def schedule(self):
+        # Elaboration loop: total_mem passes over the lanes, a lane of a pass being instantiated as a
+        # FIFO36K (36-bit write or read data) or a FIFO18KX2 (two cascaded FIFO18K) while BRAMs are left.
+        primitives = {}
+        mem = count_36K = count18K = count9K = 0
+        k36_flag = False
+        for k in range(self.total_mem):
+            for i, (bus_write, bus_read) in enumerate(zip(self.buses_write, self.buses_read)):
+                data_write = 9 if bus_write <= 9 else 18 if bus_write <= 18 else 36
+                data_read  = 9 if bus_read  <= 9 else 18 if bus_read  <= 18 else 36
+                if data_write == 36 or data_read == 36:
+                    k36_flag = True
+                instance = "FIFO36K" if 36 in (data_write, data_read) else "FIFO18KX2"
+                if self.total_mem == 1:
+                    if mem >= 1:
+                        continue
+                elif instance == "FIFO36K":
+                    if count_36K >= self.num_36K and mem >= self.total_mem:
+                        continue
+                    count_36K += 1
+                else:
+                    # 18-bit lanes on odd passes, 9-bit lanes on passes 1 mod 4 (both on every pass until
+                    # a 36-bit lane is met), any lane on the last but one pass.
+                    half18 = 18 in (data_write, data_read) and count18K < self.num_18K/2
+                    quad9  = 9 in (data_write, data_read) and count9K < self.num_9K/4
+                    if mem >= self.total_mem or not ((k % 2 == 1 and half18) or (k + 2 == self.total_mem) or
+                        (k % 4 == 1 and quad9) or (not k36_flag and (quad9 or half18))):
+                        continue
+                    if data_write == 18:
+                        count18K += 1
+                    elif data_write == 9:
+                        count9K += 1
+                primitives[(k, i)] = instance
+                mem += 1
+        return primitives
+
+    @property
+    def ratio(self):
+        return self.data_width_read // self.data_width_write
+
+    @property
+    def core(self):
+        # Pipelined width conversion: FIFO of the read width.
+        if self.width_converter != "pipelined":
+            return None
+        return fifo_plan(self.data_width_read, self.data_width_read, self.depth // self.ratio)
+
+    @property
+    def read_cycles(self):
+        # Clock cycles per read word (steady state).
+        return 1 if self.width_converter == "pipelined" else self.clocks_for_output
+
+    @property
+    def brams(self):
+        # BRAMs used (instantiated FIFO36K/FIFO18KX2).
+        if self.core is not None:
+            return self.core.brams
+        return len(self.primitives)
+
+    @property
+    def resources(self):
+        if self.core is not None:
+            return self.core.resources
+        primitives = list(self.primitives.values())
+        return {
+            "FIFO36K"   : primitives.count("FIFO36K"),
+            "FIFO18KX2" : primitives.count("FIFO18KX2"),
+            "BRAM"      : self.brams,
+        }
+
+@functools.lru_cache(maxsize=256)
+def fifo_plan(data_width_write, data_width_read, depth, width_converter="serial"):
+    return FIFOPlan(data_width_write, data_width_read, depth, width_converter)
+
+# LUT-RAM Plan -------------------------------------------------------------------------------------
+
+LUTRAM_DEPTH = 64 # Depth of a LUT-RAM (LUT6 as a 64 x 1-bit simple dual-port RAM).
+
+# LUT6s of a n:1 read multiplexer (4:1 per LUT6).
+def lutram_mux_luts(n):
+    luts = 0
+    while n > 1:
+        n     = math.ceil(n / 4)
+        luts += n
+    return luts
+
+# LUT-RAMs, LUTs and FFs of a LUT-RAM FIFO (lutram_fifo), estimated from its storage, read multiplexers,
+# pointers, levels and flags.
+class LUTRAMPlan:
+    __slots__ = ("width", "depth", "synchronous", "output_register", "storage_depth", "banks",
+        "addr_width", "lutram", "luts", "ffs")
+
+    def __init__(self, width, depth, synchronous, first_word_fall_through, output_register):
+        self.width       = width
+        self.depth       = depth
+        self.synchronous = synchronous
+
+        # Output register: First Word Fall Through (synchronous, the standard mode read port being
+        # registered, depth above 2) or asynchronous; synchronous FIFOs hold depth - 1 words in the
+        # LUT-RAM.
+        self.output_register = output_register and ((first_word_fall_through and depth > 2) or not synchronous)
+        self.storage_depth   = depth - 1 if (self.output_register and synchronous) else depth
+
+        # Storage: LUTRAM_DEPTH banks per bit, read multiplexers and bank write enables.
+        self.banks      = math.ceil(self.storage_depth / LUTRAM_DEPTH)
+        self.addr_width = max(math.ceil(math.log2(self.storage_depth)), 1)
+        self.lutram     = width * self.banks
+        luts            = self.lutram + width * lutram_mux_luts(self.banks) + (self.banks if self.banks > 1 else 0)
+
+        # Control: pointers, levels and almost full/empty flags.
+        level_width = depth.bit_length()
+        if synchronous:
+            luts += 2 * self.addr_width + 3 * level_width
+            ffs   = 2 * self.addr_width + level_width + 2
+        else:
+            # Binary, Gray and synchronized (2 flops) pointers of both clock domains.
+            ptr_width = math.ceil(math.log2(depth)) + 1
+            luts += 2 * self.addr_width + 6 * ptr_width + 4 * level_width
+            ffs   = 2 * self.addr_width + 8 * ptr_width + 2
+
+        # Registered read data (and its valid flag).
+        if self.output_register:
+            ffs += width + 1
+        elif synchronous and not first_word_fall_through:
+            ffs += width
+        self.luts = luts
+        self.ffs  = ffs
+
+    @property
+    def description(self):
+        return f"{self.lutram} LUT-RAMs ({self.width} bits x {self.banks} banks), {self.luts} LUTs, {self.ffs} FFs"
+
+    @property
+    def resources(self):
+        return {
+            "LUTRAM" : self.lutram,
+            "LUT"    : self.luts,
+            "FF"     : self.ffs,
+        }
+
+@functools.lru_cache(maxsize=256)
+def lutram_plan(width, depth, synchronous, first_word_fall_through, output_register):
+    return LUTRAMPlan(width, depth, synchronous, first_word_fall_through, output_register)
@@ -0,0 +1,50 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+
+from migen import *
+
+# Gray code converters of the asynchronous FIFO pointers: the width-1 LSBs are Gray coded, the MSB
+# (wrap bit) is passed through (wrap_bit=False: all the bits are Gray coded).
+
+# Binary to Gray Code ------------------------------------------------------------------------------
+
+class BinaryToGray(Module):
+    def __init__(self, width, wrap_bit=True):
+        self.i = Signal(width)
+        self.o = Signal(width)
+
+        # o = i ^ (i >> 1): one XOR per bit.
+        if wrap_bit:
+            self.comb += [
+                self.o[:-1].eq(self.i[:-1] ^ self.i[1:-1]),
+                self.o[-1].eq(self.i[-1]),
+            ]
+        else:
+            self.comb += self.o.eq(self.i ^ self.i[1:])
+
+# Gray Code to Binary ------------------------------------------------------------------------------
+
+class GrayToBinary(Module):
+    def __init__(self, width, wrap_bit=True):
+        self.i = Signal(width)
+        self.o = Signal(width)
+
+        # Parallel prefix XOR (o[k] = XOR of i[k:gray_width]): log2(gray_width) stages, each stage
+        # XORing the previous one with itself shifted by 1, 2, 4... bits.
+        gray_width = width - 1 if wrap_bit else width
+        stage = self.i[:gray_width]
+        shift = 1
+        while shift < gray_width:
+            prefix = Signal(gray_width)
+            self.comb += prefix.eq(stage ^ (stage >> shift))
+            stage  = prefix
+            shift *= 2
+        if wrap_bit:
+            self.comb += self.o.eq(Cat(stage, self.i[-1]))
+        else:
+            self.comb += self.o.eq(stage)
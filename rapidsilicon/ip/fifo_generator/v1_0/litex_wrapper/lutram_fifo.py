@@ -0,0 +1,242 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+from litex_wrapper.gray_code import BinaryToGray, GrayToBinary
+
+# LUT-RAM FIFOs (Distributed RAM, builtin_fifo=False), with the migen SyncFIFO/AsyncFIFO interfaces:
+# - Any depth, the pointers wrapping explicitly.
+# - Optional output register: the first word is prefetched in a register (First Word Fall Through
+#   dout from flops instead of the LUT-RAM asynchronous read).
+# - Look-ahead almost_full/almost_empty: registered flags, computed from the level of the next cycle
+#   (no latency, no glitch).
+
+# Pointer ------------------------------------------------------------------------------------------
+
+# Increment of a pointer over [start, end], wrapping to start.
+def pointer_next(pointer, start, end):
+    return If(pointer == end,
+        pointer.eq(start)
+    ).Else(
+        pointer.eq(pointer + 1)
+    )
+
+# LUT-RAM Synchronous FIFO -------------------------------------------------------------------------
+
+class LUTRAMSyncFIFO(Module):
+    def __init__(self, width, depth, fwft=True, output_register=False, almost_full_level=None, almost_empty_level=1):
+        assert depth >= 2
+        self.din          = Signal(width)
+        self.we           = Signal()
+        self.writable     = Signal()
+        self.dout         = Signal(width)
+        self.re           = Signal()
+        self.readable     = Signal()
+        self.level        = Signal(max=depth + 1)
+        self.almost_full  = Signal()
+        self.almost_empty = Signal(reset=1)
+
+        # # #
+
+        # Output register (First Word Fall Through only: the standard mode read port is registered),
+        # the LUT-RAM holds the other depth - 1 words (2 words at least).
+        buffered      = fwft and output_register and depth > 2
+        storage_depth = depth - 1 if buffered else depth
+
+        storage = Memory(width, storage_depth)
+        wrport  = storage.get_port(write_capable=True, mode=READ_FIRST)
+        rdport  = storage.get_port(async_read=fwft and not buffered, has_re=not fwft or buffered, mode=READ_FIRST)
+        self.specials += storage, wrport, rdport
+
+        produce = Signal(max=storage_depth)
+        consume = Signal(max=storage_depth)
+        count   = Signal(max=storage_depth + 1)
+        push    = Signal()
+        pop     = Signal()
+        do_read = Signal()
+
+        # Write.
+        self.comb += [
+            self.writable.eq(count != storage_depth),
+            push.eq(self.we & self.writable),
+            wrport.adr.eq(produce),
+            wrport.dat_w.eq(self.din),
+            wrport.we.eq(push),
+        ]
+        self.sync += If(push, pointer_next(produce, 0, storage_depth - 1))
+
+        # Read.
+        self.comb += [
+            rdport.adr.eq(consume),
+            self.dout.eq(rdport.dat_r),
+            pop.eq(self.re & self.readable),
+        ]
+        if buffered:
+            # Prefetch: LUT-RAM read when the output register is empty or read.
+            self.comb += do_read.eq((count != 0) & (~self.readable | self.re))
+            self.sync += If(do_read, self.readable.eq(1)).Elif(self.re, self.readable.eq(0))
+            self.comb += self.level.eq(count + self.readable)
+        else:
+            self.comb += [
+                do_read.eq(pop),
+                self.readable.eq(count != 0),
+                self.level.eq(count),
+            ]
+        if not fwft or buffered:
+            self.comb += rdport.re.eq(do_read)
+        self.sync += [
+            If(do_read, pointer_next(consume, 0, storage_depth - 1)),
+            If(push & ~do_read,
+                count.eq(count + 1)
+            ).Elif(~push & do_read,
+                count.eq(count - 1)
+            )
+        ]
+
+        # Almost Full/Empty (look-ahead).
+        level_next = Signal(max=depth + 1)
+        self.comb += [
+            If(push & ~pop,
+                level_next.eq(self.level + 1)
+            ).Elif(~push & pop,
+                level_next.eq(self.level - 1)
+            ).Else(
+                level_next.eq(self.level)
+            )
+        ]
+        self.sync += [
+            self.almost_full.eq(level_next >= (depth - 1 if almost_full_level is None else almost_full_level)),
+            self.almost_empty.eq(level_next <= almost_empty_level),
+        ]
+
+# LUT-RAM Asynchronous FIFO ------------------------------------------------------------------------
+
+# Clock domains: "write" and "read" (renamed with ClockDomainsRenamer). The pointers count over the
+# 2 x depth values centered on 2**addr_width: Gray coded, every increment (and the wrap) changes a
+# single bit for any depth.
+class LUTRAMAsyncFIFO(Module):
+    def __init__(self, width, depth, output_register=False, almost_full_level=None, almost_empty_level=1):
+        assert depth >= 2
+        self.din          = Signal(width)
+        self.we           = Signal()
+        self.writable     = Signal()
+        self.dout         = Signal(width)
+        self.re           = Signal()
+        self.readable     = Signal()
+        self.level_write  = Signal(max=depth + 1)
+        self.level_read   = Signal(max=depth + 2)
+        self.almost_full  = Signal()
+        self.almost_empty = Signal(reset=1)
+
+        # # #
+
+        addr_width = log2_int(depth, need_pow2=False)
+        start      = 2**addr_width - depth
+        end        = 2**addr_width + depth - 1
+        ptr_width  = addr_width + 1
+
+        # Output register: First Word Fall Through dout from flops (depth + 1 words).
+        storage = Memory(width, depth)
+        wrport  = storage.get_port(write_capable=True, mode=READ_FIRST, clock_domain="write")
+        rdport  = storage.get_port(async_read=not output_register, has_re=output_register, mode=READ_FIRST, clock_domain="read")
+        self.specials += storage, wrport, rdport
+
+        produce     = Signal(max=depth)
+        consume     = Signal(max=depth)
+        produce_ptr = Signal(ptr_width, reset=start)
+        consume_ptr = Signal(ptr_width, reset=start)
+        push        = Signal()
+        do_read     = Signal()
+
+        # Pointers clock domain crossing: Gray coded, registered and synchronized (MultiReg).
+        gray_start        = start ^ (start >> 1)
+        produce_gray      = Signal(ptr_width, reset=gray_start)
+        consume_gray      = Signal(ptr_width, reset=gray_start)
+        produce_gray_sync = Signal(ptr_width)
+        consume_gray_sync = Signal(ptr_width)
+        produce_ptr_sync  = Signal(ptr_width)
+        consume_ptr_sync  = Signal(ptr_width)
+        self.submodules.produce_b2g = produce_b2g = BinaryToGray(ptr_width, wrap_bit=False)
+        self.submodules.consume_b2g = consume_b2g = BinaryToGray(ptr_width, wrap_bit=False)
+        self.submodules.produce_g2b = produce_g2b = GrayToBinary(ptr_width, wrap_bit=False)
+        self.submodules.consume_g2b = consume_g2b = GrayToBinary(ptr_width, wrap_bit=False)
+        self.sync.write += produce_gray.eq(produce_b2g.o)
+        self.sync.read  += consume_gray.eq(consume_b2g.o)
+        self.specials += [
+            MultiReg(produce_gray, produce_gray_sync, "read",  reset=gray_start),
+            MultiReg(consume_gray, consume_gray_sync, "write", reset=gray_start),
+        ]
+        self.comb += [
+            produce_b2g.i.eq(produce_ptr),
+            consume_b2g.i.eq(consume_ptr),
+            produce_g2b.i.eq(produce_gray_sync),
+            consume_g2b.i.eq(consume_gray_sync),
+            produce_ptr_sync.eq(produce_g2b.o),
+            consume_ptr_sync.eq(consume_g2b.o),
+        ]
+
+        # Levels (modulo 2 x depth pointers difference), seen from each clock domain.
+        level_write = Signal(max=depth + 1)
+        level_read  = Signal(max=depth + 1)
+        self.comb += [
+            If(produce_ptr >= consume_ptr_sync,
+                level_write.eq(produce_ptr - consume_ptr_sync)
+            ).Else(
+                level_write.eq(produce_ptr + 2*depth - consume_ptr_sync)
+            ),
+            If(produce_ptr_sync >= consume_ptr,
+                level_read.eq(produce_ptr_sync - consume_ptr)
+            ).Else(
+                level_read.eq(produce_ptr_sync + 2*depth - consume_ptr)
+            ),
+            self.level_write.eq(level_write),
+        ]
+
+        # Write.
+        self.comb += [
+            self.writable.eq(level_write != depth),
+            push.eq(self.we & self.writable),
+            wrport.adr.eq(produce),
+            wrport.dat_w.eq(self.din),
+            wrport.we.eq(push),
+        ]
+        self.sync.write += If(push,
+            pointer_next(produce, 0, depth - 1),
+            pointer_next(produce_ptr, start, end)
+        )
+
+        # Read.
+        pop = Signal()
+        self.comb += [
+            rdport.adr.eq(consume),
+            self.dout.eq(rdport.dat_r),
+            pop.eq(self.re & self.readable),
+        ]
+        if output_register:
+            self.comb += [
+                do_read.eq((level_read != 0) & (~self.readable | self.re)),
+                rdport.re.eq(do_read),
+                self.level_read.eq(level_read + self.readable),
+            ]
+            self.sync.read += If(do_read, self.readable.eq(1)).Elif(self.re, self.readable.eq(0))
+        else:
+            self.comb += [
+                do_read.eq(pop),
+                self.readable.eq(level_read != 0),
+                self.level_read.eq(level_read),
+            ]
+        self.sync.read += If(do_read,
+            pointer_next(consume, 0, depth - 1),
+            pointer_next(consume_ptr, start, end)
+        )
+
+        # Almost Full/Empty (look-ahead, in the write/read clock domains).
+        self.sync.write += self.almost_full.eq(self.level_write + push >= (depth - 1 if almost_full_level is None else almost_full_level))
+        self.sync.read  += self.almost_empty.eq(self.level_read - pop <= almost_empty_level)
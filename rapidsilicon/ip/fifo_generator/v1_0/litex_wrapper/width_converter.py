@@ -0,0 +1,60 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+
+from migen import *
+
+# Up Converter -------------------------------------------------------------------------------------
+
+# Packs ratio write words (first word in the LSBs) in a read word, with a migen FIFO-like interface.
+# A complete read word is moved to the output register, freeing the shift register: writes continue
+# at one word per clock cycle while the output register is read within ratio cycles.
+class UpConverter(Module):
+    def __init__(self, width, ratio):
+        assert ratio >= 2
+        self.din      = Signal(width)
+        self.we       = Signal()
+        self.writable = Signal()
+        self.dout     = Signal(width*ratio)
+        self.re       = Signal()
+        self.readable = Signal()
+
+        # # #
+
+        shift = Signal(width*(ratio - 1))
+        count = Signal(max=ratio)
+        last  = Signal()
+        push  = Signal()
+        pop   = Signal()
+
+        self.comb += [
+            last.eq(count == (ratio - 1)),
+            pop.eq(self.re & self.readable),
+            # Last word of a read word: the output register must be empty or read.
+            self.writable.eq(~last | ~self.readable | self.re),
+            push.eq(self.we & self.writable),
+        ]
+        if ratio > 2:
+            shift_next = Cat(shift[width:], self.din)
+        else:
+            shift_next = self.din
+        self.sync += [
+            If(push,
+                If(last,
+                    count.eq(0),
+                    self.dout.eq(Cat(shift, self.din))
+                ).Else(
+                    count.eq(count + 1),
+                    shift.eq(shift_next)
+                )
+            ),
+            If(push & last,
+                self.readable.eq(1)
+            ).Elif(pop,
+                self.readable.eq(0)
+            )
+        ]
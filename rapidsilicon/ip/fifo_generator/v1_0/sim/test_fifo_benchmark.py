@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+# FIFO Generator benchmark: generates FIFO configurations (catalog.generate) and measures them with
+# cocotb (SIM=verilator by default, SIM=icarus for Icarus Verilog):
+# - throughput:        sustained words per cycle, write and read sides (write/read always enabled), and
+#                      the words written/read before the timeout.
+# - read_latency:      read clock cycles from rd_en to the word on dout (vs "Read Latency" summary).
+# - first_word:        read clock cycles from the first write to empty deasserted.
+# - full/empty_recovery: write/read clock cycles from a read/write to full/empty deasserted.
+# - prog_full/empty_error: words in the FIFO when prog_full/prog_empty assert minus full/empty_value.
+#
+# ./test_fifo_benchmark.py --json results.json --csv results.csv  # Every configuration.
+# pytest test_fifo_benchmark.py                                     # One test per configuration.
+
+import os
+import sys
+import csv
+import json
+import random
+import argparse
+
+# Collected by pytest without cocotb/cocotb-test installed: skipped.
+if "pytest" in sys.modules:
+    import pytest
+    pytest.importorskip("cocotb")
+    pytest.importorskip("cocotb_test")
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly
+
+# Testbench ----------------------------------------------------------------------------------------
+
+# Cycles limit of every measurement loop, of the flags once the FIFO is idle.
+TIMEOUT_CYCLES = 1 << 16
+FLAG_TIMEOUT_CYCLES = 256
+
+class TB:
+    def __init__(self, dut):
+        self.dut         = dut
+        self.synchronous = int(os.getenv("SYNCHRONOUS", "1"))
+        self.fwft        = int(os.getenv("FWFT", "0"))
+        self.depth       = int(os.getenv("DEPTH", "1024"))
+        self.words       = int(os.getenv("WORDS", "4096"))
+        self.wrt_width   = len(dut.din)
+        self.rd_width    = len(dut.dout)
+
+        wrt_period = float(os.getenv("WRT_CLK", "10"))
+        rd_period  = float(os.getenv("RD_CLK",  "10"))
+        if self.synchronous:
+            self.wrt_clk = self.rd_clk = dut.clk
+            cocotb.start_soon(Clock(dut.clk, wrt_period, units="ns").start())
+        else:
+            self.wrt_clk = dut.wrt_clock
+            self.rd_clk  = dut.rd_clock
+            cocotb.start_soon(Clock(dut.wrt_clock, wrt_period, units="ns").start())
+            cocotb.start_soon(Clock(dut.rd_clock,  rd_period,  units="ns").start())
+
+    async def reset(self):
+        self.dut.rst.value   = 1
+        self.dut.wr_en.value = 0
+        self.dut.rd_en.value = 0
+        self.dut.din.value   = 0
+        for _ in range(10):
+            await RisingEdge(self.wrt_clk)
+        for _ in range(10):
+            await RisingEdge(self.rd_clk)
+        self.dut.rst.value = 0
+        await self.idle()
+
+    async def idle(self, cycles=16):
+        # Lets the flags cross the clock domains.
+        for _ in range(cycles):
+            await RisingEdge(self.wrt_clk)
+        for _ in range(cycles):
+            await RisingEdge(self.rd_clk)
+
+    async def wait_flag(self, clk, flag, value, timeout=TIMEOUT_CYCLES):
+        # Clock cycles until flag == value (None on timeout).
+        for cycles in range(timeout):
+            await ReadOnly()
+            if int(flag.value) == value:
+                return cycles
+            await RisingEdge(clk)
+        return None
+
+    async def write(self, words):
+        # Writes words, returns the write cycles.
+        cycles = 0
+        for word in words:
+            while not await self.write_cycle(word):
+                cycles += 1
+            cycles += 1
+        await FallingEdge(self.wrt_clk)
+        self.dut.wr_en.value = 0
+        return cycles
+
+    async def write_cycle(self, word):
+        # One write clock cycle, wr_en asserted when not full (the flags are registered: sampled on
+        # the falling edge, a write/read while full/empty would be an overflow/underflow dropping the
+        # next one). Returns True when the word was written.
+        await FallingEdge(self.wrt_clk)
+        accepted = not int(self.dut.full.value)
+        self.dut.din.value   = word
+        self.dut.wr_en.value = int(accepted)
+        await RisingEdge(self.wrt_clk)
+        return accepted
+
+    async def read(self, count):
+        # Reads count words, returns the read cycles.
+        cycles = 0
+        for _ in range(count):
+            while not await self.read_cycle():
+                cycles += 1
+            cycles += 1
+        await FallingEdge(self.rd_clk)
+        self.dut.rd_en.value = 0
+        return cycles
+
+    async def read_cycle(self):
+        # One read clock cycle, rd_en asserted when not empty. Returns True when a word was read.
+        await FallingEdge(self.rd_clk)
+        accepted = not int(self.dut.empty.value)
+        self.dut.rd_en.value = int(accepted)
+        await RisingEdge(self.rd_clk)
+        return accepted
+
+    def random_words(self, count):
+        return [random.getrandbits(self.wrt_width) for _ in range(count)]
+
+    @property
+    def writes_per_read(self):
+        # Write words per read word (asymmetric FIFOs), at least 1.
+        return max(self.rd_width // self.wrt_width, 1)
+
+    def record(self, **results):
+        # Merges results in RESULTS_FILE (every test of a configuration runs in the same simulation).
+        filename = os.getenv("RESULTS_FILE")
+        if filename is None:
+            return
+        data = {}
+        if os.path.exists(filename):
+            with open(filename, "r") as f:
+                data = json.load(f)
+        data.update(results)
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=4)
+
+# Tests --------------------------------------------------------------------------------------------
+
+@cocotb.test()
+async def run_test_latency(dut):
+    tb = TB(dut)
+    await tb.reset()
+
+    # First word: write two read words (a single word after reset keeps the FIFO36K model empty), read
+    # cycles until ~empty.
+    await tb.write(tb.random_words(2 * tb.writes_per_read))
+    first_word = await tb.wait_flag(tb.rd_clk, dut.empty, 0, timeout=FLAG_TIMEOUT_CYCLES)
+
+    # Read latency: read cycles from rd_en to the first word on dout, rd_en kept over the next words
+    # (dout is only driven while reading, random words are non-zero). FWFT: word on dout with rd_en,
+    # latency 0.
+    read_latency = None
+    if first_word is not None:
+        await tb.write(tb.random_words(6 * tb.writes_per_read))
+        await tb.idle()
+        await RisingEdge(tb.rd_clk)
+        dut.rd_en.value = 1
+        for cycles in range(8):
+            await ReadOnly()
+            if dut.dout.value.is_resolvable and int(dut.dout.value):
+                read_latency = cycles
+                break
+            await RisingEdge(tb.rd_clk)
+        await RisingEdge(tb.rd_clk)
+        dut.rd_en.value = 0
+
+    tb.record(first_word=first_word, read_latency=read_latency)
+
+@cocotb.test()
+async def run_test_throughput(dut):
+    tb = TB(dut)
+    await tb.reset()
+
+    # Write and read always enabled: sustained words per cycle once both sides are running.
+    written = []
+    read    = []
+
+    async def writer():
+        words = iter(tb.random_words(tb.words))
+        word  = next(words)
+        for cycle in range(TIMEOUT_CYCLES):
+            if await tb.write_cycle(word):
+                written.append(cycle)
+                word = next(words, None)
+                if word is None:
+                    break
+        await FallingEdge(tb.wrt_clk)
+        dut.wr_en.value = 0
+
+    async def reader():
+        count = tb.words * tb.wrt_width // tb.rd_width
+        for cycle in range(TIMEOUT_CYCLES):
+            if await tb.read_cycle():
+                read.append(cycle)
+                if len(read) == count:
+                    break
+        await FallingEdge(tb.rd_clk)
+        dut.rd_en.value = 0
+
+    write_task = cocotb.start_soon(writer())
+    read_task  = cocotb.start_soon(reader())
+    await write_task
+    await read_task
+
+    def words_per_cycle(cycles):
+        # Second half of the transfer: steady state.
+        cycles = cycles[len(cycles)//2:]
+        if len(cycles) < 2:
+            return None
+        return round((len(cycles) - 1) / (cycles[-1] - cycles[0]), 4)
+
+    tb.record(
+        words_written         = len(written),
+        words_read            = len(read),
+        write_words_per_cycle = words_per_cycle(written),
+        read_words_per_cycle  = words_per_cycle(read),
+    )
+
+@cocotb.test()
+async def run_test_flags(dut):
+    tb = TB(dut)
+    await tb.reset()
+
+    # Full recovery: fill, read one word, write cycles until ~full.
+    for _ in range(tb.depth * 2):
+        if not await tb.write_cycle(random.getrandbits(tb.wrt_width)):
+            break
+    await FallingEdge(tb.wrt_clk)
+    dut.wr_en.value = 0
+    await tb.idle()
+    await tb.read(1)
+    full_recovery = await tb.wait_flag(tb.wrt_clk, dut.full, 0, timeout=FLAG_TIMEOUT_CYCLES)
+
+    # Empty recovery: drain, write one read word, read cycles until ~empty.
+    for _ in range(TIMEOUT_CYCLES):
+        if not await tb.read_cycle():
+            break
+    await FallingEdge(tb.rd_clk)
+    dut.rd_en.value = 0
+    await tb.idle()
+    await tb.write(tb.random_words(tb.writes_per_read))
+    empty_recovery = await tb.wait_flag(tb.rd_clk, dut.empty, 0, timeout=FLAG_TIMEOUT_CYCLES)
+
+    tb.record(full_recovery=full_recovery, empty_recovery=empty_recovery)
+
+@cocotb.test()
+async def run_test_thresholds(dut):
+    tb = TB(dut)
+    if not (hasattr(dut, "prog_full") and hasattr(dut, "prog_empty")):
+        return
+    await tb.reset()
+
+    # Programmable full: words written (one at a time, flags settled) when prog_full asserts.
+    full_value  = int(os.getenv("FULL_VALUE"))
+    empty_value = int(os.getenv("EMPTY_VALUE"))
+    level = 0
+    prog_full_error = None
+    for _ in range(tb.depth):
+        await tb.write(tb.random_words(1))
+        level += 1
+        await tb.idle(4)
+        await ReadOnly()
+        if int(dut.prog_full.value):
+            prog_full_error = level - full_value
+            break
+
+    # Programmable empty: words left (one read at a time) when prog_empty asserts.
+    prog_empty_error = None
+    while level > 0:
+        await tb.read(1)
+        level -= 1
+        await tb.idle(4)
+        await ReadOnly()
+        if int(dut.prog_empty.value):
+            prog_empty_error = level - empty_value
+            break
+
+    tb.record(prog_full_error=prog_full_error, prog_empty_error=prog_empty_error)
+
+# Configurations -----------------------------------------------------------------------------------
+
+sim_dir = os.path.dirname(os.path.realpath(__file__))
+lib_dir = os.path.realpath(os.path.join(sim_dir, "..", "..", "..", "..", "lib"))
+
+DEPTH = 1024
+
+# FIFO primitives simulation models (and the BRAMs they instantiate).
+PRIMITIVE_MODELS = ["FIFO36K.v", "FIFO18KX2.v", "TDP_RAM36K.v", "TDP_RAM18KX2.v"]
+
+def benchmark_configurations():
+    configurations = []
+    for synchronous in [True, False]:
+        for fwft in [False, True]:
+            for data_width_write, data_width_read in [(36, 36), (72, 72), (36, 72), (72, 36)]:
+                for wrt_clk, rd_clk in [(10, 10)] if synchronous else [(10, 10), (10, 15), (15, 10)]:
+                    params = {
+                        "synchronous"             : synchronous,
+                        "first_word_fall_through" : fwft,
+                        "builtin_fifo"            : True,
+                        "full_threshold"          : True,
+                        "empty_threshold"         : True,
+                        "full_value"              : DEPTH - 24,
+                        "empty_value"             : 24,
+                    }
+                    if data_width_write == data_width_read:
+                        params.update({"data_width": data_width_write, "depth": DEPTH})
+                    else:
+                        params.update({"asymmetric": True, "data_width_write": data_width_write,
+                            "data_width_read": data_width_read, "write_depth": DEPTH})
+                    name = "{}_{}_{}x{}_{}-{}".format("sync" if synchronous else "async",
+                        "fwft" if fwft else "std", data_width_write, data_width_read, wrt_clk, rd_clk)
+                    configurations.append({"name": name, "params": params, "wrt_clk": wrt_clk, "rd_clk": rd_clk})
+    return configurations
+
+# Runner -------------------------------------------------------------------------------------------
+
+def run_configuration(configuration, build_dir=None):
+    import cocotb_test.simulator
+
+    if lib_dir not in sys.path:
+        sys.path.insert(0, lib_dir)
+    import catalog
+
+    name      = configuration["name"]
+    params    = configuration["params"]
+    sim_build = os.path.join(build_dir or os.path.join(sim_dir, "sim_build"), name)
+    os.makedirs(sim_build, exist_ok=True)
+
+    # Generate the FIFO wrapper.
+    result  = catalog.generate("fifo_generator", params, build_dir=sim_build, build_name="fifo_bench", version="v1_0")
+    summary = result.summary
+
+    # Simulate it with the FIFO primitives models.
+    results_file = os.path.join(sim_build, "results.json")
+    if os.path.exists(results_file):
+        os.remove(results_file)
+    sim = os.environ.setdefault("SIM", "verilator")
+    cocotb_test.simulator.run(
+        python_search   = [sim_dir],
+        verilog_sources = [result.wrapper] + [os.path.join(sim_dir, f) for f in PRIMITIVE_MODELS],
+        toplevel        = "fifo_bench",
+        module          = "test_fifo_benchmark",
+        sim_build       = sim_build,
+        compile_args    = ["-Wno-fatal", "--timing"] if sim == "verilator" else [],
+        extra_env       = {
+            "SYNCHRONOUS"  : str(int(params["synchronous"])),
+            "FWFT"         : str(int(params["first_word_fall_through"])),
+            "DEPTH"        : str(DEPTH),
+            "FULL_VALUE"   : str(params["full_value"]),
+            "EMPTY_VALUE"  : str(params["empty_value"]),
+            "WRT_CLK"      : str(configuration["wrt_clk"]),
+            "RD_CLK"       : str(configuration["rd_clk"]),
+            "RESULTS_FILE" : results_file,
+        },
+    )
+
+    row = {
+        "name"             : name,
+        "synchronous"      : params["synchronous"],
+        "fwft"             : params["first_word_fall_through"],
+        "data_width_write" : params.get("data_width_write", params.get("data_width")),
+        "data_width_read"  : params.get("data_width_read",  params.get("data_width")),
+        "depth"            : DEPTH,
+        "wrt_clk"          : configuration["wrt_clk"],
+        "rd_clk"           : configuration["rd_clk"],
+        "summary_latency"  : summary.get("Read Latency (clock cycles)"),
+    }
+    with open(results_file, "r") as f:
+        row.update(json.load(f))
+    return row
+
+def write_results(rows, json_filename=None, csv_filename=None):
+    if json_filename is not None:
+        with open(json_filename, "w") as f:
+            json.dump(rows, f, indent=4)
+    if csv_filename is not None:
+        fields = []
+        for row in rows:
+            fields += [k for k in row if k not in fields]
+        with open(csv_filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+# cocotb-test --------------------------------------------------------------------------------------
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+    @pytest.mark.parametrize("configuration", benchmark_configurations(), ids=lambda c: c["name"])
+    def test_fifo_benchmark(configuration):
+        row = run_configuration(configuration)
+        # Both sides measured.
+        assert row.get("write_words_per_cycle") is not None and row.get("read_words_per_cycle") is not None
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="FIFO Generator benchmark.")
+    parser.add_argument("--json",      default="fifo_benchmark.json", help="JSON results file.")
+    parser.add_argument("--csv",       default="fifo_benchmark.csv",  help="CSV results file.")
+    parser.add_argument("--build-dir", default=None,                  help="Build/simulation directory (default: sim_build).")
+    parser.add_argument("--filter",    default="",                    help="Only run the configurations whose name contains this string.")
+    args = parser.parse_args()
+
+    rows = []
+    for configuration in benchmark_configurations():
+        if args.filter not in configuration["name"]:
+            continue
+        print(f"Benchmarking {configuration['name']}", file=sys.stderr)
+        try:
+            row = run_configuration(configuration, args.build_dir)
+        except SystemExit as e:
+            # cocotb-test failure (wrapper not compiled by the simulator, failed test): recorded, next one.
+            row = {"name": configuration["name"], "error": str(e)}
+        rows.append(row)
+        write_results(rows, args.json, args.csv)
+
+if __name__ == "__main__":
+    main()
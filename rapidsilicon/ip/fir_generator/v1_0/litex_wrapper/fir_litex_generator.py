@@ -6,7 +6,6 @@
 # SPDX-License-Identifier: MIT
 #
 
-import datetime
 import logging
 import math
 from migen import *
@@ -61,11 +60,6 @@ def decimal_to_fixed_point(decimal_number, integer=4, fraction=4, signed=False):
         binary_result = sign_extension + binary_result
     return int(binary_result, 2)
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
 
 # FIR Generator ---------------------------------------------------------------------------------------
 class FIR(Module):
@@ -8,18 +8,12 @@
 # LiteX wrapper around RS OCLA IP CORE ocla.v
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
 
 def update_list(n):
     # Create a fixed-size list with zeros
@@ -52,7 +46,6 @@ def groupArguments(arguments):
     return combinedIndexes
 
 
-
 if1_probes  = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
 if2_probes  = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
 if3_probes  = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
@@ -70,7 +63,6 @@ if14_probes = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
 if15_probes = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
 
 
-
 # AXI LITE OCLA -------------------------------------------------------------------------------------
 class AXILITEOCLA(Module):
     def __init__(self, platform, 
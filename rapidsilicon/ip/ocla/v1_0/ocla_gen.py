@@ -10,8 +10,6 @@ import logging
 from pathlib import Path
 import argparse
 
-from datetime import datetime
-
 from litex_wrapper.ocla_litex_wrapper import AXILITEOCLA
 
 from migen import *
@@ -598,13 +596,14 @@ class AXILITEOCLAWrapper(Module):
              #   self.comb += s_axil.connect_to_pads(platform.request("s_axil"), mode="slave")
     
 # Build --------------------------------------------------------------------------------------------
-def main():
+def main(argv=None, params=None):
     parser = argparse.ArgumentParser(description="AXI LITE OCLA CORE")
 
     # Import Common Modules.
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
 
-    sys.path.append(common_path)
+    if common_path not in sys.path:
+        sys.path.append(common_path)
 
     from common import IP_Builder
     # Parameter Dependency dictionary a 2 b 3 c 4  9
@@ -658,7 +657,7 @@ def main():
     json_group.add_argument("--json",                                           help="Generate Core from JSON File")
     json_group.add_argument("--json-template",  action="store_true",            help="Generate JSON Template")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     details =  {   "IP details": {
     'Name' : 'OCLA',
@@ -670,8 +669,8 @@ def main():
     probe_size = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
 
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version = "v1_0")
         num_elements  =len(vars(args))
 
@@ -768,11 +767,15 @@ def main():
 
     
     if args.json_template:
-        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
+        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary, args=args)
+        # Template only: no elaboration.
+        if not args.build:
+            return rs_builder.result(version="v1_0", summary=summary)
 
         
 
     # Create LiteX Core ----------------------------------------------------------------------------
+    rs_builder.start_phase("elaboration")
     platform   = OSFPGAPlatform( io=[], device="gemini", toolchain="raptor")
     module     = AXILITEOCLAWrapper(platform,
         address_width1     = args.axi1_addr_width,
@@ -804,54 +807,22 @@ def main():
         rs_builder.generate_wrapper(
             platform   = platform,
             module     = module,
-            version  = "v1_0"
+            params     = vars(args),
+            version  = "v1_0",
+            ip_type  = "OCLA"
         )
-        rtl_dir = rs_builder.src_path
-        rtl_dir = rtl_dir + "/ocla_debug_subsystem.sv"
-        f = open(rtl_dir,"r+")
         if args.Sampling_Clock == "MULTIPLE":
-            f.write("`define single_sample_clock \n\n")
-        f.close()
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "ocla", "v1_0", args.build_name, "src",args.build_name + "_v1_0" + ".sv")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"OCLA\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
-        
+            rtl_file = os.path.join(rs_builder.src_path, "ocla_debug_subsystem.sv")
+            rs_builder.stream_edit(rtl_file, rtl_file, defines=["single_sample_clock"])
+
         #build_name = args.build_name.rsplit( ".", 1 )[ 0 ]
         #file = os.path.join(args.build_dir, "rapidsilicon/ip/ocla/v1_0", build_name, "sim/ocla_wrapper_tb.sv")
         #file = Path(file)
         #text = file.read_text()
         #text = text.replace("ocla_wrapper", "%s" % build_name)
         #file.write_text(text)
-        
+
+    return rs_builder.result(version="v1_0", summary=summary)
+
 if __name__ == "__main__":
     main()
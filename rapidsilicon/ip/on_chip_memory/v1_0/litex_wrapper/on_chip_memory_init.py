@@ -0,0 +1,357 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Memory initialization engine shared by the symmetric/asymmetric on chip memories: the memory
+# words are integers, the BRAM INIT/INIT_PARITY vectors are assembled as integers (bytes).
+
+import os
+import mmap
+import logging
+import struct
+import functools
+
+# Memory File --------------------------------------------------------------------------------------
+
+# Formats:
+# - "hex"/"bin" : text, $readmemh/$readmemb style (hexadecimal/binary words, @address directives).
+# - "ihex"      : Intel HEX (byte addresses, extended segment/linear address records).
+# - "elf"       : ELF executable (PT_LOAD segments at their physical byte addresses).
+# - "raw"       : binary image (bytes from memory address 0, firmware build output).
+# The byte images (ihex/elf/raw) are read as words of word_width bits (default: memory width rounded
+# up to bytes) in little/big endian order.
+MEMORY_FILE_BASES      = {"hex": 16, "bin": 2}
+MEMORY_FILE_NAMES      = {"hex": "Hexadecimal", "bin": "Binary", "ihex": "Intel HEX", "elf": "ELF", "raw": "Raw Binary Image"}
+MEMORY_FILE_EXTENSIONS = {
+    ".hex"  : "hex",
+    ".mem"  : "hex",
+    ".bin"  : "bin",
+    ".ihex" : "ihex",
+    ".ihx"  : "ihex",
+    ".elf"  : "elf",
+    ".raw"  : "raw",
+    ".img"  : "raw",
+}
+
+# $readmemh/$readmemb text: digits, x/z, _ separators, @address directives and // comments (any text
+# without control characters).
+READMEM_CHARACTERS = b"0123456789abcdefABCDEFxXzZ_@/ \t\r\n"
+CONTROL_CHARACTERS = bytes(c for c in range(32) if c not in b"\t\r\n") + b"\x7f"
+
+def readmem_text(head):
+    for line in head.split(b"\n"):
+        words, _, comment = line.partition(b"//")
+        if len(words.translate(None, READMEM_CHARACTERS)) or len(comment) != len(comment.translate(None, CONTROL_CHARACTERS)):
+            return False
+    return True
+
+# Format of a memory file, from its extension and first bytes: Intel HEX records start with ':', .bin
+# files are $readmemb text or raw images, ELF files are recognized by their magic number.
+def memory_file_format(file_path, file_extension):
+    with open(file_path, "rb") as f:
+        head = f.read(4096)
+    if head[:4] == b"\x7fELF":
+        return "elf"
+    file_format = MEMORY_FILE_EXTENSIONS.get(file_extension.lower())
+    if file_format == "hex" and head.lstrip()[:1] == b":":
+        return "ihex"
+    if file_format == "bin" and not readmem_text(head):
+        return "raw"
+    return file_format
+
+# Memory Image -------------------------------------------------------------------------------------
+
+# A memory image is a sorted list of segments [address, values]: values (words, or bytes of the byte
+# images) at consecutive addresses. Only the addressed words are stored (sparse images).
+
+# Sorted segments, overlapping/adjacent segments merged (the values of the later segments win).
+def merge_segments(segments):
+    merged = []
+    for address, values in sorted(segments, key=lambda segment: segment[0]):
+        if merged and address <= merged[-1][0] + len(merged[-1][1]):
+            last_address, last_values = merged[-1]
+            offset = address - last_address
+            last_values[offset:offset + len(values)] = values
+        else:
+            merged.append([address, values])
+    return merged
+
+XZ_DIGITS = bytes.maketrans(b"xXzZ", b"0000")
+
+# Word segments of a $readmemh/$readmemb text file (// comments, _ separators, x/z digits read as 0),
+# parsed lazily from the memory mapped file. Words at addresses >= depth are ignored.
+def text_segments(file_path, file_format, width, depth):
+    base     = MEMORY_FILE_BASES[file_format]
+    mask     = (1 << width) - 1
+    segments = []
+    words    = None
+    address  = 0
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return segments
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                for token in line.split(b"//")[0].split():
+                    if token[:1] == b"@":
+                        address = int(token[1:], 16)
+                        words   = None
+                        continue
+                    if address >= depth:
+                        words = None
+                    else:
+                        if words is None:
+                            words = []
+                            segments.append([address, words])
+                        words.append(int(token.translate(None, b"_").translate(XZ_DIGITS), base) & mask)
+                    address += 1
+    return merge_segments(segments)
+
+# Byte segments of an Intel HEX file (data, extended segment/linear address and end of file records).
+def ihex_segments(file_path):
+    segments = []
+    upper    = 0
+    with open(file_path, "r") as f:
+        for n, line in enumerate(f, 1):
+            line = line.strip()
+            if line == "":
+                continue
+            try:
+                record = bytes.fromhex(line[1:]) if line[0] == ":" else b""
+            except ValueError:
+                record = b""
+            if (len(record) < 5) or (len(record) != record[0] + 5) or (sum(record) & 0xff):
+                raise ValueError(f"{file_path}:{n}: Invalid Intel HEX record")
+            address, record_type, data = (record[1] << 8) | record[2], record[3], record[4:-1]
+            if record_type == 0x00:
+                if segments and (segments[-1][0] + len(segments[-1][1]) == upper + address):
+                    segments[-1][1] += data
+                else:
+                    segments.append([upper + address, bytearray(data)])
+            elif record_type == 0x01:
+                break
+            elif record_type == 0x02:
+                upper = int.from_bytes(data, "big") << 4
+            elif record_type == 0x04:
+                upper = int.from_bytes(data, "big") << 16
+    return merge_segments(segments)
+
+# Byte segments of the PT_LOAD program segments of an ELF file (32/64 bits, little/big endian).
+def elf_segments(file_path):
+    segments = []
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if (len(mm) < 0x40) or (mm[:4] != b"\x7fELF") or (mm[4] not in [1, 2]) or (mm[5] not in [1, 2]):
+            raise ValueError(f"{file_path}: Invalid ELF file")
+        elf64  = mm[4] == 2
+        endian = "<" if mm[5] == 1 else ">"
+        if elf64:
+            phoff,             = struct.unpack_from(endian + "Q",  mm, 0x20)
+            phentsize, phnum   = struct.unpack_from(endian + "HH", mm, 0x36)
+        else:
+            phoff,             = struct.unpack_from(endian + "I",  mm, 0x1c)
+            phentsize, phnum   = struct.unpack_from(endian + "HH", mm, 0x2a)
+        if phoff + phnum*phentsize > len(mm):
+            raise ValueError(f"{file_path}: Truncated ELF file")
+        for i in range(phnum):
+            if elf64:
+                p_type, _, p_offset, _, p_paddr, p_filesz = struct.unpack_from(endian + "IIQQQQ", mm, phoff + i*phentsize)
+            else:
+                p_type, p_offset, _, p_paddr, p_filesz    = struct.unpack_from(endian + "IIIII",  mm, phoff + i*phentsize)
+            # PT_LOAD (the .bss part of the segment, not in the file, is left to 0).
+            if (p_type == 1) and (p_filesz > 0):
+                segments.append([p_paddr, bytearray(mm[p_offset:p_offset + p_filesz])])
+    return merge_segments(segments)
+
+# Word segments of byte segments: the byte at base_address is the first byte of word 0, bytes outside
+# of [base_address, base_address + depth*word_bytes) are ignored.
+def byte_to_word_segments(segments, width, depth, word_width, byteorder, base_address):
+    word_bytes = word_width//8 if word_width else -(-width//8)
+    mask       = (1 << width) - 1
+    end        = depth*word_bytes
+    # Byte offsets in the memory, runs sharing a word merged (zeros in between).
+    runs = []
+    for address, data in segments:
+        start = max(address - base_address, 0)
+        stop  = min(address - base_address + len(data), end)
+        if start >= stop:
+            continue
+        data = data[start - (address - base_address):stop - (address - base_address)]
+        if runs and (start//word_bytes <= (runs[-1][0] + len(runs[-1][1]) - 1)//word_bytes):
+            runs[-1][1] += bytes(start - (runs[-1][0] + len(runs[-1][1]))) + data
+        else:
+            runs.append([start, bytearray(data)])
+    words = []
+    for start, data in runs:
+        # Aligned on words (zeros before/after).
+        data = bytes(start % word_bytes) + data
+        data = data + bytes(-len(data) % word_bytes)
+        words.append([start//word_bytes, [int.from_bytes(data[i:i + word_bytes], byteorder) & mask for i in range(0, len(data), word_bytes)]])
+    return words
+
+# Memory image (word segments) of a memory file, for a width x depth memory.
+def memory_image(file_path, file_format, width, depth, word_width=0, byteorder="little", base_address=0):
+    if file_format in MEMORY_FILE_BASES:
+        return text_segments(file_path, file_format, width, depth)
+    if file_format == "ihex":
+        segments = ihex_segments(file_path)
+    elif file_format == "elf":
+        segments = elf_segments(file_path)
+    else:
+        # Raw image: bytes from memory address 0.
+        with open(file_path, "rb") as f:
+            segments = [[base_address, bytearray(f.read(depth*(word_width//8 if word_width else -(-width//8))))]]
+    return byte_to_word_segments(segments, width, depth, word_width, byteorder, base_address)
+
+# Number of words of a memory image.
+def image_size(segments):
+    return sum(len(words) for address, words in segments)
+
+# Memory image of a width x depth memory from its initialization file ([] when there is no file or
+# when it can't be loaded, error logged).
+def memory_converter(file_path, file_extension, width, depth, word_width=0, byteorder="little", base_address=0):
+    if file_path == "":
+        return []
+    logger = logging.getLogger("\tON CHIP MEMORY")
+    logger.info("========== MEMORY INITIALIZATION STARTED ==========")
+    logging.info("Reading Memory File")
+    file_format = memory_file_format(file_path, file_extension)
+    if (file_format is None):
+        logging.error("Memory Initialization Failed. Invalid File Format")
+        return []
+    logging.info(f"Found ({file_extension}) File, {MEMORY_FILE_NAMES[file_format]} Format")
+    logging.info("Processing")
+    try:
+        segments = memory_image(file_path, file_format, width, depth, word_width, byteorder, base_address)
+    except ValueError as e:
+        logging.error(f"Memory Initialization Failed. {e}")
+        return []
+    if segments:
+        logging.info("Memory Initialized Successfully !!!")
+        logger.info("===================================================")
+    return segments
+
+# Words of a memory image, zeros on the vacant addresses.
+def image_words(segments, depth):
+    words = [0]*depth
+    for address, values in segments:
+        words[address:address + len(values)] = values
+    return words
+
+# BRAM Lanes ---------------------------------------------------------------------------------------
+
+# A lane is the slice of a memory word stored at one address of a BRAM: 36/18/9 bits (8 data bits and
+# 1 parity bit per byte, parity in the MSB) or 4/2/1 bits (data only).
+def lane_data_width(width):
+    return 8*(width//9) if width >= 9 else width
+
+def lane_parity_width(width):
+    return width//9
+
+# Packing ------------------------------------------------------------------------------------------
+
+# Packing of all the lanes of the words at once, from a bytes image of the words: a data byte, a parity
+# bit or a 4/2/1 bits lane is a field of at most 8 bits of the words, gathered for all the words by one
+# or two strided slices of the image (C loops), packed with integer operations.
+
+# Translation table of bytes to their bits [shift + n - 1 : shift].
+@functools.lru_cache(maxsize=None)
+def field_table(shift, n):
+    return bytes([(b >> shift) & ((1 << n) - 1) for b in range(256)])
+
+# Bytes image of words: words[i] in little endian at bytes [(i+1)*stride - 1 : i*stride].
+def words_image(words, stride):
+    return b"".join([word.to_bytes(stride, "little") for word in words])
+
+# Bits [bit + n - 1 : bit] (n <= 8) of the words of an image, one byte per word.
+def image_field(image, stride, bit, n):
+    byte, shift = divmod(bit, 8)
+    field = image[byte::stride].translate(field_table(shift, n))
+    if (shift + n > 8) and (byte + 1 < stride):
+        high  = image[byte + 1::stride].translate(field_table(0, shift + n - 8))
+        field = (int.from_bytes(field, "little") | (int.from_bytes(high, "little") << (8 - shift))).to_bytes(len(field), "little")
+    return field
+
+# INIT vector of n bits fields (one per byte, n = 1/2/4/8): fields[i] at bits [i*n + n - 1 : i*n].
+def pack_fields(fields, n):
+    if n == 8:
+        return int.from_bytes(fields, "little")
+    per_byte = 8//n
+    fields   = fields + bytes(-len(fields) % per_byte)
+    packed   = 0
+    for i in range(per_byte):
+        packed |= int.from_bytes(fields[i::per_byte], "little") << (n*i)
+    return packed
+
+# Merged n bits fields (one per byte): fields[b] at bits [b*n + n - 1 : b*n] of each byte.
+def merge_fields(fields, n):
+    if len(fields) == 1:
+        return fields[0]
+    merged = 0
+    for b, field in enumerate(fields):
+        merged |= int.from_bytes(field, "little") << (n*b)
+    return merged.to_bytes(len(fields[0]), "little")
+
+# INIT and INIT_PARITY of the lanes of width bits of the words, lane k being the bits
+# [(k+1)*width - 1 : k*width]. Data bytes [7:0], [16:9], [25:18], [34:27] and parity bits 8, 17, 26, 35
+# of the 36/18/9 bits lanes are interleaved/merged in address order.
+def lanes_inits(words, width, lanes):
+    stride = (lanes*width + 7)//8
+    image  = words_image(words, stride)
+    inits  = []
+    for k in range(lanes):
+        lo = k*width
+        if width < 9:
+            inits.append((pack_fields(image_field(image, stride, lo, width), width), 0))
+            continue
+        nbytes = width//9
+        data   = bytearray(len(words)*nbytes)
+        parity = []
+        for b in range(nbytes):
+            data[b::nbytes] = image_field(image, stride, lo + 9*b, 8)
+            parity.append(image_field(image, stride, lo + 9*b + 8, 1))
+        inits.append((int.from_bytes(data, "little"), pack_fields(merge_fields(parity, 1), nbytes)))
+    return inits
+
+# BRAM Init ----------------------------------------------------------------------------------------
+
+# INIT/INIT_PARITY of a BRAM, filled address by address with lanes of the memory words.
+class BRAMInit:
+    def __init__(self):
+        self.values = []
+        self.width  = 0
+
+    # Appends the lane-th width bits lane of word (lane 0 in the LSBs) at the next address.
+    def append(self, word, lane, width):
+        self.values.append((word >> (lane*width)) & ((1 << width) - 1))
+        self.width = width
+
+    def init(self):
+        if not self.values:
+            return 0, 0
+        return lanes_inits(self.values, self.width, 1)[0]
+
+# INIT and INIT_PARITY lists of BRAMs.
+def bram_inits(brams):
+    inits = [bram.init() for bram in brams]
+    return [init for init, init_parity in inits], [init_parity for init, init_parity in inits]
+
+# Memory image striped over blocks x lanes BRAMs: block b holds the addresses [b*depth, (b+1)*depth),
+# lane k the bits [(k+1)*width - 1 : k*width] of the words. BRAMs ordered by block, then by lane.
+# Each segment only packs the words of the BRAMs it addresses, the other BRAMs are left to 0.
+def striped_inits(segments, width, lanes, depth, blocks=1):
+    data_width   = lane_data_width(width)
+    parity_width = lane_parity_width(width)
+    INIT         = [0]*(blocks*lanes)
+    INIT_PARITY  = [0]*(blocks*lanes)
+    for address, words in segments:
+        start = 0
+        while (start < len(words)) and (address + start < blocks*depth):
+            b, offset = divmod(address + start, depth)
+            chunk     = words[start:start + depth - offset]
+            for k, (init, init_parity) in enumerate(lanes_inits(chunk, width, lanes)):
+                INIT[b*lanes + k]        |= init        << (offset*data_width)
+                INIT_PARITY[b*lanes + k] |= init_parity << (offset*parity_width)
+            start += len(chunk)
+    return INIT, INIT_PARITY
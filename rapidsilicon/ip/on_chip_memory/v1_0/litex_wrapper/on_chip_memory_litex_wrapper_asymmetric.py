@@ -14,77 +14,21 @@ from migen import *
 
 from litex.soc.interconnect.axi import *
 
-from litex_wrapper.on_chip_memory_litex_wrapper_symmetric import OCM_SYM
+from litex_wrapper.on_chip_memory_init import BRAMInit, bram_inits, memory_converter, image_size, image_words
 
 # On Chip Memory ------------------------------------------------------------------------------------------
 class OCM_ASYM(Module):
     
-    def memory_init(self, file_path, file_extension, m, n, smaller_width, large_depth, memory_type, large_width):
-        binary_data =  OCM_SYM.memory_converter(self, file_path, file_extension)
+    def memory_init(self, m, n, smaller_width, large_depth, memory_type, large_width):
+        # Words of the smaller width, zeros on vacant addresses (the BRAMs are filled word by word, a
+        # sparse image is expanded over the whole memory)
+        words = image_words(self.segments, large_depth)
         
-        sram        = {}
-        INIT        = []
-        INIT_PARITY = []
-        
-        # Empty File Path
-        if (file_path == "") or (self.line_count == 0):
-            return "0"
-        
-        # If File Path Exists
         if self.write_depth_A in [1024, 2048, 4096, 8192, 16384, 32768]:
             
-            ###################################################################################################
-            # Appending zeros
-            if (len(self.binary_data) > large_depth):
-                lines = large_depth
-            else:
-                lines = self.line_count
-            
-            if (smaller_width == 9):
-                for i in range(lines):
-                    if len(self.binary_data[i]) < smaller_width:
-                        self.binary_data[i] = '0' * (smaller_width - len(self.binary_data[i])) + self.binary_data[i]
-                    else:
-                        self.binary_data[i] = self.binary_data[i]
-                        
-                # Appending '0' on vacant addresses
-                x_data = large_depth - self.line_count
-                for i in range(x_data):
-                    self.binary_data.append((smaller_width + (9-(smaller_width % 9))) * '0')
-            
-            elif (smaller_width == 18):
-                for i in range(lines):
-                    if len(self.binary_data[i]) < smaller_width:
-                        self.binary_data[i] = '0' * (smaller_width - len(self.binary_data[i])) + self.binary_data[i]
-                    else:
-                        self.binary_data[i] = self.binary_data[i]
-                    
-                # Appending '0' on vacant addresses
-                x_data = large_depth - self.line_count
-                for i in range(x_data):
-                    self.binary_data.append((smaller_width + (18-(smaller_width % 18))) * '0')
-            elif (smaller_width >= 36):
-                for i in range(lines):
-                    if len(self.binary_data[i]) < smaller_width:
-                        self.binary_data[i] = '0' * (smaller_width - len(self.binary_data[i])) + self.binary_data[i]
-                    else:
-                        self.binary_data[i] = self.binary_data[i]
-                    
-                # Appending '0' on vacant addresses
-                x_data = large_depth - self.line_count
-                for i in range(x_data):
-                    self.binary_data.append((smaller_width + (36-(smaller_width % 36))) * '0')
-            
             ###################################################################################################
             # BRAM instance creation
-            f = 0
-            for i in range(n):
-                for j in range(m):
-                    sram[f"data_{f}"]          = []
-                    sram[f"parity_{f}"]        = []  
-                    sram[f"init_{f}"]          = []
-                    sram[f"init_parity_{f}"]   = []
-                    f = f+1
+            brams = [BRAMInit() for i in range(m*n)]
             
             ###################################################################################################
             # Write Wider for SP
@@ -95,20 +39,14 @@ class OCM_ASYM(Module):
                         if self.write_width_A <= 18:
                             for i in range(large_depth):
                                 # data from .hex file
-                                bits = self.binary_data[i] 
+                                word = words[i]
                                 c = i % m # Toggling between BRAMs
                                 if smaller_width == 9:
-                                    bits = self.binary_data[i]  
-                                    sram[f"data_{c}"].append(bits[1:9])  
-                                    sram[f"parity_{c}"].append(bits[0])              
+                                    brams[c].append(word, 0, 9)
                                 elif smaller_width == 18:
-                                    bits = self.binary_data[i]
-                                    sram[f"data_{c}"].append(bits[1:9]+bits[10:18]) 
-                                    sram[f"parity_{c}"].append(bits[0]+bits[9])
+                                    brams[c].append(word, 0, 18)
                                 else:
-                                    bits = self.binary_data[i]
-                                    sram[f"data_{c}"].append(bits[1:9]+bits[10:18]+bits[19:27]+bits[28:36])  
-                                    sram[f"parity_{c}"].append(bits[0]+bits[9]+bits[18]+bits[27])
+                                    brams[c].append(word, 0, 36)
 
                         # write width greater than or equal to 36
                         else:
@@ -117,7 +55,7 @@ class OCM_ASYM(Module):
                             r = 0
                             for i in range(large_depth):
                                 # data from .hex file
-                                bits = self.binary_data[i] 
+                                word = words[i]
                                 if ((i % 2) == 0): # for writing two lines data in 1 BRAM
                                     q = q +1
                                 if ((i % 4) == 0): # for writing four lines data in 1 BRAM
@@ -126,54 +64,48 @@ class OCM_ASYM(Module):
                                     p = 0
                                     q = 0
                                     r = 0
-                                for x in range(math.ceil(smaller_width/36)-1, -1, -1): # BRAM ratio loop
+                                for x in range(math.ceil(smaller_width/36)): # BRAM ratio loop
                                     if smaller_width == 9: # in 1 BRAM 
-                                        sram[f"data_{r}"].append(bits[1:9])  
-                                        sram[f"parity_{r}"].append(bits[0]) 
+                                        brams[r].append(word, 0, 9)
                                     elif smaller_width == 18: # in 1 BRAM
-                                        sram[f"data_{q}"].append(bits[1:9]+bits[10:18]) 
-                                        sram[f"parity_{q}"].append(bits[0]+bits[9])
+                                        brams[q].append(word, 0, 18)
                                     elif smaller_width >= 36:
-                                        sram[f"data_{p}"].append(bits[(x*36)+1:(x*36)+9]+bits[(x*36)+10:(x*36)+18]+bits[(x*36)+19:(x*36)+27]+bits[(x*36)+28:(x*36)+36])  
-                                        sram[f"parity_{p}"].append(bits[(x*36)+0]+bits[(x*36)+9]+bits[(x*36)+18]+bits[(x*36)+27])
+                                        brams[p].append(word, x, 36)
                                         p = p + 1 # incrementing BRAM number
 
                     elif (self.write_depth_A == 2048):
                         p = 0
                         r = 0
                         for i in range(large_depth):
-                            bits = self.binary_data[i]
+                            word = words[i]
                             if ((i % 2) == 0):
                                 r = r + 1
                             if (i % math.ceil((m*18)/smaller_width) == 0):
                                 p = 0
                                 r = 0
-                            for x in range(math.ceil(smaller_width/18)-1, -1, -1):
+                            for x in range(math.ceil(smaller_width/18)):
                                 if smaller_width == 9:
-                                    sram[f"data_{r}"].append(bits[1:9])  
-                                    sram[f"parity_{r}"].append(bits[0]) 
+                                    brams[r].append(word, 0, 9)
                                 elif smaller_width >= 18:
-                                    sram[f"data_{p}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{p}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[p].append(word, x, 18)
                                     p = p + 1
 
                     elif (self.write_depth_A == 4096):
                         p = 0
                         for i in range(large_depth):
-                            bits = self.binary_data[i]
+                            word = words[i]
                             if (i % int((m*9)/smaller_width) == 0):
                                 p = 0
-                            for x in range(math.ceil(smaller_width/9)-1, -1, -1):
+                            for x in range(math.ceil(smaller_width/9)):
                                 if smaller_width >= 9:
-                                    sram[f"data_{p}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{p}"].append(bits[(x*9)+0])
+                                    brams[p].append(word, x, 9)
                                     p = p + 1
 
                     elif (self.write_depth_A in [8192, 16384, 32768]):
                         for j in range(n):
                             for i in range(int(large_depth/n)):
                                 
-                                bits = self.binary_data[i+(j*int(large_depth/n))]
+                                word = words[i+(j*int(large_depth/n))]
 
                                 p = (i % m) + (j*m)
                                 
@@ -181,12 +113,10 @@ class OCM_ASYM(Module):
 
                                 for x in range(q-1, -1, -1):
                                     if smaller_width == 9:
-                                        sram[f"data_{p}"].append(bits[(x*9)+1:(x*9)+9])  
-                                        sram[f"parity_{p}"].append(bits[(x*9)+0])
+                                        brams[p].append(word, x, 9)
                                     elif smaller_width >= 18:
                                         c = (i % int(self.write_width_A/self.read_width_B))*q + (j*m) + x
-                                        sram[f"data_{c}"].append(bits[((q-x-1)*9)+1:((q-x-1)*9)+9])  
-                                        sram[f"parity_{c}"].append(bits[((q-x-1)*9)+0])
+                                        brams[c].append(word, x, 9)
 
                 ################################################################################################
                 # Read Wider for SP
@@ -207,31 +137,25 @@ class OCM_ASYM(Module):
                         width = 9
 
                     for i in range(large_depth):
-                        bits = self.binary_data[i]
+                        word = words[i]
                         j = math.ceil(smaller_width/width)
                         for x in range(math.ceil(smaller_width/width)):
                             j = j - 1
                             if self.read_depth_A <= 1024:
                                 if self.write_width_A >= 36:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*36)+1:(x*36)+9]+bits[(x*36)+10:(x*36)+18]+bits[(x*36)+19:(x*36)+27]+bits[(x*36)+28:(x*36)+36])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*36)+0]+bits[(x*36)+9]+bits[(x*36)+18]+bits[(x*36)+27])
+                                    brams[j*m+(i%m)].append(word, j, 36)
                                 elif self.write_width_A == 18:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[j*m+(i%m)].append(word, j, 18)
                                 elif self.write_width_A == 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                             elif self.read_depth_A == 2048:
                                 if self.write_width_A >= 18:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[j*m+(i%m)].append(word, j, 18)
                                 elif self.write_width_A == 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                             elif self.read_depth_A in [4096, 8192, 16384, 32768]:
                                 if self.write_width_A >= 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                 
                 
             ################################################################################################
@@ -242,20 +166,14 @@ class OCM_ASYM(Module):
                         if self.write_width_A <= 18:
                             for i in range(large_depth):
                                 # data from .hex file
-                                bits = self.binary_data[i] 
+                                word = words[i]
                                 c = i % m # Toggling between BRAMs
                                 if smaller_width == 9:
-                                    bits = self.binary_data[i]  
-                                    sram[f"data_{c}"].append(bits[1:9])  
-                                    sram[f"parity_{c}"].append(bits[0])              
+                                    brams[c].append(word, 0, 9)
                                 elif smaller_width == 18:
-                                    bits = self.binary_data[i]
-                                    sram[f"data_{c}"].append(bits[1:9]+bits[10:18]) 
-                                    sram[f"parity_{c}"].append(bits[0]+bits[9])
+                                    brams[c].append(word, 0, 18)
                                 else:
-                                    bits = self.binary_data[i]
-                                    sram[f"data_{c}"].append(bits[1:9]+bits[10:18]+bits[19:27]+bits[28:36])  
-                                    sram[f"parity_{c}"].append(bits[0]+bits[9]+bits[18]+bits[27])
+                                    brams[c].append(word, 0, 36)
                         # write width greater than or equal to 36
                         else:
                             p = 0
@@ -263,7 +181,7 @@ class OCM_ASYM(Module):
                             r = 0
                             for i in range(large_depth):
                                 # data from .hex file
-                                bits = self.binary_data[i] 
+                                word = words[i]
                                 if ((i % 2) == 0): # for writing two lines data in 1 BRAM
                                     q = q +1
                                 if ((i % 4) == 0): # for writing four lines data in 1 BRAM
@@ -272,54 +190,48 @@ class OCM_ASYM(Module):
                                     p = 0
                                     q = 0
                                     r = 0
-                                for x in range(math.ceil(smaller_width/36)-1, -1, -1): # BRAM ratio loop
+                                for x in range(math.ceil(smaller_width/36)): # BRAM ratio loop
                                     if smaller_width == 9: # in 1 BRAM 
-                                        sram[f"data_{r}"].append(bits[1:9])  
-                                        sram[f"parity_{r}"].append(bits[0]) 
+                                        brams[r].append(word, 0, 9)
                                     elif smaller_width == 18: # in 1 BRAM
-                                        sram[f"data_{q}"].append(bits[1:9]+bits[10:18]) 
-                                        sram[f"parity_{q}"].append(bits[0]+bits[9])
+                                        brams[q].append(word, 0, 18)
                                     elif smaller_width >= 36:
-                                        sram[f"data_{p}"].append(bits[(x*36)+1:(x*36)+9]+bits[(x*36)+10:(x*36)+18]+bits[(x*36)+19:(x*36)+27]+bits[(x*36)+28:(x*36)+36])  
-                                        sram[f"parity_{p}"].append(bits[(x*36)+0]+bits[(x*36)+9]+bits[(x*36)+18]+bits[(x*36)+27])
+                                        brams[p].append(word, x, 36)
                                         p = p + 1 # incrementing BRAM number
                     
                     elif (self.write_depth_A == 2048):
                         p = 0
                         r = 0
                         for i in range(large_depth):
-                            bits = self.binary_data[i]
+                            word = words[i]
                             if ((i % 2) == 0):
                                 r = r + 1
                             if (i % math.ceil((m*18)/smaller_width) == 0):
                                 p = 0
                                 r = 0
-                            for x in range(math.ceil(smaller_width/18)-1, -1, -1):
+                            for x in range(math.ceil(smaller_width/18)):
                                 if smaller_width == 9:
-                                    sram[f"data_{r}"].append(bits[1:9])  
-                                    sram[f"parity_{r}"].append(bits[0]) 
+                                    brams[r].append(word, 0, 9)
                                 elif smaller_width >= 18:
-                                    sram[f"data_{p}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{p}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[p].append(word, x, 18)
                                     p = p + 1
                                     
                     elif (self.write_depth_A == 4096):
                         p = 0
                         for i in range(large_depth):
-                            bits = self.binary_data[i]
+                            word = words[i]
                             if (i % int((m*9)/smaller_width) == 0):
                                 p = 0
-                            for x in range(math.ceil(smaller_width/9)-1, -1, -1):
+                            for x in range(math.ceil(smaller_width/9)):
                                 if smaller_width >= 9:
-                                    sram[f"data_{p}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{p}"].append(bits[(x*9)+0])
+                                    brams[p].append(word, x, 9)
                                     p = p + 1
                                     
                     elif (self.write_depth_A in [8192, 16384, 32768]):
                         for j in range(n):
                             for i in range(int(large_depth/n)):
                                 
-                                bits = self.binary_data[i+(j*int(large_depth/n))]
+                                word = words[i+(j*int(large_depth/n))]
 
                                 p = (i % m) + (j*m)
                                 
@@ -327,12 +239,10 @@ class OCM_ASYM(Module):
 
                                 for x in range(q-1, -1, -1):
                                     if smaller_width == 9:
-                                        sram[f"data_{p}"].append(bits[(x*9)+1:(x*9)+9])  
-                                        sram[f"parity_{p}"].append(bits[(x*9)+0])
+                                        brams[p].append(word, x, 9)
                                     elif smaller_width >= 18:
                                         c = (i % int(self.write_width_A/self.read_width_B))*q + (j*m) + x
-                                        sram[f"data_{c}"].append(bits[((q-x-1)*9)+1:((q-x-1)*9)+9])  
-                                        sram[f"parity_{c}"].append(bits[((q-x-1)*9)+0])
+                                        brams[c].append(word, x, 9)
 
                 elif (self.write_width_A < self.read_width_B): # Read Wider      
                     if self.read_depth_B <= 1024:
@@ -351,31 +261,25 @@ class OCM_ASYM(Module):
                         width = 9
                         
                     for i in range(large_depth):
-                        bits = self.binary_data[i]
+                        word = words[i]
                         j = math.ceil(smaller_width/width)
                         for x in range(math.ceil(smaller_width/width)):
                             j = j - 1
                             if self.read_depth_B <= 1024:
                                 if self.write_width_A >= 36:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*36)+1:(x*36)+9]+bits[(x*36)+10:(x*36)+18]+bits[(x*36)+19:(x*36)+27]+bits[(x*36)+28:(x*36)+36])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*36)+0]+bits[(x*36)+9]+bits[(x*36)+18]+bits[(x*36)+27])
+                                    brams[j*m+(i%m)].append(word, j, 36)
                                 elif self.write_width_A == 18:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[j*m+(i%m)].append(word, j, 18)
                                 elif self.write_width_A == 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                             elif self.read_depth_B == 2048:
                                 if self.write_width_A >= 18:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*18)+1:(x*18)+9]+bits[(x*18)+10:(x*18)+18])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*18)+0]+bits[(x*18)+9])
+                                    brams[j*m+(i%m)].append(word, j, 18)
                                 elif self.write_width_A == 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                             elif self.read_depth_B in [4096, 8192, 16384, 32768]:
                                 if self.write_width_A >= 9:
-                                    sram[f"data_{j*m+(i%m)}"].append(bits[(x*9)+1:(x*9)+9])  
-                                    sram[f"parity_{j*m+(i%m)}"].append(bits[(x*9)+0])
+                                    brams[j*m+(i%m)].append(word, j, 9)
                                     
             elif (memory_type == "True_Dual_Port"):
                 r = 0
@@ -383,7 +287,7 @@ class OCM_ASYM(Module):
                 y = math.ceil(large_depth/n)
                 for a in range(n):
                     for i in range(y):
-                        bits = self.binary_data[i + (y * a)]
+                        word = words[i + (y * a)]
                         if ((i % 2) == 0): # for writing two lines data in 1 BRAM
                             q = q +1
                         if ((i % 4) == 0): # for writing four lines data in 1 BRAM
@@ -395,151 +299,30 @@ class OCM_ASYM(Module):
                         for x in range(d-1, -1, -1):
                             if smaller_width == 9: # in 1 BRAM 
                                 e = r + a * m
-                                sram[f"data_{e}"].append(bits[1:9])  
-                                sram[f"parity_{e}"].append(bits[0]) 
+                                brams[e].append(word, 0, 9)
                             elif smaller_width == 18: # in 1 BRAM
                                 g = q + a * m
-                                sram[f"data_{g}"].append(bits[1:9]+bits[10:18]) 
-                                sram[f"parity_{g}"].append(bits[0]+bits[9])
+                                brams[g].append(word, 0, 18)
                             elif smaller_width >= 36:
                                 c = ((i%int(large_width/smaller_width))*d + (x+a*m))
-                                sram[f"data_{c}"].append(bits[(x*36)+1:(x*36)+9]+bits[(x*36)+10:(x*36)+18]+bits[(x*36)+19:(x*36)+27]+bits[(x*36)+28:(x*36)+36])  
-                                sram[f"parity_{c}"].append(bits[(x*36)+0]+bits[(x*36)+9]+bits[(x*36)+18]+bits[(x*36)+27])
+                                brams[c].append(word, d-1-x, 36)
 
             ##############################################################################################
             # Data allocation to corresponding BRAM
-            f = 0
-            for i in range(n):
-                for j in range(m): # appending distributed data into corresponding BRAM
-                    sram[f"init_{f}"]           = "".join(sram[f"data_{f}"][::-1]) # inverting indexing of list
-                    sram[f"init_parity_{f}"]    = "".join(sram[f"parity_{f}"][::-1]) # inverting indexing of list
-                    INIT.append(sram[f"init_{f}"])
-                    INIT_PARITY.append(sram[f"init_parity_{f}"])
-                    f = f+1
-                    
-            logging.info("Memory Initialized Successfully !!!")
-            self.logger.info(f"===================================================")
+            INIT, INIT_PARITY = bram_inits(brams)
             return INIT, INIT_PARITY
     
-    def __init__(self, write_width_A, write_width_B, read_width_A, read_width_B, memory_type, common_clk, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode):
-
-        self.write_depth_A  = write_depth_A
-        self.write_width_A  = write_width_A
-        self.read_depth_A   = read_depth_A
-        self.read_depth_B   = read_depth_B
-        
-        self.write_width_B  = write_width_B
-        self.read_width_A   = read_width_A
-        self.read_width_B   = read_width_B
-        
-        file_path = file_path_hex
-        
-        # Get/Check Parameters.
-        # ---------------------
-        self.logger = logging.getLogger("\tON CHIP MEMORY")
-        
-        self.logger.propagate = True
-        
-        self.logger.info(f"=================== PARAMETERS ====================")
-        
-        self.logger.info(f"MEMORY_TYPE      : {memory_type}")
-        
-        if memory_type == "Single_Port":
-            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
-            self.logger.info(f"READ_WIDTH_A     : {read_width_A}")
-            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
-            self.logger.info(f"READ_DEPTH_A     : {read_depth_A}")
-        
-        elif memory_type == "Simple_Dual_Port":
-            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
-            self.logger.info(f"READ_WIDTH_B     : {read_width_B}")
-            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
-            self.logger.info(f"READ_DEPTH_B     : {read_depth_B}")
-            
-        elif memory_type == "True_Dual_Port":
-            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
-            self.logger.info(f"READ_WIDTH_A     : {read_width_A}")
-            self.logger.info(f"WRITE_WIDTH_B    : {write_width_B}")
-            self.logger.info(f"READ_WIDTH_B     : {read_width_B}")
-            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
-            self.logger.info(f"READ_DEPTH_A     : {read_depth_A}")
-            self.logger.info(f"WRITE_DEPTH_B    : {write_depth_B}")
-            self.logger.info(f"READ_DEPTH_B     : {read_depth_B}")
-        
-        if memory_type != "Single_Port":
-            self.logger.info(f"COMMON_CLK       : {common_clk}")
-        
-        self.logger.info(f"MEMORY_MAPPING       : {memory_mapping}")
-        
+    # BRAM grid (m x n BRAMs) of the memory, computed without elaboration.
+    @staticmethod
+    def bram_grid(memory_type, write_width_A, write_width_B, read_width_A, read_width_B, write_depth_A, read_depth_A, write_depth_B, read_depth_B):
         if (memory_type == "Single_Port"):
-            write_depthA = max(write_depth_A, read_depth_A)
-            self.addr_A     = Signal(math.ceil(math.log2(write_depthA)))
-            msb_write       = math.ceil(math.log2(write_depth_A))
-            msb_SP          = math.ceil(math.log2(write_depthA))
-            self.address    = Signal(15)
-            msb_read        = math.ceil(math.log2(write_depthA))
-            
-        elif (memory_type == "Simple_Dual_Port"):
-            self.addr_A    = Signal(math.ceil(math.log2(write_depth_A)))
-            self.addr_B    = Signal(math.ceil(math.log2(read_depth_B)))
-            msb_read       = math.ceil(math.log2(read_depth_B))
-        
-        elif (memory_type == "True_Dual_Port"):
-            self.address_A    = Signal(15)
-            self.address_B    = Signal(15)
-            depth_A = max(write_depth_A, read_depth_A)
-            depth_B = max(write_depth_B, read_depth_B)
-            self.addr_A    = Signal(math.ceil(math.log2(depth_A)))
-            self.addr_B    = Signal(math.ceil(math.log2(depth_B)))
-
-        msb_A = math.ceil(math.log2(write_depth_A))
-        msb_B = math.ceil(math.log2(write_depth_B))
-        
-        # Port A din/dout
-        self.din_A          = Signal(write_width_A)
-        self.din_A_reg      = Signal(write_width_A)
-        self.dout_A         = Signal(read_width_A)
-        self.dout_A_        = Signal(read_width_A)
-        self.dout_A_reg     = Signal(read_width_A)
-        
-        # Port B din/dout
-        self.din_B          = Signal(write_width_B)
-        self.din_B_reg      = Signal(write_width_B)
-        self.dout_B         = Signal(read_width_B)
-        self.dout_B_        = Signal(read_width_B)
-        self.dout_B_reg     = Signal(read_width_B)
-        
-        # External write/read enables
-        self.wen_A        = Signal(1)
-        self.wen_A_reg    = Signal(1)
-        self.ren_A        = Signal(1)
-        self.ren_A_reg    = Signal(1)
-        self.wen_B        = Signal(1)
-        self.wen_B_reg    = Signal(1)
-        self.ren_B        = Signal(1)
-        self.ren_B_reg    = Signal(1)
-        
-        # Byte Enable
-        self.be_A         = Signal(math.ceil(write_width_A/9))
-        self.be_B         = Signal(math.ceil(write_width_B/9))
-        
-        if (memory_type == "Single_Port"):
-            large_width   = max(write_width_A, read_width_A)
-            smaller_width = min(write_width_A, read_width_A)
-            large_depth   = max(write_depth_A, read_depth_A)
-
             if (write_width_A >= read_width_A):
                 memory_width = write_width_A
                 memory_depth = write_depth_A
             else:
                 memory_width = read_width_A
                 memory_depth = read_depth_A
-                
         elif (memory_type == "Simple_Dual_Port"):
-            large_width   = max(write_width_A, read_width_B)
-            smaller_width = min(write_width_A, read_width_B)
-            large_depth   = max(write_depth_A, read_depth_B)
-            
             if (write_width_A >= read_width_B):
                 memory_width = write_width_A
                 memory_depth = write_depth_A
@@ -547,12 +330,6 @@ class OCM_ASYM(Module):
                 memory_width = read_width_B
                 memory_depth = read_depth_A
 
-        elif (memory_type == "True_Dual_Port"):
-            large_width   = max(write_width_A, read_width_A, write_width_B, read_width_B)
-            smaller_width = min(write_width_A, read_width_A, write_width_B, read_width_B)
-            large_depth   = max(write_depth_A, read_depth_A, write_depth_B, read_depth_B)
-            
-            
         MEMORY_SIZE = 36*1024
         
         if (memory_type == "Single_Port"):
@@ -750,12 +527,146 @@ class OCM_ASYM(Module):
                             n = math.ceil(n)
             
         elif (memory_type == "True_Dual_Port"):
-            m = math.ceil(large_width/36)
+            m = math.ceil(max(write_width_A, read_width_A, write_width_B, read_width_B)/36)
             n = math.ceil(write_depth_A/1024)
+        return m, n
+
+    def __init__(self, write_width_A, write_width_B, read_width_A, read_width_B, memory_type, common_clk, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode,
+        file_word_width=0, file_endianness="little", file_base_address=0):
+
+        self.write_depth_A  = write_depth_A
+        self.write_width_A  = write_width_A
+        self.read_depth_A   = read_depth_A
+        self.read_depth_B   = read_depth_B
+        
+        self.write_width_B  = write_width_B
+        self.read_width_A   = read_width_A
+        self.read_width_B   = read_width_B
+        
+        file_path = file_path_hex
+        
+        # Get/Check Parameters.
+        # ---------------------
+        self.logger = logging.getLogger("\tON CHIP MEMORY")
+        
+        self.logger.propagate = True
+        
+        self.logger.info(f"=================== PARAMETERS ====================")
+        
+        self.logger.info(f"MEMORY_TYPE      : {memory_type}")
+        
+        if memory_type == "Single_Port":
+            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
+            self.logger.info(f"READ_WIDTH_A     : {read_width_A}")
+            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
+            self.logger.info(f"READ_DEPTH_A     : {read_depth_A}")
+        
+        elif memory_type == "Simple_Dual_Port":
+            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
+            self.logger.info(f"READ_WIDTH_B     : {read_width_B}")
+            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
+            self.logger.info(f"READ_DEPTH_B     : {read_depth_B}")
+            
+        elif memory_type == "True_Dual_Port":
+            self.logger.info(f"WRITE_WIDTH_A    : {write_width_A}")
+            self.logger.info(f"READ_WIDTH_A     : {read_width_A}")
+            self.logger.info(f"WRITE_WIDTH_B    : {write_width_B}")
+            self.logger.info(f"READ_WIDTH_B     : {read_width_B}")
+            self.logger.info(f"WRITE_DEPTH_A    : {write_depth_A}")
+            self.logger.info(f"READ_DEPTH_A     : {read_depth_A}")
+            self.logger.info(f"WRITE_DEPTH_B    : {write_depth_B}")
+            self.logger.info(f"READ_DEPTH_B     : {read_depth_B}")
+        
+        if memory_type != "Single_Port":
+            self.logger.info(f"COMMON_CLK       : {common_clk}")
+        
+        self.logger.info(f"MEMORY_MAPPING       : {memory_mapping}")
+        
+        if (memory_type == "Single_Port"):
+            write_depthA = max(write_depth_A, read_depth_A)
+            self.addr_A     = Signal(math.ceil(math.log2(write_depthA)))
+            msb_write       = math.ceil(math.log2(write_depth_A))
+            msb_SP          = math.ceil(math.log2(write_depthA))
+            self.address    = Signal(15)
+            msb_read        = math.ceil(math.log2(write_depthA))
+            
+        elif (memory_type == "Simple_Dual_Port"):
+            self.addr_A    = Signal(math.ceil(math.log2(write_depth_A)))
+            self.addr_B    = Signal(math.ceil(math.log2(read_depth_B)))
+            msb_read       = math.ceil(math.log2(read_depth_B))
+        
+        elif (memory_type == "True_Dual_Port"):
+            self.address_A    = Signal(15)
+            self.address_B    = Signal(15)
+            depth_A = max(write_depth_A, read_depth_A)
+            depth_B = max(write_depth_B, read_depth_B)
+            self.addr_A    = Signal(math.ceil(math.log2(depth_A)))
+            self.addr_B    = Signal(math.ceil(math.log2(depth_B)))
+
+        msb_A = math.ceil(math.log2(write_depth_A))
+        msb_B = math.ceil(math.log2(write_depth_B))
+        
+        # Port A din/dout
+        self.din_A          = Signal(write_width_A)
+        self.din_A_reg      = Signal(write_width_A)
+        self.dout_A         = Signal(read_width_A)
+        self.dout_A_        = Signal(read_width_A)
+        self.dout_A_reg     = Signal(read_width_A)
+        
+        # Port B din/dout
+        self.din_B          = Signal(write_width_B)
+        self.din_B_reg      = Signal(write_width_B)
+        self.dout_B         = Signal(read_width_B)
+        self.dout_B_        = Signal(read_width_B)
+        self.dout_B_reg     = Signal(read_width_B)
+        
+        # External write/read enables
+        self.wen_A        = Signal(1)
+        self.wen_A_reg    = Signal(1)
+        self.ren_A        = Signal(1)
+        self.ren_A_reg    = Signal(1)
+        self.wen_B        = Signal(1)
+        self.wen_B_reg    = Signal(1)
+        self.ren_B        = Signal(1)
+        self.ren_B_reg    = Signal(1)
+        
+        # Byte Enable
+        self.be_A         = Signal(math.ceil(write_width_A/9))
+        self.be_B         = Signal(math.ceil(write_width_B/9))
         
-        if file_path != "":
+        if (memory_type == "Single_Port"):
+            large_width   = max(write_width_A, read_width_A)
+            smaller_width = min(write_width_A, read_width_A)
+            large_depth   = max(write_depth_A, read_depth_A)
+                
+        elif (memory_type == "Simple_Dual_Port"):
+            large_width   = max(write_width_A, read_width_B)
+            smaller_width = min(write_width_A, read_width_B)
+            large_depth   = max(write_depth_A, read_depth_B)
+
+        elif (memory_type == "True_Dual_Port"):
+            large_width   = max(write_width_A, read_width_A, write_width_B, read_width_B)
+            smaller_width = min(write_width_A, read_width_A, write_width_B, read_width_B)
+            large_depth   = max(write_depth_A, read_depth_A, write_depth_B, read_depth_B)
+
+        # OCM Instances.
+        m, n = self.bram_grid(memory_type, write_width_A, write_width_B, read_width_A, read_width_B, write_depth_A, read_depth_A, write_depth_B, read_depth_B)
+
+        # Memory image of the initialization file (byte images read as words of file_word_width bits):
+        # words of the smaller width for the BRAMs, of the write port A for the Distributed RAM (kept
+        # for its $readmemh file).
+        if (memory_mapping == "Block_RAM"):
+            width, depth = smaller_width, large_depth
+        else:
+            width, depth = write_width_A, write_depth_A
+        self.segments   = memory_converter(file_path, file_extension, width, depth,
+            word_width   = file_word_width,
+            byteorder    = file_endianness,
+            base_address = file_base_address)
+        self.line_count = image_size(self.segments)
+        if (memory_mapping == "Block_RAM") and (self.line_count != 0):
             k = 0
-            init, init_parity = self.memory_init(file_path, file_extension, m, n, smaller_width, large_depth, memory_type, large_width)
+            init, init_parity = self.memory_init(m, n, smaller_width, large_depth, memory_type, large_width)
                 
         self.m = m # vertical memory
         self.n = n # horizontal memory
@@ -1195,8 +1106,8 @@ class OCM_ASYM(Module):
                             data    = '0'
                             parity  = '0'
                         else:
-                            data        = hex(int(init[f], 2))[2:]          # hex conversion and removal of 0x from start of converted data
-                            parity      = hex(int(init_parity[f], 2))[2:]   # hex conversion and removal of 0x from start of converted data
+                            data        = "{:x}".format(init[f])          # hex conversion
+                            parity      = "{:x}".format(init_parity[f])   # hex conversion
                             f = f + 1
                         
                         # read enable logic
@@ -1987,8 +1898,8 @@ class OCM_ASYM(Module):
                             data    = '0'
                             parity  = '0'
                         else:
-                            data        = hex(int(init[f], 2))[2:]             # hex conversion and removal of 0x from start of converted data
-                            parity      = hex(int(init_parity[f], 2))[2:]      # hex conversion and removal of 0x from start of converted data
+                            data        = "{:x}".format(init[f])             # hex conversion
+                            parity      = "{:x}".format(init_parity[f])      # hex conversion
                             f = f + 1 # incrementing BRAM
                         
                         # read enable logic
@@ -2871,8 +2782,8 @@ class OCM_ASYM(Module):
                             data    = '0'
                             parity  = '0'
                         else:
-                            data        = hex(int(init[f], 2))[2:]          # hex conversion and removal of 0x from start of converted data
-                            parity      = hex(int(init_parity[f], 2))[2:]   # hex conversion and removal of 0x from start of converted data
+                            data        = "{:x}".format(init[f])          # hex conversion
+                            parity      = "{:x}".format(init_parity[f])   # hex conversion
                             f = f + 1
                         
                         #############################################################################################
@@ -0,0 +1,81 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# BRAM tiling of on chip memories.
+
+import math
+import functools
+
+# BRAM Aspect Ratios -------------------------------------------------------------------------------
+
+# TDP_RAM36K lane width (bits) -> depth (addresses). 36/18/9 bits lanes are made of bytes of 8 data bits
+# and 1 parity bit, 4/2/1 bits lanes of data bits only.
+BRAM_ASPECTS = {36: 1024, 18: 2048, 9: 4096, 4: 8192, 2: 16384, 1: 32768}
+
+BRAM_ADDRESS_WIDTH = 15 # TDP_RAM36K address width (1 bit lanes).
+
+# Lane widths usable for a width bits memory: with byte write enables (one per 9 bits of the word), a
+# lane can not straddle two bytes.
+def bram_lane_widths(width, byte_write_enable=False):
+    if not byte_write_enable or width <= 9:
+        return tuple(BRAM_ASPECTS)
+    return tuple(lane_width for lane_width in BRAM_ASPECTS if lane_width % 9 == 0 or lane_width == 1)
+
+# BRAM Plan ----------------------------------------------------------------------------------------
+
+# Tiling of a width x depth memory on rows x columns BRAMs of lane_width x lane_depth: row r holds the
+# addresses [r*lane_depth, (r+1)*lane_depth) (cascaded rows selected by the upper address bits), column
+# c the bits [(c+1)*lane_width - 1 : c*lane_width] of the words. The lane width is the one using the
+# fewest BRAMs, then the fewest rows (no address decoding/read multiplexing), then the widest lanes.
+class BRAMPlan:
+    __slots__ = ("width", "depth", "byte_write_enable", "lane_width", "lane_depth", "rows", "columns")
+
+    def __init__(self, width, depth, byte_write_enable=False):
+        self.width             = width
+        self.depth             = depth
+        self.byte_write_enable = byte_write_enable
+
+        def tiling(lane_width):
+            rows    = math.ceil(depth / BRAM_ASPECTS[lane_width])
+            columns = math.ceil(width / lane_width)
+            return rows*columns, rows, -lane_width
+        self.lane_width = min(bram_lane_widths(width, byte_write_enable), key=tiling)
+        self.lane_depth = BRAM_ASPECTS[self.lane_width]
+        self.rows       = math.ceil(depth / self.lane_depth)
+        self.columns    = math.ceil(width / self.lane_width)
+
+    @property
+    def brams(self):
+        return self.rows * self.columns
+
+    @property
+    def address_width(self):
+        # BRAM address bits, the upper address bits select the row.
+        return int(math.log2(self.lane_depth))
+
+    @property
+    def bytes(self):
+        # Bytes (data + parity) per lane, 0 for 4/2/1 bits lanes.
+        return self.lane_width // 9
+
+    def lane(self, column):
+        # Memory word bits [hi - 1 : lo] of a column (the last one can be partial).
+        lo = column * self.lane_width
+        return lo, min(lo + self.lane_width, self.width)
+
+    def byte_enables(self, column):
+        # Byte write enables [hi - 1 : lo] of a column.
+        lo = (column * self.lane_width) // 9
+        return lo, lo + max(self.bytes, 1)
+
+    @property
+    def description(self):
+        return f"{self.rows} x {self.columns} BRAMs of {self.lane_depth} x {self.lane_width}"
+
+@functools.lru_cache(maxsize=256)
+def bram_plan(width, depth, byte_write_enable=False):
+    return BRAMPlan(width, depth, bool(byte_write_enable))
@@ -10,12 +10,13 @@ import logging
 import argparse
 import math
 
-from datetime import datetime
-
 from litex_wrapper.on_chip_memory_litex_wrapper_symmetric import *
 
 from litex_wrapper.on_chip_memory_litex_wrapper_asymmetric import *
 
+from litex_wrapper.on_chip_memory_init import memory_file_format
+from litex_wrapper.on_chip_memory_plan import bram_plan
+
 from migen import *
 
 from litex.build.generic_platform import *
@@ -93,7 +94,8 @@ def get_clkin_ios(port_type, data_width, write_depth, memory_type, write_width_A
 
 # on_chip_memory Wrapper ----------------------------------------------------------------------------------
 class OCMWrapper(Module):
-    def __init__(self, platform, write_width_A, write_width_B, read_width_A, read_width_B, memory_type, write_depth, data_width, common_clk, port_type, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode):
+    def __init__(self, platform, write_width_A, write_width_B, read_width_A, read_width_B, memory_type, write_depth, data_width, common_clk, port_type, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode,
+        file_word_width=0, file_endianness="little", file_base_address=0):
         # Clocking ---------------------------------------------------------------------------------
         platform.add_extension(get_clkin_ios(port_type, data_width, write_depth, memory_type, write_width_A, write_width_B, read_width_A, read_width_B, write_depth_A, write_depth_B, read_depth_A, read_depth_B))
         self.clock_domains.cd_sys   = ClockDomain(reset_less = True)
@@ -101,9 +103,11 @@ class OCMWrapper(Module):
         self.clock_domains.B        = ClockDomain(reset_less = True)
         
         if port_type == "Asymmetric":
-            self.submodules.sp = ram = OCM_ASYM(write_width_A, write_width_B, read_width_A, read_width_B, memory_type, common_clk, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode)
+            self.submodules.sp = ram = OCM_ASYM(write_width_A, write_width_B, read_width_A, read_width_B, memory_type, common_clk, write_depth_A, read_depth_A, write_depth_B, read_depth_B, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode,
+                file_word_width, file_endianness, file_base_address)
         else:
-            self.submodules.sp = ram = OCM_SYM(data_width, memory_type, common_clk, write_depth, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode)
+            self.submodules.sp = ram = OCM_SYM(data_width, memory_type, common_clk, write_depth, memory_mapping, file_path_hex, file_extension, byte_write_enable, op_mode,
+                file_word_width, file_endianness, file_base_address)
             
         self.M = ram.m
         self.N = ram.n    
@@ -169,12 +173,13 @@ class OCMWrapper(Module):
                 self.comb += self.B.clk.eq(platform.request("clk_B"))
             
 # Build --------------------------------------------------------------------------------------------
-def main():
+def main(argv=None, params=None):
     parser = argparse.ArgumentParser(description="ON CHIP MEMORY")
 
     # Import Common Modules.
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
-    sys.path.append(common_path)
+    if common_path not in sys.path:
+        sys.path.append(common_path)
 
     from common import IP_Builder
 
@@ -217,7 +222,12 @@ def main():
 
     # Core file path parameters.
     core_file_path_group = parser.add_argument_group(title="Core file path parameters")
-    core_file_path_group.add_argument("--file_path",    type=str,    default="",       help="Path to memory initialization file (.bin/.hex)")
+    core_file_path_group.add_argument("--file_path",    type=str,    default="",       help="Path to memory initialization file ($readmemh/$readmemb .hex/.mem/.bin text, Intel HEX .hex/.ihex, ELF, raw binary .bin/.raw/.img image)")
+
+    # Byte images (Intel HEX/ELF/raw binary) initialization parameters.
+    core_string_param_group.add_argument("--file_endianness",       type=str,   default="little",   choices=["little", "big"],              help="Byte order of the words of Intel HEX/ELF/raw binary initialization files")
+    core_fix_param_group.add_argument("--file_word_width",          type=int,   default=0,          choices=[0, 8, 16, 32, 64, 128],        help="Word width of Intel HEX/ELF/raw binary initialization files (0: RAM width rounded up to bytes)")
+    core_file_path_group.add_argument("--file_base_address",        type=str,   default="0x0",                                              help="Byte address of the first RAM word in Intel HEX/ELF initialization files")
 
     # Build Parameters.
     build_group = parser.add_argument_group(title="Build parameters")
@@ -230,7 +240,7 @@ def main():
     json_group.add_argument("--json",                                           help="Generate Core from JSON File")
     json_group.add_argument("--json-template",  action="store_true",            help="Generate JSON Template")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     details =  {   "IP details": {
     'Name' : 'On Chip Memory Generator',
@@ -240,8 +250,8 @@ def main():
     }
     
     # Import JSON (Optional) -----------------------------------------------------------------------
-    if args.json:
-        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
+    if args.json or params is not None:
+        args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json, params=params, argv=argv)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version = "v1_0")
         
         file_path = os.path.dirname(os.path.realpath(__file__))
@@ -258,6 +268,13 @@ def main():
             option_strings_to_remove = ['--byte_write_enable']
             parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
         
+        if (args.file_path == ""):
+            dep_dict.update({
+                        'file_endianness'   : 'True',
+                        'file_word_width'   : 'True',
+                        'file_base_address' : 'True'
+                    })
+        
         if (args.write_width_A >= 288 or args.read_width_A >= 288 or args.write_width_B >= 288 or args.read_width_B >= 288):
             parser._actions[11].choices = [1024, 2048, 4096, 8192]
             
@@ -287,10 +304,7 @@ def main():
             if (args.write_width_A != args.read_width_A or args.write_width_A != args.write_width_B or args.write_width_B != args.read_width_B):
                 parser._actions[3].choices = ["Block_RAM"]
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    file_extension  = os.path.splitext(args.file_path)[1]
-    
+    # Summary --------------------------------------------------------------------------------------
     if (args.memory_type == "Single_Port"):
         read_depth_A = int((args.write_depth_A * args.write_width_A) / args.read_width_A)
         read_depth_B = 0
@@ -352,6 +366,28 @@ def main():
     else:
         data = args.data_width
     
+    # Number of BRAMs from the BRAM grid, without elaborating the memory.
+    if (args.memory_mapping == "Block_RAM"):
+        if args.port_type == "Asymmetric":
+            m, n = OCM_ASYM.bram_grid(args.memory_type, args.write_width_A, args.write_width_B, args.read_width_A, args.read_width_B, args.write_depth_A, read_depth_A, write_depth_B, read_depth_B)
+        else:
+            m, n = OCM_SYM.bram_grid(data, args.write_depth, args.byte_write_enable)
+        summary["Number of BRAMs"] = m * n
+        if args.port_type != "Asymmetric":
+            summary["BRAM Tiling"] = bram_plan(data, args.write_depth, args.byte_write_enable).description
+    
+    # Export JSON Template (Optional) --------------------------------------------------------------
+    if args.json_template:
+        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary, args=args)
+        # Template only: no elaboration.
+        if not args.build:
+            return rs_builder.result(version="v1_0", summary=summary)
+
+    # Create Wrapper -------------------------------------------------------------------------------
+    rs_builder.start_phase("elaboration")
+    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+    file_extension  = os.path.splitext(args.file_path)[1]
+    
     module   = OCMWrapper(platform,
         memory_type         = args.memory_type,
         data_width          = data,
@@ -370,17 +406,13 @@ def main():
         file_path_hex       = args.file_path,
         file_extension      = file_extension,
         byte_write_enable   = args.byte_write_enable,
-        op_mode             = args.op_mode
+        op_mode             = args.op_mode,
+        file_word_width     = args.file_word_width,
+        file_endianness     = args.file_endianness,
+        file_base_address   = int(args.file_base_address, 0)
     )
     
-    if (args.memory_mapping == "Block_RAM"):
-        summary["Number of BRAMs"] = module.M * module.N
-    
-    # Export JSON Template (Optional) --------------------------------------------------------------
-    if args.json_template:
-        rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -390,68 +422,41 @@ def main():
         )
         rs_builder.copy_files(gen_path=os.path.dirname(__file__))
         rs_builder.generate_tcl(version    = "v1_0")
+        
+        # DRAM: ram_style attribute and $readmemh/$readmemb initialization of the memory, inserted in
+        # the wrapper post-processing pass.
+        prepend = []
+        if (args.memory_mapping == "Distributed_RAM"):
+            prepend.append(("Port", "(* ram_style = \"logic\" *)\n\n"))
+            file_format     = memory_file_format(args.file_path, file_extension) if args.file_path != "" else None
+            mem_file_path   = args.file_path
+            # Intel HEX/ELF/raw binary image: the memory image loaded at elaboration is written to a
+            # .hex file ($readmemh) next to the wrapper, no initialization when it could not be loaded
+            # (error logged at elaboration).
+            if (module.sp.line_count == 0):
+                file_format = None
+            elif (file_format in ["ihex", "elf", "raw"]):
+                mem_file_path = os.path.abspath(os.path.join(rs_builder.src_path, rs_builder.build_name + "_init.hex"))
+                with open(mem_file_path, "w") as mem_file:
+                    for address, words in module.sp.segments:
+                        mem_file.write("@{:x}\n".format(address))
+                        mem_file.writelines("{:x}\n".format(word) for word in words)
+                file_format = "hex"
+            if (file_format == "hex"):
+                prepend.append(("always", "initial begin\n\t$readmemh(\"{}\", memory);\nend\n".format(mem_file_path)))
+            elif (file_format == "bin"):
+                prepend.append(("always", "initial begin\n\t$readmemb(\"{}\", memory);\nend\n".format(mem_file_path)))
+        
         rs_builder.generate_wrapper(
             platform   = platform,
             module     = module,
-            version    = "v1_0"
+            params     = vars(args),
+            version    = "v1_0",
+            ip_type    = "OCM",
+            prepend    = prepend
         )
-        
-        # IP_ID Parameter
-        now = datetime.datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"OCM\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
-        
-        # DRAM
-        if (args.memory_mapping == "Distributed_RAM"):
-            wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-            with open (wrapper, "r") as file:
-                lines = file.readlines()
-                for i, line in enumerate(lines):
-                    if "Port" in line:
-                        lines.insert(i, "(* ram_style = \"logic\" *)\n\n")
-                        break
-                    
-                file_extension  = os.path.splitext(args.file_path)[1]
-                hex_path = "initial begin\n\t$readmemh(\"{}\", memory);\nend\n".format(args.file_path)
-                bin_path = "initial begin\n\t$readmemb(\"{}\", memory);\nend\n".format(args.file_path)
-                for i, line in enumerate(lines):
-                    if "always" in line:
-                        if (file_extension == ".hex"):
-                            lines.insert(i, hex_path)
-                        elif (file_extension == ".bin"):
-                            lines.insert(i, bin_path)
-                        break
 
-            with open(os.path.join(wrapper), "w") as file:
-                file.writelines(lines)
+    return rs_builder.result(version="v1_0", summary=summary)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
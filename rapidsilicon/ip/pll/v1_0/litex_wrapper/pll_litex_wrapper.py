@@ -8,18 +8,12 @@
 
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
 
 # Helpers ------------------------------------------------------------------------------------------
 
@@ -44,8 +38,6 @@ def freq_calc(self, fast_clk_freq, ref_clk_freq, c_range, d_range):
         #break                    
 
 
-
-
 def enum_post_div(self, pll_post_div):
     post_div = {
                 "1"   : 17,            
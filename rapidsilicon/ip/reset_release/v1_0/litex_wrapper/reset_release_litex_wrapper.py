@@ -9,16 +9,10 @@
 
 import os
 import math
-import datetime
 import logging
 
 from migen import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
 
 # RESET RELEASE  ---------------------------------------------------------------------------------------
 class RESETRELEASE(Module):
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+# Catalog-wide batch build: runs many (ip, version, json) generations across a process pool. Every
+# worker keeps the generators imported between jobs, every job gets its own build directory and its
+# own private scratch directory.
+#
+# Manifest (JSON), relative paths are relative to the manifest:
+#   {"jobs": [
+#       {"ip": "axi_fifo", "version": "v1_0", "json": "axi_fifo_64.json", "build_name": "axi_fifo_64"},
+#       {"ip": "fifo_generator", "json": "fifo_async.json"}
+#   ]}
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from catalog import IP_PATH, resolve_generator, run_generator, GeneratorError
+
+# Manifest -----------------------------------------------------------------------------------------
+
+def load_manifest(manifest_filename, output_dir, ip_path=IP_PATH):
+    with open(manifest_filename, "r") as f:
+        manifest = json.load(f)
+    if isinstance(manifest, dict):
+        manifest = manifest.get("jobs", [])
+    manifest_path = os.path.dirname(os.path.realpath(manifest_filename))
+
+    jobs  = []
+    names = set()
+    for entry in manifest:
+        # Generator resolved by the job (unknown IP/version: failed job).
+        ip_name, version = entry["ip"], entry.get("version")
+        json_filename = entry.get("json")
+        if json_filename is not None:
+            json_filename = os.path.realpath(os.path.join(manifest_path, json_filename))
+
+        # Unique job name, used for the default build directory.
+        name = entry.get("name")
+        if name is None:
+            name = ip_name if version is None else f"{ip_name}_{version}"
+            if json_filename is not None:
+                name += "_" + os.path.splitext(os.path.basename(json_filename))[0]
+        unique_name, index = name, 1
+        while unique_name in names:
+            unique_name = f"{name}_{index}"
+            index += 1
+        names.add(unique_name)
+
+        build_dir = entry.get("build_dir")
+        if build_dir is None:
+            build_dir = os.path.join(output_dir, unique_name)
+        jobs.append({
+            "name"       : unique_name,
+            "ip"         : ip_name,
+            "version"    : version,
+            "json"       : json_filename,
+            "build_dir"  : os.path.realpath(os.path.join(manifest_path, build_dir)),
+            "build_name" : entry.get("build_name"),
+            "ip_path"    : ip_path,
+        })
+    return jobs
+
+# Worker -------------------------------------------------------------------------------------------
+
+def run_job(job, scratch_root=None, keep_scratch=False, cache_dir=None, asset_link=None, profile=None):
+    import common
+
+    # Private scratch directory: LiteX build files and files written to the CWD stay per job.
+    scratch = tempfile.mkdtemp(prefix=f"{job['name']}_", dir=scratch_root)
+    cwd     = os.getcwd()
+    common.IP_Builder.scratch_dir = scratch
+    common.IP_Builder.cache_dir   = cache_dir
+    common.IP_Builder.asset_link  = asset_link
+    common.IP_Builder.profile     = profile
+
+    argv = ["--build", "--build-dir", job["build_dir"]]
+    if job["build_name"] is not None:
+        argv += ["--build-name", job["build_name"]]
+    if job["json"] is not None:
+        argv += ["--json", job["json"]]
+
+    result = {k: job[k] for k in ["name", "ip", "version", "json", "build_dir"]}
+    start  = time.perf_counter()
+    try:
+        _, result["version"], _ = resolve_generator(job["ip"], job["version"], job["ip_path"])
+        os.makedirs(job["build_dir"], exist_ok=True)
+        os.chdir(scratch)
+        run_generator(job["ip"], result["version"], argv, job["ip_path"])
+        result["status"] = "passed"
+    except KeyError as e:
+        # Unknown IP/version.
+        result["status"] = "failed"
+        result["error"]  = e.args[0]
+    except GeneratorError as e:
+        result["status"] = "failed"
+        result["error"]  = str(e)
+        result["output"] = e.output
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"]  = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(cwd)
+        common.IP_Builder.scratch_dir = None
+        common.IP_Builder.cache_dir   = None
+        common.IP_Builder.asset_link  = None
+        common.IP_Builder.profile     = None
+        if not keep_scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+    result["time"] = round(time.perf_counter() - start, 3)
+    result["pid"]  = os.getpid()
+    return result
+
+# Batch --------------------------------------------------------------------------------------------
+
+def run_batch(jobs, max_workers=None, scratch_root=None, keep_scratch=False, cache_dir=None, asset_link=None, profile=None):
+    start   = time.perf_counter()
+    results = [None] * len(jobs)
+    if scratch_root is not None:
+        os.makedirs(scratch_root, exist_ok=True)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_job, job, scratch_root, keep_scratch, cache_dir, asset_link, profile): n for n, job in enumerate(jobs)}
+        for future in concurrent.futures.as_completed(futures):
+            n = futures[future]
+            try:
+                results[n] = future.result()
+            except Exception as e:
+                # Worker crash (BrokenProcessPool, ...).
+                results[n] = {k: jobs[n][k] for k in ["name", "ip", "version", "json", "build_dir"]}
+                results[n].update({"status": "failed", "error": f"{type(e).__name__}: {e}", "time": None})
+            print(f"[{results[n]['status'].upper():6s}] {results[n]['name']} ({results[n]['time']}s)", file=sys.stderr)
+    return {
+        "workers" : max_workers or os.cpu_count(),
+        "time"    : round(time.perf_counter() - start, 3),
+        "passed"  : sum(1 for r in results if r["status"] == "passed"),
+        "failed"  : sum(1 for r in results if r["status"] == "failed"),
+        "jobs"    : results,
+    }
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog batch build.")
+    parser.add_argument("manifest",                                        help="JSON manifest of (ip, version, json) jobs.")
+    parser.add_argument("--output-dir",   default="./batch_build",         help="Root of the per-job build directories.")
+    parser.add_argument("--jobs", "-j",   default=None, type=int,          help="Number of parallel workers (default: CPU count).")
+    parser.add_argument("--scratch-dir",  default=None,                    help="Root of the per-job scratch directories (default: system temporary directory).")
+    parser.add_argument("--keep-scratch", action="store_true",             help="Keep the per-job scratch directories.")
+    parser.add_argument("--cache-dir",    default=None,                    help="Output cache directory (default: IP_CATALOG_CACHE environment variable).")
+    parser.add_argument("--asset-link",   default=None, choices=["hardlink", "symlink"], help="Link read-only assets (generator, litex_wrapper, docs) from the catalog instead of copying them.")
+    parser.add_argument("--profile",      action="store_true",             help="Write the per-phase profile (profile.json) of every job.")
+    parser.add_argument("--report",       default=None,                    help="JSON report file (default: stdout).")
+    parser.add_argument("--ip-path",      default=IP_PATH,                 help="IP Catalog directory.")
+    args = parser.parse_args()
+
+    jobs   = load_manifest(args.manifest, os.path.realpath(args.output_dir), os.path.realpath(args.ip_path))
+    report = run_batch(jobs, max_workers=args.jobs, scratch_root=args.scratch_dir, keep_scratch=args.keep_scratch,
+        cache_dir=args.cache_dir and os.path.realpath(args.cache_dir), asset_link=args.asset_link,
+        profile=args.profile or None)
+
+    if args.report is None:
+        print(json.dumps(report, indent=4))
+    else:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=4)
+
+    sys.exit(0 if report["failed"] == 0 else 1)
+
+if __name__ == "__main__":
+    main()
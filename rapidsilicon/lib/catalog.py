@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import os
+import sys
+import glob
+import json
+import time
+import contextlib
+import importlib.util
+
+# Catalog Paths ------------------------------------------------------------------------------------
+
+LIB_PATH = os.path.dirname(os.path.realpath(__file__))
+IP_PATH  = os.path.realpath(os.path.join(LIB_PATH, "..", "ip"))
+
+# Catalog Discovery --------------------------------------------------------------------------------
+
+def version_key(version):
+    # "v1_0" -> (1, 0) so that "v10_0" sorts after "v2_0".
+    return tuple(int(v) for v in version.lstrip("v").split("_") if v.isdigit())
+
+def find_generators(ip_path=IP_PATH):
+    # Returns {(ip_name, version): generator filename} for every rapidsilicon/ip/<ip>/<version>/.
+    generators = {}
+    for gen_filename in sorted(glob.glob(os.path.join(ip_path, "*", "v*", "*_gen.py"))):
+        version_path = os.path.dirname(gen_filename)
+        ip_name      = os.path.basename(os.path.dirname(version_path))
+        version      = os.path.basename(version_path)
+        if os.path.basename(gen_filename) == f"{ip_name}_gen.py":
+            generators[(ip_name, version)] = gen_filename
+    return generators
+
+_catalogs = {}
+
+def resolve_generator(ip_name, version=None, ip_path=IP_PATH):
+    if ip_path not in _catalogs:
+        _catalogs[ip_path] = find_generators(ip_path)
+    generators = _catalogs[ip_path]
+    versions   = sorted([v for (n, v) in generators if n == ip_name], key=version_key)
+    if not versions:
+        raise KeyError(f"Unknown IP: {ip_name}")
+    if version is None:
+        version = versions[-1]
+    if (ip_name, version) not in generators:
+        raise KeyError(f"Unknown version {version} for IP {ip_name} (available: {', '.join(versions)})")
+    return ip_name, version, generators[(ip_name, version)]
+
+# Generator Loading --------------------------------------------------------------------------------
+
+# Every IP ships its own "litex_wrapper" package (and sometimes other local modules) which all share
+# the same top-level names. To keep several generators alive in one interpreter, the local modules
+# of each generator are swapped in/out of sys.modules around every call.
+_local_modules = {}
+_generators    = {}
+_import_times  = {}
+
+def _is_local_module(name, module, gen_path):
+    if name == "litex_wrapper" or name.startswith("litex_wrapper."):
+        return True
+    paths = [getattr(module, "__file__", None) or ""]
+    paths.extend(getattr(module, "__path__", None) or [])
+    return any(os.path.realpath(p).startswith(gen_path + os.sep) for p in paths if p)
+
+@contextlib.contextmanager
+def generator_context(gen_filename):
+    gen_path = os.path.dirname(os.path.realpath(gen_filename))
+
+    # Swap the local modules of the other generators out and ours in.
+    others = {name: sys.modules.pop(name) for name in list(sys.modules)
+        if name == "litex_wrapper" or name.startswith("litex_wrapper.")}
+    for modules in _local_modules.values():
+        others.update({name: sys.modules.pop(name) for name in modules if name in sys.modules})
+    local = dict(_local_modules.get(gen_path, {}))
+    sys.modules.update(local)
+    before = set(sys.modules)
+    sys.path.insert(0, gen_path)
+    try:
+        yield
+    finally:
+        sys.path.remove(gen_path)
+        for name in set(sys.modules) - before:
+            if _is_local_module(name, sys.modules[name], gen_path):
+                local[name] = sys.modules[name]
+        for name in local:
+            sys.modules.pop(name, None)
+        _local_modules[gen_path] = local
+        sys.modules.update(others)
+
+def load_generator(ip_name, version=None, ip_path=IP_PATH):
+    ip_name, version, gen_filename = resolve_generator(ip_name, version, ip_path)
+    if (ip_name, version) not in _generators:
+        spec   = importlib.util.spec_from_file_location(f"{ip_name}_{version}_gen", gen_filename)
+        module = importlib.util.module_from_spec(spec)
+        start  = time.perf_counter()
+        with generator_context(gen_filename):
+            spec.loader.exec_module(module)
+        _import_times[(ip_name, version)] = time.perf_counter() - start
+        _generators[(ip_name, version)]   = module
+    return _generators[(ip_name, version)]
+
+def preload_generators(ip_path=IP_PATH):
+    # Import every generator once, returns {(ip_name, version): error} for the ones that failed.
+    errors = {}
+    for (ip_name, version) in find_generators(ip_path):
+        try:
+            load_generator(ip_name, version, ip_path)
+        except Exception as e:
+            errors[(ip_name, version)] = f"{type(e).__name__}: {e}"
+    return errors
+
+# In-Process Generation ----------------------------------------------------------------------------
+
+class GeneratorError(Exception):
+    def __init__(self, message, output=""):
+        super().__init__(message)
+        self.output = output
+
+def run_generator(ip_name, version, argv, ip_path=IP_PATH, params=None):
+    # Runs <ip>_gen.py main() in this interpreter, returns its captured stdout. params: parameters
+    # dict (same content as the --json file).
+    import common
+    module = load_generator(ip_name, version, ip_path)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    # Profile: the generator was imported once, when loaded.
+    common.IP_Builder.import_time = _import_times.get((ip_name, version))
+    try:
+        with generator_context(module.__file__), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            module.main(argv=[str(arg) for arg in argv], params=params)
+    except SystemExit as e:
+        if e.code not in [None, 0]:
+            raise GeneratorError(stderr.getvalue().strip() or f"exit status {e.code}", stdout.getvalue())
+    except Exception as e:
+        raise GeneratorError(f"{type(e).__name__}: {e}", stdout.getvalue())
+    finally:
+        common.IP_Builder.import_time = None
+    return stdout.getvalue()
+
+def generate(ip_name, params, build_dir="./", build_name=None, version=None, ip_path=IP_PATH):
+    # Builds an IP from a dict of parameters (same content as the --json file) in this interpreter,
+    # returns its IP_Result. version: latest one when None.
+    import common
+    argv = ["--build", "--build-dir", build_dir]
+    if build_name is not None:
+        argv += ["--build-name", build_name]
+    ip_name, version, _ = resolve_generator(ip_name, version, ip_path)
+    module = load_generator(ip_name, version, ip_path)
+    common.IP_Builder.import_time = _import_times.get((ip_name, version))
+    try:
+        with generator_context(module.__file__):
+            return module.main(argv=argv, params=params)
+    finally:
+        common.IP_Builder.import_time = None
+
+def parse_json_template(output):
+    # The template is the first JSON object printed by the generator.
+    start = output.find("{")
+    if start < 0:
+        raise GeneratorError("No JSON template found in generator output", output)
+    template, _ = json.JSONDecoder().raw_decode(output[start:])
+    return template
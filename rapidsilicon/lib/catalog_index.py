@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+# IP Catalog indexer: runs every rapidsilicon/ip/<ip>/<version>/<ip>_gen.py once in this interpreter
+# (--json-template with default parameters) and writes one consolidated catalog file with the IP
+# details, parameter schemas and summaries of every IP/version.
+#
+# Index (JSON):
+#   {"format": 1,
+#    "ips": {"axi_crossbar": {"latest": "v2_0", "versions": {"v1_0": {...}, "v2_0": {
+#        "generator"  : "axi_crossbar/v2_0/axi_crossbar_gen.py",
+#        "details"    : {...},   # "IP details" (details.json)
+#        "parameters" : [...],   # Core parameters (same as --json-template)
+#        "summary"    : {...},   # Summary with default parameters
+#    }}}},
+#    "errors": {"<ip>/<version>": "..."}}
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from catalog import IP_PATH, find_generators, version_key, run_generator, parse_json_template
+
+INDEX_FORMAT = 1
+
+# Indexer ------------------------------------------------------------------------------------------
+
+def index_generator(ip_name, version, ip_path=IP_PATH):
+    tmp_path = tempfile.mkdtemp(prefix="ip_catalog_index_")
+    try:
+        # Default parameters through an empty parameters dict: the generators only write their IP
+        # details (and compute their parameter dependencies) when importing parameters.
+        build_name = "index"
+        argv       = ["--json-template", "--build-dir", tmp_path, "--build-name", build_name]
+        template   = parse_json_template(run_generator(ip_name, version, argv, ip_path, params={}))
+
+        details          = {}
+        details_filename = os.path.join(tmp_path, "rapidsilicon", "ip", ip_name, version, build_name, "details.json")
+        if os.path.exists(details_filename):
+            with open(details_filename, "r") as f:
+                details = json.load(f).get("IP details", {})
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    return {
+        "details"    : details,
+        "parameters" : template.get("parameters", []),
+        "summary"    : template.get("Summary", {}),
+    }
+
+def build_index(ip_path=IP_PATH, verbose=False):
+    index = {"format": INDEX_FORMAT, "ips": {}, "errors": {}}
+
+    # No generation log (templates only). Generators may still write to the CWD: run them from a
+    # scratch directory.
+    import common
+    common.IP_Builder.log_mode = "off"
+    cwd      = os.getcwd()
+    tmp_path = tempfile.mkdtemp(prefix="ip_catalog_index_")
+    os.chdir(tmp_path)
+    try:
+        for (ip_name, version), gen_filename in sorted(find_generators(ip_path).items()):
+            if verbose:
+                print(f"Indexing {ip_name} {version}", file=sys.stderr)
+            try:
+                entry = index_generator(ip_name, version, ip_path)
+            except Exception as e:
+                index["errors"][f"{ip_name}/{version}"] = str(e)
+                continue
+            entry = {"generator": os.path.relpath(gen_filename, ip_path), **entry}
+            ip    = index["ips"].setdefault(ip_name, {"latest": None, "versions": {}})
+            ip["versions"][version] = entry
+    finally:
+        os.chdir(cwd)
+        common.IP_Builder.log_mode = None
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    for ip in index["ips"].values():
+        ip["latest"] = max(ip["versions"], key=version_key)
+    return index
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog indexer.")
+    parser.add_argument("--output",   default=None,               help="Catalog index file (default: stdout).")
+    parser.add_argument("--ip-path",  default=IP_PATH,            help="IP Catalog directory.")
+    parser.add_argument("--strict",   action="store_true",        help="Exit with an error when an IP can't be indexed.")
+    parser.add_argument("--verbose",  action="store_true",        help="Print progress on stderr.")
+    args = parser.parse_args()
+
+    index = build_index(os.path.realpath(args.ip_path), verbose=args.verbose)
+    for name, error in index["errors"].items():
+        print(f"Unable to index {name}: {error}", file=sys.stderr)
+
+    if args.output is None:
+        print(json.dumps(index, indent=4))
+    else:
+        output_path = os.path.dirname(os.path.realpath(args.output))
+        os.makedirs(output_path, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(index, f, indent=4)
+
+    if args.strict and index["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+# Long-lived IP Catalog server: imports migen/LiteX and every generator once, then serves JSON-RPC 2.0
+# requests (one JSON object per line) on stdin/stdout, on a UNIX socket or on a localhost TCP port.
+#
+# Methods:
+#   list                                                     -> [{"ip": ..., "versions": [...]}]
+#   template {ip, [version], [params], [build_dir]}          -> JSON template (same as --json-template)
+#   summary  {ip, [version], [params], [build_dir]}          -> "Summary" section of the template
+#   build    {ip, [version], [params], build_dir, [build_name]} -> {"build_path": ..., "output": ...}
+#   shutdown                                                 -> stops the server
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import contextlib
+import socketserver
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from catalog import IP_PATH, find_generators, version_key, resolve_generator, preload_generators
+from catalog import run_generator, parse_json_template, GeneratorError
+
+# JSON-RPC Errors ----------------------------------------------------------------------------------
+
+PARSE_ERROR      = -32700
+INVALID_REQUEST  = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS   = -32602
+INTERNAL_ERROR   = -32603
+GENERATOR_ERROR  = -32000
+
+class RPCError(Exception):
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code    = code
+        self.message = message
+        self.data    = data
+
+# Scratch Directory --------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def scratch_dir():
+    # Temporary CWD, removed on exit.
+    cwd      = os.getcwd()
+    tmp_path = tempfile.mkdtemp(prefix="ip_catalog_server_")
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+# Catalog Server -----------------------------------------------------------------------------------
+
+class CatalogServer:
+    def __init__(self, ip_path=IP_PATH):
+        self.ip_path = ip_path
+        self.running = True
+        self.methods = {
+            "list"     : self.list,
+            "template" : self.template,
+            "summary"  : self.summary,
+            "build"    : self.build,
+            "shutdown" : self.shutdown,
+        }
+
+    def preload(self):
+        # Import every generator (and so common.py and migen/LiteX) once.
+        return preload_generators(self.ip_path)
+
+    def _generator(self, params):
+        if "ip" not in params:
+            raise RPCError(INVALID_PARAMS, "Missing 'ip' parameter")
+        try:
+            return resolve_generator(params["ip"], params.get("version"), self.ip_path)
+        except KeyError as e:
+            raise RPCError(INVALID_PARAMS, str(e.args[0]))
+
+    def _run(self, params, argv):
+        ip_name, version, _ = self._generator(params)
+        json_params = params.get("params")
+        if json_params is not None and not isinstance(json_params, dict):
+            raise RPCError(INVALID_PARAMS, "'params' must be an object")
+        try:
+            return run_generator(ip_name, version, argv, self.ip_path, params=json_params)
+        except GeneratorError as e:
+            raise RPCError(GENERATOR_ERROR, str(e), e.output)
+
+    def list(self, params):
+        versions = {}
+        for (ip_name, version) in find_generators(self.ip_path):
+            versions.setdefault(ip_name, []).append(version)
+        return [{"ip": ip_name, "versions": sorted(v, key=version_key)} for ip_name, v in sorted(versions.items())]
+
+    def template(self, params):
+        # Generators may write to the CWD (and write their details/docs to the build directory when
+        # importing parameters): run them from a scratch directory, also the default build directory.
+        build_dir = params.get("build_dir")
+        if build_dir is not None:
+            build_dir = os.path.realpath(build_dir)
+        with scratch_dir() as tmp_path:
+            argv = ["--json-template", "--build-dir", build_dir or tmp_path]
+            return parse_json_template(self._run(params, argv))
+
+    def summary(self, params):
+        return self.template(params).get("Summary", {})
+
+    def build(self, params):
+        if "build_dir" not in params:
+            raise RPCError(INVALID_PARAMS, "Missing 'build_dir' parameter")
+        ip_name, version, _ = self._generator(params)
+        argv = ["--build", "--build-dir", params["build_dir"]]
+        if "build_name" in params:
+            argv += ["--build-name", params["build_name"]]
+        output = self._run(params, argv)
+        build_path = None
+        if "build_name" in params:
+            build_name = os.path.splitext(params["build_name"])[0]
+            build_path = os.path.join(params["build_dir"], "rapidsilicon", "ip", ip_name, version, build_name)
+        return {"build_path": build_path, "output": output}
+
+    def shutdown(self, params):
+        self.running = False
+        return True
+
+    def handle(self, line):
+        # Returns the JSON-RPC response for one request line (None for notifications).
+        request_id   = None
+        notification = False
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise RPCError(PARSE_ERROR, f"Parse error: {e}")
+            if not isinstance(request, dict) or "method" not in request:
+                raise RPCError(INVALID_REQUEST, "Invalid request")
+            request_id   = request.get("id")
+            notification = "id" not in request
+            method       = self.methods.get(request["method"])
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "Parameters must be an object")
+            response = {"jsonrpc": "2.0", "id": request_id, "result": method(params)}
+        except RPCError as e:
+            error = {"code": e.code, "message": e.message}
+            if e.data:
+                error["data"] = e.data
+            response = {"jsonrpc": "2.0", "id": request_id, "error": error}
+        except Exception as e:
+            error = {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}
+            response = {"jsonrpc": "2.0", "id": request_id, "error": error}
+        if notification:
+            return None
+        return json.dumps(response)
+
+    def serve_stream(self, rfile, wfile):
+        for line in rfile:
+            line = line.strip()
+            if not line:
+                continue
+            response = self.handle(line)
+            if response is not None:
+                wfile.write(response + "\n")
+                wfile.flush()
+            if not self.running:
+                break
+
+# Socket Transport ---------------------------------------------------------------------------------
+
+def serve_socket(server, address):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            rfile = (line.decode() for line in self.rfile)
+            wfile = _SocketWriter(self.wfile)
+            server.serve_stream(rfile, wfile)
+
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.remove(address)
+        socket_server = socketserver.UnixStreamServer(address, Handler)
+    else:
+        socket_server = socketserver.TCPServer(address, Handler)
+    # Connections are served one at a time: generators are not re-entrant.
+    with socket_server:
+        while server.running:
+            socket_server.handle_request()
+    if isinstance(address, str) and os.path.exists(address):
+        os.remove(address)
+
+class _SocketWriter:
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, data):
+        self.wfile.write(data.encode())
+
+    def flush(self):
+        self.wfile.flush()
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog generator server (JSON-RPC 2.0).")
+    parser.add_argument("--socket",     default=None,                   help="Serve on this UNIX socket path (default: stdin/stdout).")
+    parser.add_argument("--port",       default=None, type=int,         help="Serve on this localhost TCP port (default: stdin/stdout).")
+    parser.add_argument("--ip-path",    default=IP_PATH,                help="IP Catalog directory.")
+    parser.add_argument("--no-preload", action="store_true",            help="Import generators on first use instead of at startup.")
+    args = parser.parse_args()
+
+    server = CatalogServer(ip_path=os.path.realpath(args.ip_path))
+    if not args.no_preload:
+        for (ip_name, version), error in server.preload().items():
+            print(f"Unable to load {ip_name} {version}: {error}", file=sys.stderr)
+
+    if args.socket is not None:
+        serve_socket(server, args.socket)
+    elif args.port is not None:
+        serve_socket(server, ("127.0.0.1", args.port))
+    else:
+        server.serve_stream(sys.stdin, sys.stdout)
+
+if __name__ == "__main__":
+    main()
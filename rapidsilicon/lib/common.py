@@ -5,170 +5,636 @@
 # SPDX-License-Identifier: MIT
 
 import os
+import sys
 import json
+import time
+import fcntl
 import shutil
+import hashlib
 import argparse
+import resource
+import logging
+import tempfile
+import functools
+import contextlib
+import importlib.metadata
+
+from datetime import datetime
+
+# File Helpers -------------------------------------------------------------------------------------
+
+def hash_file(filename):
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+@contextlib.contextmanager
+def atomic_open(filename):
+    # Write to a temporary file then rename: never writes through a hardlink (cache) and readers
+    # never see a partial file.
+    fd, tmp_filename = tempfile.mkstemp(prefix=".tmp_", dir=os.path.dirname(filename) or ".")
+    try:
+        with os.fdopen(fd, "w") as f:
+            yield f
+        os.chmod(tmp_filename, 0o644)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.remove(tmp_filename)
+        raise
+
+def write_file(filename, content):
+    with atomic_open(filename) as f:
+        f.write(content)
+
+FICLONE = 0x40049409
+
+def clone_file(src, dst):
+    # Reflink (copy-on-write) copy when the filesystem supports it, regular copy otherwise.
+    if os.path.lexists(dst):
+        os.remove(dst)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+def link_file(src, dst):
+    # Hardlink, falls back to a copy (cross-device, unsupported filesystem).
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        clone_file(src, dst)
+
+# Incremental File Sync ----------------------------------------------------------------------------
+
+def files_identical(src, dst):
+    # Same size and mtime (previous sync), or same size and content.
+    if not os.path.isfile(dst) or os.path.islink(dst):
+        return False
+    src_stat = os.stat(src)
+    dst_stat = os.stat(dst)
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    return hash_file(src) == hash_file(dst)
+
+def sync_file(src, dst, link=None):
+    # Update dst from src only when it changed, returns True when dst was (re)written.
+    # link: None (copy), "hardlink" or "symlink" (read-only assets only: dst then shares src).
+    if link == "symlink":
+        target = os.path.realpath(src)
+        if os.path.islink(dst) and os.readlink(dst) == target:
+            return False
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.symlink(target, dst)
+        return True
+    if link == "hardlink":
+        if os.path.exists(dst) and not os.path.islink(dst) and os.path.samefile(src, dst):
+            return False
+        link_file(src, dst)
+        return True
+    if files_identical(src, dst) and not os.path.samefile(src, dst):
+        return False
+    # Never write through a previous symlink/hardlink to the catalog.
+    if os.path.lexists(dst):
+        os.remove(dst)
+    shutil.copy2(src, dst)
+    return True
+
+def sync_dir(src_path, dst_path, link=None, recursive=False, ignore=()):
+    # Sync files of src_path to dst_path (and sub-directories when recursive).
+    if not os.path.isdir(src_path):
+        return
+    os.makedirs(dst_path, exist_ok=True)
+    for file_name in os.listdir(src_path):
+        if file_name in ignore:
+            continue
+        full_file_path = os.path.join(src_path, file_name)
+        if os.path.isfile(full_file_path):
+            sync_file(full_file_path, os.path.join(dst_path, file_name), link=link)
+        elif recursive and os.path.isdir(full_file_path):
+            sync_dir(full_file_path, os.path.join(dst_path, file_name), link=link, recursive=True, ignore=ignore)
+
+# JSON Template Helpers ----------------------------------------------------------------------------
+
+def choices_min_max(choices):
+    # [min, max] of the choices, in O(1) for ranges (never materialized).
+    if isinstance(choices, range):
+        first, last = choices[0], choices[-1]
+        return [min(first, last), max(first, last)]
+    return [min(choices), max(choices)]
+
+def choices_range_spec(choices):
+    # {start, stop, step} of range choices (stop excluded, as Python ranges).
+    return {"start": choices.start, "stop": choices.stop, "step": choices.step}
+
+# Output Cache -------------------------------------------------------------------------------------
+
+# Content-addressed cache of generate_wrapper outputs (wrapper, synth/raptor.tcl, details.json),
+# keyed by IP, version, parameters, generator sources and migen/LiteX versions. Enabled by
+# IP_Builder.cache_dir or by the IP_CATALOG_CACHE environment variable.
+
+# Build parameters that do not change the generated files.
+CACHE_IGNORED_PARAMS = ["build", "build_dir", "json", "json_template"]
+
+# Installed packages generating the files.
+CACHE_PACKAGES = ["migen", "litex"]
+
+@functools.lru_cache(maxsize=None)
+def package_versions():
+    # Installed distribution versions (None when not installed as a distribution).
+    versions = {}
+    for package in CACHE_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+def cache_key(ip_name, version, params, gen_path, ignored_params=CACHE_IGNORED_PARAMS):
+    # Parameters: sorted, file parameters keyed by their content.
+    key_params = {}
+    for name, value in params.items():
+        if name in ignored_params:
+            continue
+        if isinstance(value, str) and value and os.path.isfile(value):
+            value = {"file_sha256": hash_file(value)}
+        key_params[name] = value
+
+    # Sources: generator, litex_wrapper, src RTL and this file (wrapper header).
+    sources = {"lib/common.py": hash_file(os.path.realpath(__file__))}
+    for sub_path, extensions in [("", ["_gen.py"]), ("litex_wrapper", [".py"]), ("src", [".v", ".sv"])]:
+        path = os.path.join(gen_path, sub_path)
+        if not os.path.isdir(path):
+            continue
+        for file_name in sorted(os.listdir(path)):
+            full_file_path = os.path.join(path, file_name)
+            if os.path.isfile(full_file_path) and any(file_name.endswith(e) for e in extensions):
+                sources[os.path.join(sub_path, file_name)] = hash_file(full_file_path)
+
+    key = {
+        "ip"       : ip_name,
+        "version"  : version,
+        "params"   : key_params,
+        "sources"  : sources,
+        "packages" : package_versions(),
+    }
+    key_json = json.dumps(key, sort_keys=True, default=str)
+    return hashlib.sha256(key_json.encode()).hexdigest(), key_json
+
+# Wrapper Library ----------------------------------------------------------------------------------
+
+# Wrappers pre-generated at build time for the common configurations of an IP (wrapper_library.py),
+# shipped in <ip>/<version>/library/. Entries are keyed as the output cache, without the build name:
+# library wrappers are built as LIBRARY_BUILD_NAME and renamed when served. Sources are part of the
+# key: a library older than the generator is never served.
+
+LIBRARY_BUILD_NAME     = "ip_library"
+LIBRARY_IGNORED_PARAMS = CACHE_IGNORED_PARAMS + ["build_name"]
+
+# IP Log -------------------------------------------------------------------------------------------
+
+# Generation log (generators and litex_wrapper modules logging.info). Nothing is done at import: the
+# IP_Builder installs the handler (once per process, on the root logger) and starts a log per build.
+# IP_Builder.log_mode (None: IP_CATALOG_LOG environment variable, "build" when unset):
+# - "build": <build_path>/IP.log, records buffered in memory until the build path is known (prepare),
+#   dropped when nothing is built (JSON template).
+# - "cwd":   ./IP.log (truncated by every generation).
+# - "off":   no log, the root logger level is left unchanged (INFO records dropped by the logger).
+
+LOG_FILENAME = "IP.log"
+LOG_FORMAT   = "%(levelname)s: %(message)s\n"
+LOG_MODES    = ["build", "cwd", "off"]
+
+class IP_LogHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self, logging.INFO)
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.active     = False
+        self.buffer     = []
+        self.stream     = None
+        self.root_level = logging.getLogger().level
+
+    def start(self):
+        self.close_log()
+        self.active = True
+        self.buffer = []
+        if logging.getLogger().getEffectiveLevel() > logging.INFO:
+            logging.getLogger().setLevel(logging.INFO)
+
+    def stop(self):
+        # No log: root logger level restored.
+        self.close_log()
+        logging.getLogger().setLevel(self.root_level)
+
+    def open_log(self, filename):
+        # Buffered records are written first.
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+            self.stream = open(filename, "w")
+            self.stream.writelines(self.buffer)
+            self.stream.flush()
+            self.buffer = []
+        finally:
+            self.release()
+
+    def close_log(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+            self.active = False
+            self.buffer = []
+            self.stream = None
+        finally:
+            self.release()
+
+    def emit(self, record):
+        if not self.active:
+            return
+        try:
+            msg = self.format(record) + "\n"
+            if self.stream is None:
+                self.buffer.append(msg)
+            else:
+                self.stream.write(msg)
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+_log_handler = None
+
+def ip_log_handler():
+    # Root logger handler, created on first use.
+    global _log_handler
+    if _log_handler is None:
+        _log_handler = IP_LogHandler()
+        logging.getLogger().addHandler(_log_handler)
+    return _log_handler
+
+# IP Result ----------------------------------------------------------------------------------------
+
+class IP_Result:
+    def __init__(self, ip_name, version, build_path=None, wrapper=None, summary=None, template=None, cache_hit=False, library_hit=False):
+        self.ip_name     = ip_name
+        self.version     = version
+        self.build_path  = build_path  # Build directory (None: nothing built).
+        self.wrapper     = wrapper     # Generated wrapper (.v/.sv).
+        self.summary     = summary     # IP summary (as in the JSON template).
+        self.template    = template    # JSON template (when requested).
+        self.cache_hit   = cache_hit   # Wrapper from the output cache.
+        self.library_hit = library_hit # Wrapper from the pre-generated wrapper library.
+
+    def __repr__(self):
+        return f"IP_Result(ip_name={self.ip_name!r}, version={self.version!r}, build_path={self.build_path!r})"
+
+# IP Profile ---------------------------------------------------------------------------------------
+
+def process_uptime():
+    # Wall time since the process start (Linux), None when unavailable.
+    try:
+        with open("/proc/self/stat", "r") as f:
+            start = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - start / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return None
+
+def peak_rss():
+    # Peak resident set size of the process (bytes).
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+class IP_Profile:
+    def __init__(self):
+        self.phases  = []
+        self.current = None
+
+    def add_phase(self, name, wall_time):
+        self.phases.append({"phase": name, "time": round(wall_time, 6), "peak_rss": peak_rss()})
+
+    def start_phase(self, name):
+        self.end_phase()
+        self.current = (name, time.perf_counter())
+
+    def end_phase(self):
+        if self.current is not None:
+            name, start  = self.current
+            self.current = None
+            self.add_phase(name, time.perf_counter() - start)
+
+    def to_dict(self, **kwargs):
+        self.end_phase()
+        return {
+            **kwargs,
+            "time"     : round(sum(p["time"] for p in self.phases), 6),
+            "peak_rss" : max([p["peak_rss"] for p in self.phases], default=peak_rss()),
+            "phases"   : self.phases,
+        }
 
 # IP Catalog Builder -------------------------------------------------------------------------------
 
 class IP_Builder:
+    # Directory in which the private LiteX scratch build directories are created (None: system
+    # temporary directory).
+    scratch_dir = None
+
+    # Output cache directory (None: IP_CATALOG_CACHE environment variable, disabled when unset).
+    cache_dir = None
+
+    # Wrapper library root, entries in <library_dir>/<ip>/<version> (None: IP_CATALOG_LIBRARY environment
+    # variable, when unset <gen_path>/library; "": disabled). With library_store, wrappers built live
+    # are stored in the library (library build).
+    library_dir   = None
+    library_store = False
+
+    # Read-only assets (generator, litex_wrapper, docs images) are copied (None) or linked from the
+    # catalog ("hardlink"/"symlink"). RTL and sim files, which generators may edit, are always copied.
+    asset_link = None
+
+    # Per-phase wall time/peak RSS written to profile.json (next to details.json) when enabled (None:
+    # IP_CATALOG_PROFILE environment variable, disabled when unset).
+    profile = None
+
+    # Generator import time when imported in-process (None: time since the process start).
+    import_time = None
+
+    # Generation log mode: "build", "cwd" or "off" (None: IP_CATALOG_LOG environment variable, "build"
+    # when unset).
+    log_mode = None
+
     def __init__(self, device, ip_name, language):
         self.device   = device
         self.ip_name  = ip_name
         self.language = language
         self.prepared = False
         self.image_name = None
+        self.gen_path   = None
+        self.cache_hit  = False
+        self.cache_entry = None
+        self.build_path = None
+        self.wrapper    = None
+        self.template   = None
+        self.summary    = None
+        self.library_hit     = False
+        self.library_wrapper = None
+        self.start_log()
+
+        # Phase profile: the generator import (and parser) phase ends here.
+        self.profiler = None
+        profile       = self.profile if self.profile is not None else os.environ.get("IP_CATALOG_PROFILE")
+        if profile:
+            self.profiler = IP_Profile()
+            import_time   = self.import_time if self.import_time is not None else process_uptime()
+            if import_time is not None:
+                self.profiler.add_phase("import", import_time)
+            self.start_phase("arguments")
+
+    def result(self, version, summary=None):
+        # Result of a generator run (Python API).
+        self.write_profile(version)
+        self.end_log()
+        return IP_Result(
+            ip_name    = self.ip_name,
+            version    = version,
+            build_path = self.build_path,
+            wrapper    = self.wrapper,
+            summary    = summary if summary is not None else self.summary,
+            template   = self.template,
+            cache_hit  = self.cache_hit,
+            library_hit = self.library_hit,
+        )
+
+    # Phase Profile --------------------------------------------------------------------------------
+
+    def start_phase(self, name):
+        if self.profiler is not None:
+            self.profiler.start_phase(name)
+
+    def end_phase(self):
+        if self.profiler is not None:
+            self.profiler.end_phase()
+
+    def write_profile(self, version):
+        if self.profiler is None or self.build_path is None:
+            return
+        profile = self.profiler.to_dict(
+            ip_name    = self.ip_name,
+            version    = version,
+            build_name = os.path.basename(self.build_path),
+            cache_hit  = self.cache_hit,
+            library_hit = self.library_hit,
+        )
+        os.makedirs(self.build_path, exist_ok=True)
+        write_file(os.path.join(self.build_path, "profile.json"), json.dumps(profile, indent=4))
+
+    # Generation Log -------------------------------------------------------------------------------
+
+    def start_log(self):
+        # New log (previous generation log closed), "Log started" record first.
+        mode = self.log_mode if self.log_mode is not None else os.environ.get("IP_CATALOG_LOG", "build")
+        self.log_mode = mode or "off"
+        assert self.log_mode in LOG_MODES, f"Unknown log mode {self.log_mode}"
+        if self.log_mode == "off":
+            if _log_handler is not None:
+                _log_handler.stop()
+            return
+        handler = ip_log_handler()
+        handler.start()
+        if self.log_mode == "cwd":
+            handler.open_log(LOG_FILENAME)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logging.info(f"Log started at {timestamp}")
+
+    def open_log(self):
+        # Per-build log, once the build path is known.
+        if self.log_mode == "build" and _log_handler is not None and _log_handler.active:
+            os.makedirs(self.build_path, exist_ok=True)
+            _log_handler.open_log(os.path.join(self.build_path, LOG_FILENAME))
+
+    def end_log(self):
+        if self.log_mode != "off" and _log_handler is not None:
+            _log_handler.close_log()
+
+    # Wrapper Post-Processing ----------------------------------------------------------------------
+
     @staticmethod
-    def add_wrapper_text(filename, text, line):
-        # Read Verilog content and add text.
-        f = open(filename, "r")
-        content = f.readlines()
-        content.insert(line, text)
-        f.close()
+    def stream_edit(src_filename, dst_filename, defines=(), insert=None, replace=(), prepend=()):
+        # Single streaming pass from src to dst (atomic write, dst can be src):
+        # - defines: `define lines added at the top (identical existing lines are dropped).
+        # - insert:  (line, text), text inserted before this line (at the end for shorter files).
+        # - replace: (match, text) pairs, the first line containing match is replaced by text.
+        # - prepend: (match, text) pairs, text inserted before the first line containing match.
+        define_lines = {f"`define {define}" for define in defines}
+        replace      = list(replace)
+        prepend      = list(prepend)
+        with open(src_filename, "r") as src, atomic_open(dst_filename) as dst:
+            for define in defines:
+                dst.write(f"`define {define}\n")
+            n = -1
+            for n, line in enumerate(src):
+                if insert is not None and n == insert[0]:
+                    dst.write(insert[1])
+                if line.strip() in define_lines:
+                    continue
+                for edit in [edit for edit in prepend if edit[0] in line]:
+                    dst.write(edit[1])
+                    prepend.remove(edit)
+                for i, (match, text) in enumerate(replace):
+                    if match in line:
+                        line = text
+                        del replace[i]
+                        break
+                dst.write(line)
+            if insert is not None and n < insert[0]:
+                dst.write(insert[1])
 
-        #  Write Verilog content.
-        f = open(filename, "w")
-        f.write("".join(content))
-        f.close()
+    @staticmethod
+    def add_wrapper_text(filename, text, line):
+        IP_Builder.stream_edit(filename, filename, insert=(line, text))
 
-    def add_wrapper_header(self, filename):
+    @staticmethod
+    def wrapper_header():
         header = []
         header.append("// This file is Copyright (c) 2022 RapidSilicon")
         header.append(f"//{'-'*80}")
         header.append("")
-        header = "\n".join(header)
-        self.add_wrapper_text(filename, header, 13)
-
+        return "\n".join(header)
 
-    # JSON template for GUI parsing
-    def export_json_template(self, parser, dep_dict, summary):
-
-        # Get "core_fix_param_group" group.
-        core_fix_param_group = None
-        for group in parser._action_groups:
-            if "core fix" in group.title.lower():
-                core_fix_param_group = group
-                break
-
-        # Get "core_range_param_group" group.
-        core_range_param_group = None
-        for group in parser._action_groups:
-            if "core range" in group.title.lower():
-                core_range_param_group = group
-                break
-
-        # Get "core_bool_param_group" group.
-        core_bool_param_group = None
-        for group in parser._action_groups:
-            if "core bool" in group.title.lower():
-                core_bool_param_group = group
-                break
+    def add_wrapper_header(self, filename):
+        self.add_wrapper_text(filename, self.wrapper_header(), 13)
 
-        # Get "core_str_param_group" group.
-        core_str_param_group = None
-        for group in parser._action_groups:
-            if "core string" in group.title.lower():
-                core_str_param_group = group
-                break
+    @staticmethod
+    def ip_id():
+        # IP_ID parameter: build date/time, year-2022 (7-bits), day (5-bits), month (4-bits),
+        # hour (12 hours format, 4-bits), minute (6-bits), second (6-bits).
+        now   = datetime.now()
+        ip_id = (now.year - 2022)
+        ip_id = (ip_id << 5) | now.day
+        ip_id = (ip_id << 4) | now.month
+        ip_id = (ip_id << 4) | (now.hour % 12)
+        ip_id = (ip_id << 6) | now.minute
+        ip_id = (ip_id << 6) | now.second
+        return f"32'h{ip_id:x}"
+
+    def ip_parameters(self, ip_type, ip_version):
+        # Wrapper module declaration with the IP_TYPE/IP_VERSION/IP_ID parameters (ip_version:
+        # Base_Major_Minor binary string).
+        ip_version = f"32'h{int(ip_version, 2):x}"
+        return "module {} #(\n\tparameter IP_TYPE \t\t= \"{}\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(
+            self.build_name, ip_type, ip_version, self.ip_id())
 
-        # Get "core_str_param_group" group.
-        core_file_path_group = None
+    # JSON template for GUI parsing
+    def json_template(self, parser, dep_dict, summary, args=None):
+
+        # Core parameter groups, by title: one pass over the group actions.
+        core_param_types = {
+            "core fix"    : "fix",
+            "core range"  : "range",
+            "core bool"   : "bool",
+            "core string" : "str",
+            "core file"   : "file",
+        }
+        core_actions = {}
+        core_titles  = set()
         for group in parser._action_groups:
-            if "core file" in group.title.lower():
-                core_file_path_group = group
-                break
-
-        # Create vars dict of arguments.
-        _args = parser.parse_args()
-        _vars = vars(_args)
+            for title, param_type in core_param_types.items():
+                if title in group.title.lower() and title not in core_titles:
+                    core_titles.add(title)
+                    for core_action in group._group_actions:
+                        core_actions.setdefault(id(core_action), param_type)
+                    break
 
         # Post Processing of Json
-        # Add choices/description to Core arguments.
+        # Add choices/description to Core arguments (one pass over the parser arguments, in order;
+        # arguments removed from parser._actions are not exported).
 
         param_json = {}
-        param_list = []
         core_param_list = []
         build_param_list = []
-        for name, var in _vars.items():
-            if core_fix_param_group is not None:
-                for core_action in core_fix_param_group._group_actions:
-                    if name == core_action.dest:
-                        core_param_list.append(
-                        {   "parameter"     : str(name),
-                            "title"         : str(name.upper()),
-                            "options"       : list(core_action.choices),
-                            "default"       : str(core_action.default),
-                            "type"          : str("int"),
-                            "description"   : str(core_action.help),
-                            "disable"       : str("False"),
-                        })
-
-            if core_bool_param_group is not None:
-                for core_action in core_bool_param_group._group_actions:
-                    if name == core_action.dest:
-                        core_param_list.append(
-                        {   "parameter"     : str(name),
-                            "title"         : str(name.upper()),
-                            "default"       : str(core_action.default),
-                            "type"          : str("bool"),
-                            "description"   : str(core_action.help),
-                            "disable"       : str("False"),
-                        })
-            if core_range_param_group is not None:
-                for core_action in core_range_param_group._group_actions:
-                    if name == core_action.dest:
-                        temp_list = list(core_action.choices)
-                        core_param_list.append(
-                        {   "parameter"     : str(name),
-                            "title"         : str(name.upper()),
-                            "range"         : [min(temp_list),max(temp_list)],
-                            "type"          : str("int"),
-                            "default"       : str(core_action.default),
-                            "description"   : str(core_action.help),
-                            "disable"       : str("False"),
-                        })
-            if core_str_param_group is not None:
-                for core_action in core_str_param_group._group_actions:
-                    if name == core_action.dest:
-                        core_param_list.append(
-                        {   "parameter"     : str(name),
-                            "title"         : str(name.upper()),
-                            "options"       : list(core_action.choices),
-                            "default"       : str(core_action.default),
-                            "type"          : str("str"),
-                            "description"   : str(core_action.help),
-                            "disable"       : str("False"),
-                        })
-
-            if core_file_path_group is not None:
-                for core_action in core_file_path_group._group_actions:
-                    if name == core_action.dest:
-                        core_param_list.append(
-                        {   "parameter"     : str(name),
-                            "title"         : str(name.upper()),
-                            "default"       : str(core_action.default),
-                            "type"          : str("str"),
-                            "description"   : str(core_action.help),
-                            "disable"       : str("False"),
-                        })
-
-            if name.startswith("build"):
-                build_param_list.append({name :  str(_vars[name])})
-
-            if name.startswith("json"):
-                build_param_list.append({name : str(_vars[name])})
-
- 
-        dep_list= list(dep_dict.keys())
+        names = set()
+        for action in parser._actions:
+            name = action.dest
+            if action.default == argparse.SUPPRESS or name in names:
+                continue
+            names.add(name)
+
+            param_type = core_actions.get(id(action))
+            if param_type == "fix":
+                core_param_list.append(
+                {   "parameter"     : str(name),
+                    "title"         : str(name.upper()),
+                    "options"       : list(action.choices),
+                    "default"       : str(action.default),
+                    "type"          : str("int"),
+                    "description"   : str(action.help),
+                    "disable"       : str("False"),
+                })
+            elif param_type == "bool":
+                core_param_list.append(
+                {   "parameter"     : str(name),
+                    "title"         : str(name.upper()),
+                    "default"       : str(action.default),
+                    "type"          : str("bool"),
+                    "description"   : str(action.help),
+                    "disable"       : str("False"),
+                })
+            elif param_type == "range":
+                core_param_list.append(
+                {   "parameter"     : str(name),
+                    "title"         : str(name.upper()),
+                    "range"         : choices_min_max(action.choices),
+                    "type"          : str("int"),
+                    "default"       : str(action.default),
+                    "description"   : str(action.help),
+                    "disable"       : str("False"),
+                })
+                if isinstance(action.choices, range):
+                    core_param_list[-1]["range_spec"] = choices_range_spec(action.choices)
+            elif param_type == "str":
+                core_param_list.append(
+                {   "parameter"     : str(name),
+                    "title"         : str(name.upper()),
+                    "options"       : list(action.choices),
+                    "default"       : str(action.default),
+                    "type"          : str("str"),
+                    "description"   : str(action.help),
+                    "disable"       : str("False"),
+                })
+            elif param_type == "file":
+                core_param_list.append(
+                {   "parameter"     : str(name),
+                    "title"         : str(name.upper()),
+                    "default"       : str(action.default),
+                    "type"          : str("str"),
+                    "description"   : str(action.help),
+                    "disable"       : str("False"),
+                })
+
+            if name.startswith("build") or name.startswith("json"):
+                value = getattr(args, name, action.default) if args is not None else action.default
+                build_param_list.append({name : str(value)})
+
         param_temp = {"parameters": core_param_list}
         param_json.update(param_temp)
 
 
     # Append dependencies for dependant paramters
 
-        for i in range(len(core_param_list)):
-            if param_json["parameters"][i]['parameter'] in dep_list:
-                param_json["parameters"][i].update(disable = dep_dict[param_json["parameters"][i]['parameter']])
+        for param in core_param_list:
+            if param['parameter'] in dep_dict:
+                param.update(disable = dep_dict[param['parameter']])
 
 
     #Append summary in JSON
@@ -178,18 +644,38 @@ class IP_Builder:
 
 
     # Append Build and Json params to final json
-        for i in range(len(build_param_list)):
-            param_json.update(build_param_list[i])
+        for build_param in build_param_list:
+            param_json.update(build_param)
 
-        # Dump vars to JSON.
-        print(json.dumps(param_json, indent=4, default=None))
+        return param_json
 
+    def export_json_template(self, parser, dep_dict, summary, args=None):
+        self.start_phase("json_template")
+        self.template = self.json_template(parser=parser, dep_dict=dep_dict, summary=summary, args=args)
+        self.summary  = summary
 
-    def import_args_from_json(self, parser, json_filename):
-        with open(json_filename, "rt") as f:
-            t_args = argparse.Namespace()
-            t_args.__dict__.update(json.load(f))
-            args = parser.parse_args(namespace=t_args)
+        # Dump vars to JSON.
+        print(json.dumps(self.template, indent=4, default=None))
+        self.end_phase()
+
+    def import_args_from_dict(self, parser, params, argv=None):
+        # Parameters from a dict (same content as the --json file), command line arguments (argv,
+        # None: sys.argv) override them.
+        t_args = argparse.Namespace()
+        t_args.__dict__.update(params)
+        args = parser.parse_args(argv, namespace=t_args)
+        return args
+
+    def import_args_from_json(self, parser, json_filename, params=None, argv=None):
+        # Parameters from the JSON file and/or from the params dict (which overrides the file).
+        json_params = {}
+        if json_filename:
+            with open(json_filename, "rt") as f:
+                json_params.update(json.load(f))
+        if params is not None:
+            json_params.update(params)
+        args = self.import_args_from_dict(parser=parser, params=json_params, argv=argv)
+        self.start_phase("dependencies")
         return args
     
     def import_ip_details_json(self, build_dir,details, build_name, version ):
@@ -197,11 +683,12 @@ class IP_Builder:
         self.build_path         = os.path.join(build_dir, "rapidsilicon", "ip", self.ip_name, version, build_name)
         new_json_filename       = os.path.join(self.build_path, "details.json")
         os.makedirs(self.build_path,         exist_ok=True)
-        with open(new_json_filename, "w") as f:
-            json.dump(details, f, indent=4, default=None,)
+        write_file(new_json_filename, json.dumps(details, indent=4, default=None))
 
 
     def prepare(self, build_dir, build_name, version):
+        self.end_phase()
+
         # Remove build_name extension when specified.
         build_name = os.path.splitext(build_name)[0]
 
@@ -221,44 +708,29 @@ class IP_Builder:
         os.makedirs(self.synth_path,         exist_ok=True)
 
         self.prepared = True
+        self.open_log()
 
     def copy_files(self, gen_path):
         assert self.prepared
+        self.start_phase("copy_files")
+        self.gen_path = os.path.realpath(gen_path)
 
         # Copy Generator file.
         generator_filename = os.path.join(gen_path, f"{self.ip_name}_gen.py")
-        shutil.copy(generator_filename, self.build_path)
+        sync_file(generator_filename, os.path.join(self.build_path, os.path.basename(generator_filename)), link=self.asset_link)
 
         # Copy RTL files.
         rtl_path  = os.path.join(gen_path, "src")
-        if os.path.exists(rtl_path):
-            rtl_files = os.listdir(rtl_path)
-            for file_name in rtl_files:
-                full_file_path = os.path.join(rtl_path, file_name)
-                if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.src_path)
+        sync_dir(rtl_path, self.src_path)
 
         # Copy litex_wrapper file.
         litex_path  = os.path.join(gen_path, "litex_wrapper")
-        if os.path.exists(litex_path):
-            litex_files = os.listdir(litex_path)
-            for file_name in litex_files:
-                full_file_path = os.path.join(litex_path, file_name)
-                if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.litex_wrapper_path)
-        
-        # Copy sim files.
-        simulate_path  = os.path.join(gen_path, "sim")
-        if os.path.exists(simulate_path):
-            simulate_files = os.listdir(simulate_path)
-            for file_name in simulate_files:
-                full_file_path = os.path.join(simulate_path, file_name)
-                if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.sim_path)
-                elif os.path.isdir(full_file_path):
-                    shutil.copytree(simulate_path, self.sim_path, ignore=shutil.ignore_patterns('rapidsilicon'), dirs_exist_ok=True)
-
+        sync_dir(litex_path, self.litex_wrapper_path, link=self.asset_link)
 
+        # Copy sim files (and sub-directories).
+        simulate_path  = os.path.join(gen_path, "sim")
+        sync_dir(simulate_path, self.sim_path, recursive=True, ignore=["rapidsilicon", "__pycache__"])
+        self.end_phase()
 
     def copy_images(self, img_path):
         self.img_final_path          = os.path.join(self.build_path, "docs")
@@ -270,7 +742,7 @@ class IP_Builder:
                 if file_name.endswith(".png"):
                     full_file_path = os.path.join(img_src_path, file_name)
                     if os.path.isfile(full_file_path):
-                        shutil.copy(full_file_path, self.img_final_path)
+                        sync_file(full_file_path, os.path.join(self.img_final_path, file_name), link=self.asset_link)
                 
 #        print("doc_path", full_file_path, "-----------------", self.img_final_path)
     
@@ -287,7 +759,7 @@ class IP_Builder:
                     full_file_path = os.path.join(img_src_path, file_name)
                     new_dst = os.path.join(self.img_final_path, "io_config.png")
                     if os.path.isfile(full_file_path):
-                        shutil.copy(full_file_path, new_dst)
+                        sync_file(full_file_path, new_dst, link=self.asset_link)
                 
 #        print("doc_path", full_file_path, "-----------------", self.img_final_path)
     
@@ -299,6 +771,10 @@ class IP_Builder:
 
     def generate_tcl(self,version):
         assert self.prepared
+        # Output cache hit: raptor.tcl linked from the cache entry (generate_wrapper).
+        if self.cache_hit:
+            return
+        self.start_phase("generate_tcl")
 
         # Build .tcl file.
         # ----------------
@@ -341,35 +817,143 @@ class IP_Builder:
         # Generate .tcl file.
         # -------------------
         tcl_filename = os.path.join(self.synth_path, "raptor.tcl")
-        f = open(tcl_filename, "w")
-        f.write("\n".join(tcl))
-        f.close()
+        write_file(tcl_filename, "\n".join(tcl))
+        self.end_phase()
 
-    def generate_wrapper(self, platform, module, version):
+    def generate_wrapper(self, platform, module, version, params=None, ip_type=None,
+        ip_version="00000000_00000000_0000000000000001", defines=(), replace=(), prepend=()):
+        # replace/prepend: generator (match, text) edits of the wrapper (see stream_edit), applied in the
+        # post-processing pass.
         assert self.prepared
-        build_path     = "litex_build"
-        new_name =  self.build_name + "_" + version
-        build_filename = os.path.join(build_path, new_name) + ".v"
-
-        # Build LiteX module.
-        platform.build(module,
-            build_dir    = build_path,
-            build_name   = new_name,
-            run          = False,
-            regular_comb = False
-        )
-
-        # Insert header.
-        self.add_wrapper_header(build_filename)
-
-        # Copy file to destination.
-        shutil.copy(build_filename, self.src_path)
-        
-        # Changing File Extension from .v to .sv
-        if (self.language == "sverilog"):
-            old_wrapper = os.path.join(self.src_path, f'{new_name}.v')
-            new_wrapper = old_wrapper.replace('.v','.sv')
-            os.rename(old_wrapper, new_wrapper)
-
-        # Remove build files.
-        shutil.rmtree(build_path)
+        new_name = self.build_name + "_" + version
+        self.wrapper = os.path.join(self.src_path, new_name + (".sv" if self.language == "sverilog" else ".v"))
+
+        # Output cache lookup (unless done before elaboration): reuse a previous LiteX build of the same
+        # IP/parameters/sources.
+        if not self.library_hit and self.cache_entry is None and self.gen_path is not None:
+            self.cache_lookup(self.gen_path, version, params)
+        cache_path  = self.cache_entry
+        build_path  = None
+        module_name = self.build_name
+        try:
+            if self.library_hit:
+                # Pre-generated wrapper (library_lookup), built as LIBRARY_BUILD_NAME.
+                build_filename = self.library_wrapper
+                module_name    = LIBRARY_BUILD_NAME
+                self.start_phase("library")
+            elif self.cache_hit:
+                build_filename = os.path.join(cache_path, "wrapper.v")
+                self.start_phase("cache")
+                self.cache_materialize(cache_path)
+            else:
+                # Private scratch directory: concurrent builds must not share (and remove) the same one.
+                build_path     = tempfile.mkdtemp(prefix="litex_build_", dir=self.scratch_dir)
+                build_filename = os.path.join(build_path, new_name) + ".v"
+
+                # Build LiteX module.
+                self.start_phase("platform_build")
+                platform.build(module,
+                    build_dir    = build_path,
+                    build_name   = new_name,
+                    run          = False,
+                    regular_comb = False
+                )
+                if cache_path is not None:
+                    self.cache_store(cache_path, build_filename, self.cache_key_json)
+                if self.library_store and self.library_wrapper is not None:
+                    assert self.build_name == LIBRARY_BUILD_NAME
+                    self.cache_store(os.path.dirname(self.library_wrapper), build_filename, self.library_key_json, wrapper_only=True)
+
+            # Post-processing (header, IP parameters, defines, .v/.sv) in one pass to destination.
+            self.start_phase("post_processing")
+            edits = []
+            if ip_type is not None:
+                edits.append((f"module {module_name}", self.ip_parameters(ip_type, ip_version)))
+            elif self.library_hit:
+                edits.append((f"module {module_name}", f"module {new_name} (\n"))
+            if self.library_hit:
+                # LiteX header of a live build.
+                edits.append(("// Filename", f"// Filename   : {new_name}.v\n"))
+            self.stream_edit(build_filename, self.wrapper,
+                defines = defines,
+                insert  = (13, self.wrapper_header()),
+                replace = edits + list(replace),
+                prepend = prepend
+            )
+            self.end_phase()
+        finally:
+            # Remove build files.
+            if build_path is not None:
+                shutil.rmtree(build_path)
+
+    # Output Cache ---------------------------------------------------------------------------------
+
+    def cache_lookup(self, gen_path, version, params):
+        # Looks up the cache entry of these parameters, can be called before elaboration: on a hit
+        # generate_wrapper materializes it (no platform/module needed) and generate_tcl is skipped.
+        # Returns the hit status.
+        self.gen_path    = os.path.realpath(gen_path)
+        self.cache_entry = self.cache_path(version, params)
+        self.cache_hit   = self.cache_entry is not None and os.path.exists(os.path.join(self.cache_entry, "wrapper.v"))
+        return self.cache_hit
+
+    def cache_path(self, version, params):
+        # Returns the cache entry directory of this build (None when the cache is disabled).
+        cache_dir = self.cache_dir or os.environ.get("IP_CATALOG_CACHE")
+        if not cache_dir or params is None or self.gen_path is None:
+            return None
+        key, self.cache_key_json = cache_key(self.ip_name, version, params, self.gen_path)
+        return os.path.join(cache_dir, key[:2], key)
+
+    def cache_files(self, cache_path, wrapper_filename=None):
+        # (build file, cache file) pairs stored in a cache entry. The wrapper is the LiteX output,
+        # before post-processing (IP_ID is a timestamp).
+        files = [
+            (os.path.join(self.synth_path, "raptor.tcl"),      os.path.join(cache_path, "raptor.tcl")),
+            (os.path.join(self.build_path, "details.json"),    os.path.join(cache_path, "details.json")),
+        ]
+        if wrapper_filename is not None:
+            files.append((wrapper_filename, os.path.join(cache_path, "wrapper.v")))
+        return files
+
+    def cache_materialize(self, cache_path):
+        for build_file, cache_file in self.cache_files(cache_path):
+            if os.path.exists(cache_file):
+                link_file(cache_file, build_file)
+
+    def cache_store(self, cache_path, wrapper_filename, key_json, wrapper_only=False):
+        # Fill a temporary entry then rename it: concurrent builds of the same key are safe, the
+        # first one wins.
+        if os.path.exists(cache_path):
+            return
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix=".tmp_", dir=os.path.dirname(cache_path))
+        try:
+            for build_file, cache_file in self.cache_files(tmp_path, wrapper_filename):
+                if wrapper_only and build_file != wrapper_filename:
+                    continue
+                if os.path.exists(build_file):
+                    clone_file(build_file, cache_file)
+            with open(os.path.join(tmp_path, "key.json"), "w") as f:
+                f.write(key_json)
+            os.rename(tmp_path, cache_path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    # Wrapper Library ------------------------------------------------------------------------------
+
+    def library_lookup(self, gen_path, version, params):
+        # Looks up the pre-generated wrapper of these parameters, before elaboration: on a hit
+        # generate_wrapper serves it (no platform/module needed). Returns the hit status.
+        library_dir = self.library_dir if self.library_dir is not None else os.environ.get("IP_CATALOG_LIBRARY")
+        if library_dir is None:
+            library_dir = os.path.join(gen_path, "library")
+        elif library_dir:
+            library_dir = os.path.join(library_dir, self.ip_name, version)
+        else:
+            return False
+        key, self.library_key_json = cache_key(self.ip_name, version, params, os.path.realpath(gen_path),
+            ignored_params=LIBRARY_IGNORED_PARAMS)
+        self.library_wrapper = os.path.join(library_dir, key[:2], key, "wrapper.v")
+        self.library_hit     = os.path.exists(self.library_wrapper)
+        return self.library_hit
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+
+# Wrapper library builder: pre-generates the wrappers of the common configurations of an IP, listed
+# in <ip>/<version>/library.json, into its wrapper library (<ip>/<version>/library/ by default). The
+# generators serve a matching build from the library (IP_Builder.library_lookup), without elaboration,
+# and fall back to live generation otherwise.
+#
+# Configurations (JSON), every combination of the "matrix" values merged over "params":
+#   {"configurations": [
+#       {"params": {"builtin_fifo": true}, "matrix": {"data_width": [8, 16], "synchronous": [true, false]}}
+#   ]}
+#
+# Library index (<library>/index.json):
+#   {"format": 1, "ip": "fifo_generator", "version": "v1_0", "entries": {"<key>": {<parameters>}}}
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import itertools
+import tempfile
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from catalog import IP_PATH, find_generators, resolve_generator, run_generator, GeneratorError
+
+LIBRARY_FORMAT = 1
+
+# Configurations -----------------------------------------------------------------------------------
+
+def library_configurations(filename):
+    with open(filename, "r") as f:
+        library = json.load(f)
+    configurations = []
+    for entry in library.get("configurations", []):
+        matrix = entry.get("matrix", {})
+        for values in itertools.product(*matrix.values()):
+            configurations.append({**entry.get("params", {}), **dict(zip(matrix, values))})
+    return configurations
+
+def library_path(ip_name, version, gen_filename, library_dir=None):
+    if library_dir is None:
+        library_dir = os.environ.get("IP_CATALOG_LIBRARY")
+    if library_dir:
+        return os.path.join(library_dir, ip_name, version)
+    return os.path.join(os.path.dirname(gen_filename), "library")
+
+# Worker -------------------------------------------------------------------------------------------
+
+def build_entry(ip_name, version, params, library_dir=None, ip_path=IP_PATH):
+    import common
+
+    # Live build, as LIBRARY_BUILD_NAME, in a private scratch directory: generate_wrapper stores the
+    # LiteX wrapper in the library (configurations already in the library are served from it).
+    scratch = tempfile.mkdtemp(prefix="ip_library_")
+    cwd     = os.getcwd()
+    common.IP_Builder.scratch_dir   = scratch
+    common.IP_Builder.library_dir   = library_dir
+    common.IP_Builder.library_store = True
+
+    argv   = ["--build", "--build-dir", scratch, "--build-name", common.LIBRARY_BUILD_NAME]
+    result = {"params": params}
+    start  = time.perf_counter()
+    try:
+        os.chdir(scratch)
+        run_generator(ip_name, version, argv, ip_path, params=params)
+        result["status"] = "passed"
+    except GeneratorError as e:
+        result["status"] = "failed"
+        result["error"]  = str(e)
+    finally:
+        os.chdir(cwd)
+        common.IP_Builder.scratch_dir   = None
+        common.IP_Builder.library_dir   = None
+        common.IP_Builder.library_store = False
+        shutil.rmtree(scratch, ignore_errors=True)
+    result["time"] = round(time.perf_counter() - start, 3)
+    return result
+
+# Library ------------------------------------------------------------------------------------------
+
+def write_index(path, ip_name, version):
+    # Index of the library entries (parameters of every key, from the entries key.json).
+    entries = {}
+    for prefix in sorted(os.listdir(path)):
+        prefix_path = os.path.join(path, prefix)
+        if not os.path.isdir(prefix_path):
+            continue
+        for key in sorted(os.listdir(prefix_path)):
+            key_filename = os.path.join(prefix_path, key, "key.json")
+            if os.path.exists(key_filename):
+                with open(key_filename, "r") as f:
+                    entries[key] = json.load(f)["params"]
+    index = {"format": LIBRARY_FORMAT, "ip": ip_name, "version": version, "entries": entries}
+    with open(os.path.join(path, "index.json"), "w") as f:
+        json.dump(index, f, indent=4)
+    return index
+
+def build_library(ip_name, version, ip_path=IP_PATH, library_dir=None, max_workers=None, clean=False):
+    ip_name, version, gen_filename = resolve_generator(ip_name, version, ip_path)
+    configurations_filename = os.path.join(os.path.dirname(gen_filename), "library.json")
+    path = library_path(ip_name, version, gen_filename, library_dir)
+    if clean:
+        shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+    configurations = library_configurations(configurations_filename)
+    results        = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(build_entry, ip_name, version, params, library_dir, ip_path) for params in configurations]
+        for future in futures:
+            results.append(future.result())
+    index = write_index(path, ip_name, version)
+    return {
+        "ip"      : ip_name,
+        "version" : version,
+        "path"    : path,
+        "entries" : len(index["entries"]),
+        "failed"  : [r for r in results if r["status"] == "failed"],
+    }
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog wrapper library builder.")
+    parser.add_argument("ips",          nargs="*",                         help="IPs (ip or ip/version) to build (default: every IP with a library.json).")
+    parser.add_argument("--output-dir", default=None,                      help="Library root, entries in <output-dir>/<ip>/<version> (default: <ip>/<version>/library).")
+    parser.add_argument("--jobs", "-j", default=None, type=int,            help="Number of parallel workers (default: CPU count).")
+    parser.add_argument("--clean",      action="store_true",               help="Remove the existing library entries first.")
+    parser.add_argument("--ip-path",    default=IP_PATH,                   help="IP Catalog directory.")
+    args = parser.parse_args()
+
+    ip_path = os.path.realpath(args.ip_path)
+    ips     = [tuple(ip.split("/", 1)) if "/" in ip else (ip, None) for ip in args.ips]
+    if not ips:
+        ips = [(ip_name, version) for (ip_name, version), gen_filename in sorted(find_generators(ip_path).items())
+            if os.path.exists(os.path.join(os.path.dirname(gen_filename), "library.json"))]
+
+    failed = False
+    for ip_name, version in ips:
+        report = build_library(ip_name, version, ip_path,
+            library_dir = args.output_dir and os.path.realpath(args.output_dir),
+            max_workers = args.jobs,
+            clean       = args.clean)
+        print(f"{report['ip']} {report['version']}: {report['entries']} entries in {report['path']}", file=sys.stderr)
+        for result in report["failed"]:
+            print(f"  Unable to build {json.dumps(result['params'])}: {result['error']}", file=sys.stderr)
+        failed = failed or bool(report["failed"])
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()